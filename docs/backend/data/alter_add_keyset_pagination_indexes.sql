@@ -0,0 +1,20 @@
+-- Indexes backing keyset pagination (ORDER BY created_at DESC, id DESC)
+-- Safe to run multiple times
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Job_Cards_created_at_id')
+BEGIN
+    CREATE INDEX IX_Job_Cards_created_at_id ON Job_Cards (created_at DESC, id DESC);
+END
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Job_Cards_customer_created_at_id')
+BEGIN
+    CREATE INDEX IX_Job_Cards_customer_created_at_id ON Job_Cards (customer_id, created_at DESC, id DESC);
+END
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Estimates_created_at_id')
+BEGIN
+    CREATE INDEX IX_Estimates_created_at_id ON Estimates (created_at DESC, id DESC);
+END
+GO
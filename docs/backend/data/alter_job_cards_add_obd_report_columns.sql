@@ -0,0 +1,16 @@
+-- Add OBD report fields written by the intake flow (deferred column group "obd")
+-- Safe to run multiple times
+
+IF COL_LENGTH('Job_Cards', 'obd_report_text') IS NULL
+BEGIN
+    ALTER TABLE Job_Cards
+    ADD obd_report_text NVARCHAR(MAX) NULL;
+END
+GO
+
+IF COL_LENGTH('Job_Cards', 'obd_report_summary') IS NULL
+BEGIN
+    ALTER TABLE Job_Cards
+    ADD obd_report_summary NVARCHAR(MAX) NULL;
+END
+GO
@@ -1,9 +1,11 @@
-"""Shared Azure OpenAI Responses client factory."""
-from __future__ import annotations
+"""Shared Azure OpenAI Responses client factory.
 
-from typing import Optional
+agent_framework is imported when the client is first created, not with this
+module, so only processes that actually run an agent pay for loading it.
+"""
+from __future__ import annotations
 
-from agent_framework.azure import AzureOpenAIResponsesClient
+from typing import TYPE_CHECKING, Optional
 
 from app.config.settings import (
     get_openai_api_key,
@@ -12,17 +14,27 @@ from app.config.settings import (
     get_openai_responses_deployment_name,
 )
 
+if TYPE_CHECKING:
+    from agent_framework.azure import AzureOpenAIResponsesClient
+
 _client: Optional[AzureOpenAIResponsesClient] = None
 
+
+def _create_client() -> AzureOpenAIResponsesClient:
+    from agent_framework.azure import AzureOpenAIResponsesClient
+
+    return AzureOpenAIResponsesClient(
+        endpoint=get_openai_endpoint(),
+        deployment_name=get_openai_responses_deployment_name(),
+        api_version=get_openai_api_version(),
+        api_key=get_openai_api_key(),
+    )
+
+
 def get_reasoning_client() -> AzureOpenAIResponsesClient:
     global _client
     if _client is None:
-        _client = AzureOpenAIResponsesClient(
-            endpoint=get_openai_endpoint(),
-            deployment_name=get_openai_responses_deployment_name(),
-            api_version=get_openai_api_version(),
-            api_key=get_openai_api_key(),
-        )
+        _client = _create_client()
     return _client
 
 
@@ -30,10 +42,5 @@ def get_reasoning_client() -> AzureOpenAIResponsesClient:
 def get_responses_client() -> AzureOpenAIResponsesClient:
     global _client
     if _client is None:
-        _client = AzureOpenAIResponsesClient(
-            endpoint=get_openai_endpoint(),
-            deployment_name=get_openai_responses_deployment_name(),
-            api_version=get_openai_api_version(),
-            api_key=get_openai_api_key(),
-        )
+        _client = _create_client()
     return _client
@@ -4,16 +4,14 @@ from __future__ import annotations
 import json
 import re
 
-from app.agents.client import get_responses_client
+from app.agents.registry import register
 from app.agents.customer_db_tool import customer_db_tool
 from app.agents.sql_communication_tool import sql_communication_tool
 from app.domain.schemas import AgentCommunicationResponse
 
 
-_client = get_responses_client()
-
-communication_agent = _client.as_agent(
-    name="communication_agent",
+communication_agent = register(
+    "communication_agent",
     instructions=(
         "ROLE: Communication Agent\n\n"
 
@@ -12,7 +12,7 @@ from app.domain.schemas import (
     SqlUserDetails,
     SqlVehicleDetails,
 )
-from app.infrastructure.sql_repository import SqlRepository
+from app.infrastructure.sql_repository import SqlRepository, get_repository
 
 _repo: SqlRepository | None = None
 
@@ -20,7 +20,7 @@ _repo: SqlRepository | None = None
 def _get_repo() -> SqlRepository:
     global _repo
     if _repo is None:
-        _repo = SqlRepository.from_env()
+        _repo = get_repository()
     return _repo
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 
-from app.agents.client import get_responses_client
+from app.agents.registry import register
 from app.domain.schemas import (
     CustomerDbAnswer,
     CustomerDbToolResult,
@@ -18,14 +18,13 @@ from app.domain.schemas import (
     SqlUserDetails,
     SqlVehicleDetails,
 )
-from app.infrastructure.sql_repository import SqlRepository
+from app.infrastructure.sql_repository import SqlRepository, get_repository
 
 _repo: SqlRepository | None = None
-_client = get_responses_client()
 
 
-customer_db_reasoner = _client.as_agent(
-    name="customer_db_reasoner",
+customer_db_reasoner = register(
+    "customer_db_reasoner",
     instructions=(
         "ROLE: Customer DB Reasoning Tool\n\n"
         "You answer a customer question using ONLY the provided database context.\n"
@@ -65,7 +64,7 @@ customer_db_reasoner = _client.as_agent(
 def _get_repo() -> SqlRepository:
     global _repo
     if _repo is None:
-        _repo = SqlRepository.from_env()
+        _repo = get_repository()
     return _repo
 
 
@@ -1,15 +1,14 @@
 """estimator agent and tool wrapper."""
 from __future__ import annotations
 
-from app.agents.client import get_reasoning_client
+from app.agents.registry import register
 from app.agents.sql_tool import sql_lookup_tool
 from app.domain.schemas import AgentEstimatorResponse
 
 
-_reasoningclient = get_reasoning_client()
-
-estimator_agent = _reasoningclient.as_agent(
-    name="estimator_agent",
+estimator_agent = register(
+    "estimator_agent",
+    client="reasoning",
     instructions=(
         "ROLE: Estimator Agent\n\n"
 
@@ -1,15 +1,13 @@
 """Intake agent and tool wrapper."""
 from __future__ import annotations
 
-from app.agents.client import get_responses_client
+from app.agents.registry import register
 from app.agents.sql_tool import sql_lookup_tool
 from app.domain.schemas import AgentIntakeResponse
 
 
-_client = get_responses_client()
-
-intake_agent = _client.as_agent(
-    name="intake_agent",
+intake_agent = register(
+    "intake_agent",
     instructions=(
         "You are an AI Intake Agent responsible for creating a structured automotive job card.\n\n"
 
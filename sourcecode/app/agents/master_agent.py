@@ -5,7 +5,7 @@ import json
 from typing import Optional
 from pydantic import BaseModel
 
-from app.agents.client import get_responses_client
+from app.agents.registry import register
 from app.agents.communication_agent import communication_tool
 from app.agents.intake_agent import intake_tool
 from app.agents.estimator_agent import estimator_tool
@@ -17,10 +17,8 @@ class EstimateResponse(BaseModel):
     currency: str
     notes: Optional[str] = None
 
-_client = get_responses_client()
-
-eta_agent = _client.as_agent(
-    name="eta_agent",
+eta_agent = register(
+    "eta_agent",
     instructions=(
         "Calculate ETA.\n\n"
         "Return ONLY JSON:\n\n"
@@ -40,8 +38,8 @@ async def _collect_json(agent, user_input: str) -> str:
             full += event.text
     return full.strip()
 
-master_agent = _client.as_agent(
-    name="master_agent",
+master_agent = register(
+    "master_agent",
     instructions=(
         "ROLE: Master Orchestration Agent — Single-Dispatch Router\n\n"
 
@@ -0,0 +1,100 @@
+"""Declarative agent registry — agents are described at import, built on first use.
+
+Each agent module calls ``register(name, instructions=..., tools=...)`` and
+keeps the returned ``LazyAgent`` under its old module-level name.  Nothing
+touches ``agent_framework`` or creates an LLM client until an agent is first
+run; the build happens once per process, behind a lock, so CRUD-only
+workers never load the agent stack.
+
+``agents_available()`` is the cheap startup check main.py uses to decide
+whether to mount the real ``/api/agents`` routes or the stub.
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger("uvicorn.error")
+
+# Environment the Azure OpenAI client needs (see app/config/settings.py).
+_REQUIRED_ENV = ("AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_API_VERSION", "AZURE_OPENAI_API_KEY")
+
+
+class AgentUnavailable(RuntimeError):
+    """The agent could not be built: agent_framework is missing or Azure OpenAI is not configured."""
+
+
+def _client_factory(kind: str) -> Callable[[], Any]:
+    from app.agents import client
+    return client.get_reasoning_client if kind == "reasoning" else client.get_responses_client
+
+
+class LazyAgent:
+    """Stands in for the built agent; ``run`` builds it on the first call."""
+
+    __slots__ = ("name", "client", "options", "_agent", "_lock")
+
+    def __init__(self, name: str, client: str, options: dict) -> None:
+        self.name = name
+        self.client = client
+        self.options = options
+        self._agent: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._agent is not None
+
+    def get(self) -> Any:
+        if self._agent is None:
+            with self._lock:
+                if self._agent is None:
+                    started = time.perf_counter()
+                    try:
+                        self._agent = _client_factory(self.client)().as_agent(name=self.name, **self.options)
+                    except (ImportError, RuntimeError) as exc:
+                        raise AgentUnavailable(f"Agent {self.name!r} unavailable: {exc}") from exc
+                    logger.info(f" Agent {self.name} built in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return self._agent
+
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        return self.get().run(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyAgent({self.name!r}, built={self.built})"
+
+
+AGENTS: dict[str, LazyAgent] = {}
+
+
+def register(name: str, *, client: str = "responses", **options: Any) -> LazyAgent:
+    """Declare an agent; ``options`` are passed to ``as_agent`` (instructions, tools, output_schema)."""
+    if name in AGENTS:
+        raise ValueError(f"Agent {name!r} is already registered")
+    agent = AGENTS[name] = LazyAgent(name, client, options)
+    return agent
+
+
+def get_agent(name: str) -> Any:
+    return AGENTS[name].get()
+
+
+def agents_available() -> bool:
+    """agent_framework is installed and the Azure OpenAI settings are present — without importing it."""
+    return (
+        importlib.util.find_spec("agent_framework") is not None
+        and all(os.getenv(v) for v in _REQUIRED_ENV)
+        and bool(os.getenv("AZURE_OPENAI_RESPONSES_DEPLOYMENT_NAME") or os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"))
+    )
+
+
+def get_agent_stats() -> dict:
+    import app.agents.master_agent  # noqa: F401 — registers every agent; builds none
+    return {
+        "available": agents_available(),
+        "agents": {name: {"client": a.client, "built": a.built} for name, a in AGENTS.items()},
+    }
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 
 from app.domain.schemas import JobCardStatusResponse
-from app.infrastructure.sql_repository import SqlRepository
+from app.infrastructure.sql_repository import SqlRepository, get_repository
 
 _repo: SqlRepository | None = None
 
@@ -12,7 +12,7 @@ _repo: SqlRepository | None = None
 def _get_repo() -> SqlRepository:
     global _repo
     if _repo is None:
-        _repo = SqlRepository.from_env()
+        _repo = get_repository()
     return _repo
 
 
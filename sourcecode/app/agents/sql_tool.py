@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-import traceback
-from typing import Iterable
+import logging
 
 from app.domain.schemas import (
     SqlFaultDetails,
@@ -13,7 +12,9 @@ from app.domain.schemas import (
     SqlUserDetails,
     SqlVehicleDetails,
 )
-from app.infrastructure.sql_repository import SqlRepository
+from app.infrastructure.sql_repository import SqlRepository, get_repository
+
+logger = logging.getLogger("uvicorn.error")
 
 _repo: SqlRepository | None = None
 
@@ -21,7 +22,7 @@ _repo: SqlRepository | None = None
 def _get_repo() -> SqlRepository:
     global _repo
     if _repo is None:
-        _repo = SqlRepository.from_env()
+        _repo = get_repository()
     return _repo
 
 def _normalize_fault_codes(codes: list[str] | None) -> list[str]:
@@ -29,31 +30,19 @@ def _normalize_fault_codes(codes: list[str] | None) -> list[str]:
         return []
     return [c.split()[0].strip() for c in codes]
 
-def _build_lookup_result(
-    repo: SqlRepository,
-    vehicle: dict | None,
-    customer: dict | None,
-    parts: Iterable[dict],
-    fault_codes: list[str] | None
-) -> SqlLookupResult:
-    
-    normalized_faults = _normalize_fault_codes(fault_codes)
+def _build_lookup_result(bundle: dict) -> SqlLookupResult:
+    vehicle = bundle.get("vehicle")
+    customer = bundle.get("customer")
+    parts = bundle.get("parts") or []
+    fault_dicts = bundle.get("faults") or []
+    labor_dicts = bundle.get("labor") or []
+
     vehicle_model = SqlVehicleDetails(**vehicle) if vehicle else None
     customer_model = SqlUserDetails(**customer) if customer else None
     part_models = [SqlPartDetails(**part) for part in parts] if parts else None
-    fault_dicts = repo.get_fault_code_details(normalized_faults)
     fault_models = [SqlFaultDetails(**f) for f in fault_dicts] if fault_dicts else None
-
-    labor_ids = [
-        f["labor_operation_id"]
-        for f in fault_dicts
-        if f.get("labor_operation_id")
-    ]
-    labor_dicts = repo.get_labor_operations(labor_ids)
     labor_models = [SqlLaborDetails(**l) for l in labor_dicts] if labor_dicts else None
-    print("DEBUG NORMALIZED FAULTS:", normalized_faults)
-    print("DEBUG FAULT DICTS:", fault_dicts)
-    print("DEBUG LABOR DICTS:", labor_dicts)
+    logger.debug("sql_lookup_tool faults=%s labor=%s", fault_dicts, labor_dicts)
     return SqlLookupResult(
         vehicle=vehicle_model, 
         customer=customer_model, 
@@ -76,28 +65,23 @@ async def sql_lookup_tool(
         resolved_customer_id = customer_id or user_id
 
         def _run() -> SqlLookupResult:
-            vehicle = repo.get_vehicle_details(vehicle_id) if vehicle_id else None
-            print("DEBUG VEHICLE:", vehicle)
-            customer = (
-                repo.get_customer_details(resolved_customer_id)
-                if resolved_customer_id
-                else None
+            normalized_faults = _normalize_fault_codes(fault_codes)
+            logger.debug("sql_lookup_tool normalized faults=%s", normalized_faults)
+            bundle = repo.get_lookup_bundle(
+                vehicle_id=vehicle_id,
+                customer_id=resolved_customer_id,
+                part_codes=part_codes,
+                fault_codes=normalized_faults,
             )
-            print("DEBUG CUSTOMER:", customer)
-            parts = repo.get_parts_details(part_codes or [])
-            print("DEBUG PARTS:", parts)
-            return _build_lookup_result(repo, vehicle, customer, parts, fault_codes)
+            return _build_lookup_result(bundle)
 
         result = await asyncio.to_thread(_run)
-        print("DEBUG SQL_LOOKUP_TOOL RESULT:", result.model_dump_json())
-        return result.model_dump_json()
-    except Exception as e:
-        print("=" * 60)
-        print("ERROR IN sql_lookup_tool:")
-        print(f"  vehicle_id={vehicle_id}")
-        print(f"  customer_id={customer_id}")
-        print(f"  fault_codes={fault_codes}")
-        print(f"  part_codes={part_codes}")
-        traceback.print_exc()
-        print("=" * 60)
+        payload = result.model_dump_json()
+        logger.debug("sql_lookup_tool result=%s", payload)
+        return payload
+    except Exception:
+        logger.exception(
+            f"  sql_lookup_tool failed (vehicle_id={vehicle_id}, customer_id={customer_id}, "
+            f"fault_codes={fault_codes}, part_codes={part_codes})"
+        )
         raise
\ No newline at end of file
@@ -1,9 +1,13 @@
-"""API routes for agent orchestration."""
+"""API routes for agent orchestration.
+
+The agent modules (and agent_framework behind them) are imported on the first
+request, so mounting these routes costs nothing at startup.
+"""
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
 
-from app.application.agent_orchestration_service import execute_master_agent
+from app.agents.registry import AgentUnavailable
 from app.domain.schemas import MasterAgentRequest, MasterAgentResponse
 
 router = APIRouter(prefix="/agents", tags=["Agents"])
@@ -11,7 +15,11 @@ router = APIRouter(prefix="/agents", tags=["Agents"])
 
 @router.post("/master", response_model=dict)
 async def run_master_agent(payload: MasterAgentRequest) -> dict:
+    from app.application.agent_orchestration_service import execute_master_agent
+
     try:
         return await execute_master_agent(payload)
+    except AgentUnavailable as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -0,0 +1,45 @@
+"""Conditional GET support — strong ETags and ``If-None-Match`` → 304.
+
+The ETag is a hash of the serialized body.  db_service caches the last ETag
+served per resource (and query string) until a write bumps the resource's
+version, so a matching If-None-Match is answered before the handler loads
+anything.
+"""
+from __future__ import annotations
+import hashlib
+from typing import Any, Callable
+from fastapi import Request, Response
+from app.application import db_service as db
+from app.api.responses import dumps
+
+_HEADERS = {"Cache-Control": "no-cache"}   # always revalidate, never serve blind
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2): ``W/"x"`` matches ``"x"``; ``*`` matches anything."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={**_HEADERS, "ETag": etag})
+
+def conditional_json(request: Request, kind: str, key: str, load: Callable[[], Any]) -> Response:
+    """Serve ``load()`` as JSON with an ETag, or 304 if the client already has it.
+
+    ``load`` may raise HTTPException (e.g. 404); nothing is cached then.
+    """
+    variant = request.url.query
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        cached = db.cached_etag(kind, key, variant)
+        if cached and _matches(if_none_match, cached):
+            return _not_modified(cached)
+    token = db.etag_token(kind, key)
+    body = dumps(load())
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    db.remember_etag(kind, key, etag, token, variant)
+    if if_none_match and _matches(if_none_match, etag):
+        return _not_modified(etag)
+    return Response(content=body, media_type="application/json", headers={**_HEADERS, "ETag": etag})
@@ -1,9 +1,13 @@
 """Customer, vehicle, and service history routes — v2 schema."""
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import Optional
 from app.domain.schemas import VehicleCreate
 from app.application import db_service as db
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
+from app.application.raw_json import json_object
+from app.api.conditional import conditional_json
+from app.api.responses import FastJSONResponse, json_rows
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 
@@ -72,15 +76,15 @@ def _map_estimate(est: dict) -> dict:
         "total_amount": est.get("grand_total", 0),
         "line_items": est.get("lineItems", []),
         "estimation_json": estimation_json,
-        "estimate": estimation_json if isinstance(estimation_json, dict) else None,
+        "estimate": json_object(estimation_json),
     }
 
 
 # ── Customer endpoints ────────────────────────────────────────────────────────
 
-@router.get("", response_model=list[dict])
+@router.get("", response_model=list[dict], response_class=FastJSONResponse)
 def list_customers():
-    return db.list_customers()
+    return json_rows(db.list_customers())
 
 
 @router.get("/{customer_id}", response_model=dict)
@@ -94,20 +98,8 @@ def get_customer(customer_id: str):
 
 # ── Vehicle search (must come before /{customer_id}/vehicles to avoid routing conflict) ──
 
-@router.get("/vehicles/search", response_model=dict)
-def search_vehicle_by_vin(vin: str = ""):
-    """Search for a vehicle and its owner by VIN or registration number (partial match).
-    Returns vehicle_id, vehicle details, and customer info for pre-filling the intake form."""
-    if not vin or len(vin.strip()) < 3:
-        raise HTTPException(
-            status_code=400,
-            detail="Provide at least 3 characters of VIN or registration number"
-        )
-    result = db.search_vehicle_by_number(vin)
-    if not result or not result.get("found"):
-        return {"found": False}
+def _map_search_hit(result: dict) -> dict:
     return {
-        "found":               True,
         "vehicle_id":          result.get("id"),
         "vehicle_vin":         result.get("vin"),
         "vehicle_make":        result.get("make"),
@@ -123,6 +115,28 @@ def search_vehicle_by_vin(vin: str = ""):
     }
 
 
+@router.get("/vehicles/search", response_model=dict)
+def search_vehicle_by_vin(vin: str = "", limit: int = Query(10, ge=1, le=50)):
+    """Search for a vehicle and its owner by VIN or registration number (partial match).
+    Returns the best match (vehicle_id, vehicle details, customer info) for pre-filling the
+    intake form, plus up to ``limit`` ranked ``candidates``."""
+    if not vin or len(vin.strip()) < 3:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide at least 3 characters of VIN or registration number"
+        )
+    hits = db.search_vehicles(vin, limit=limit)
+    if not hits:
+        return {"found": False, "candidates": []}
+    candidates = [_map_search_hit(h) for h in hits]
+    return {"found": True, **candidates[0], "candidates": candidates}
+
+
+@router.get("/vehicles/search-index", response_model=dict)
+def vehicle_search_index_stats():
+    return db.get_vehicle_search_stats()
+
+
 # ── Per-customer vehicle endpoints ────────────────────────────────────────────
 
 @router.get("/{customer_id}/vehicles", response_model=list[dict])
@@ -145,8 +159,23 @@ def update_vehicle(customer_id: str, vehicle_id: str, payload: dict):
 
 
 @router.get("/{customer_id}/history", response_model=list[dict])
-def get_history(customer_id: str):
-    return [_map_jc(j) for j in db.get_customer_history(customer_id)]
+def get_history(
+    customer_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    if limit is None and cursor is None:
+        return [_map_jc(j) for j in db.get_customer_history(customer_id)]
+    try:
+        rows, next_cursor = db.get_customer_history_page(
+            customer_id, limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor
+        )
+    except InvalidCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [_map_jc(j) for j in rows]
 
 
 @router.get("/{customer_id}/latest-job", response_model=dict)
@@ -158,8 +187,27 @@ def get_latest_job(customer_id: str):
 
 
 @router.get("/{customer_id}/jobs", response_model=list[dict])
-def get_customer_jobs(customer_id: str, status: Optional[str] = None):
-    rows = db.list_job_cards(status=status, customer_id=customer_id)
+def get_customer_jobs(
+    customer_id: str,
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    if limit is None and cursor is None:
+        return conditional_json(
+            request, db.CUSTOMER_JOBS, customer_id,
+            lambda: [_map_jc(j) for j in db.list_job_cards(status=status, customer_id=customer_id)],
+        )
+    try:
+        rows, next_cursor = db.list_job_cards_page(
+            status=status, customer_id=customer_id, limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor
+        )
+    except InvalidCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [_map_jc(j) for j in rows]
 
 
@@ -47,3 +47,12 @@ def manager_dashboard():
         for j in data["jobs_with_eta"]
     ]
     return data
+
+@router.get("/counters", response_model=dict)
+def dashboard_counters():
+    return db.get_dashboard_counter_stats()
+
+@router.get("/drift", response_model=dict)
+def dashboard_drift(reconcile: bool = False):
+    """Compare the incremental KPI counters with a full recount (optionally fixing them)."""
+    return db.get_dashboard_drift(reconcile=reconcile)
@@ -1,8 +1,13 @@
 """Estimate routes — create, revise, approve, reject."""
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from app.domain.schemas import EstimateStatusUpdate
 from app.application import db_service as db
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
+from app.application.raw_json import json_object
+from app.api.conditional import conditional_json
+from app.api.responses import FastJSONResponse, json_rows
 
 router = APIRouter(prefix="/estimates", tags=["Estimates"])
 
@@ -19,19 +24,33 @@ def _map_estimate(est: dict) -> dict:
         "total_amount": est.get("grand_total", 0),
         "line_items": est.get("lineItems", []),
         "estimation_json": estimation_json,
-        "estimate": estimation_json if isinstance(estimation_json, dict) else None,
+        "estimate": json_object(estimation_json),
     }
 
 @router.get("/job/{job_card_id}", response_model=dict)
-def get_estimate_for_job(job_card_id: str):
-    est = db.get_estimate_by_job(job_card_id)
-    if not est:
-        raise HTTPException(status_code=404, detail=f"No estimate for job {job_card_id}")
-    return _map_estimate(est)
+def get_estimate_for_job(job_card_id: str, request: Request):
+    def load() -> dict:
+        est = db.get_estimate_by_job(job_card_id)
+        if not est:
+            raise HTTPException(status_code=404, detail=f"No estimate for job {job_card_id}")
+        return _map_estimate(est)
+    return conditional_json(request, db.ESTIMATE_FOR_JOB, job_card_id, load)
 
-@router.get("", response_model=list[dict])
-def list_estimates():
-    return [_map_estimate(e) for e in db.get_all_estimates_with_job()]
+@router.get("", response_model=list[dict], response_class=FastJSONResponse)
+def list_estimates(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_line_items: bool = False,
+):
+    if limit is None and cursor is None:
+        return json_rows([_map_estimate(e) for e in db.get_all_estimates_with_job(include_line_items)])
+    try:
+        rows, next_cursor = db.list_estimates_page(
+            limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor, include_line_items=include_line_items
+        )
+    except InvalidCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return json_rows([_map_estimate(e) for e in rows], next_cursor)
 
 @router.get("/{estimate_id}", response_model=dict)
 def get_estimate(estimate_id: str):
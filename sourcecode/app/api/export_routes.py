@@ -0,0 +1,120 @@
+"""Export routes — the full job card and estimate history as streamed NDJSON or CSV.
+
+Rows are read with ``fetchmany`` and encoded as they arrive, so memory stays
+at one fetch batch whatever the table size.  CSV list cells use the
+separators the importer splits on, so an exported job card CSV imports back.
+"""
+from __future__ import annotations
+import csv
+import io
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from app.application import db_service as db
+from app.application.bulk_import import IMPORTS
+from app.application.raw_json import RawJSON
+from app.api.estimate_routes import _map_estimate
+from app.api.job_card_routes import _map
+from app.api.responses import dumps
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+CHUNK_BYTES = 64 * 1024   # body chunk size; one send() (and one threadpool hop) per chunk
+
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+_FORMAT = Query("ndjson", pattern="^(ndjson|csv)$")
+
+def _ndjson(rows: Iterable[dict]) -> Iterator[bytes]:
+    for row in rows:
+        yield dumps(row) + b"\n"
+
+def _cell(name: str, value: Any, lists: dict[str, str]) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list) and name in lists:
+        return lists[name].join(str(v) for v in value)
+    if isinstance(value, (list, dict, RawJSON)):
+        return dumps(value).decode("utf-8")
+    return value
+
+def _csv(rows: Iterable[dict], columns: list[str], lists: dict[str, str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def take() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(columns)
+    yield take()
+    for row in rows:
+        writer.writerow([_cell(c, row.get(c), lists) for c in columns])
+        yield take()
+
+def _chunks(lines: Iterator[bytes]) -> Iterator[bytes]:
+    pending: list[bytes] = []
+    size = 0
+    for line in lines:
+        pending.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+def _first(rows: Iterator[dict]) -> Iterator[dict]:
+    """Read the first row now, so a bad filter or an unreachable database is an
+    HTTP error rather than a response that stops after its headers."""
+    for row in rows:
+        return chain([row], rows)
+    return iter(())
+
+async def _stream(
+    name: str,
+    format: str,
+    rows: Iterator[dict],
+    mapper: Callable[[dict], dict],
+    lists: Optional[dict[str, str]] = None,
+) -> StreamingResponse:
+    try:
+        rows = await run_in_threadpool(_first, rows)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    mapped = (mapper(r) for r in rows)
+    if format == "csv":
+        lines = _csv(mapped, list(mapper({})), lists or {})
+    else:
+        lines = _ndjson(mapped)
+    return StreamingResponse(
+        _chunks(lines),
+        media_type=_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format}"'},
+    )
+
+@router.get("/job-cards")
+async def export_job_cards(
+    format: str = _FORMAT,
+    status: Optional[str] = None,
+    advisor_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    include: Optional[str] = Query(None, description="Deferred column groups to export: obd,tasks,intake"),
+):
+    """Every matching job card, newest first, in the shape of ``GET /api/job-cards``."""
+    groups = [g.strip() for g in include.split(",") if g.strip()] if include else []
+    rows = db.export_job_cards(status=status, advisor_id=advisor_id, customer_id=customer_id, include=groups)
+    return await _stream("job-cards", format, rows, _map, IMPORTS["job_cards"].csv_lists)
+
+@router.get("/estimates")
+async def export_estimates(format: str = _FORMAT, include_line_items: bool = False):
+    """Every estimate with a job card, newest first, in the shape of ``GET /api/estimates``.
+
+    In CSV, ``line_items`` and ``estimation_json`` are JSON-encoded cells."""
+    rows = db.export_estimates(include_line_items=include_line_items)
+    return await _stream("estimates", format, rows, _map_estimate)
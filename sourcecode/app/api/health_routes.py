@@ -0,0 +1,31 @@
+"""Operational health routes — DB connection pool, circuit breaker and query metrics visibility."""
+from __future__ import annotations
+from fastapi import APIRouter, Query
+from app.agents.registry import get_agent_stats
+from app.application import auth_service
+from app.application import db_service as db
+from app.infrastructure.query_metrics import QUERY_METRICS
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+@router.get("/db", response_model=dict)
+def db_health():
+    return {"pool": db.get_pool_stats(), "breaker": db.get_breaker_state()}
+
+@router.get("/etags", response_model=dict)
+def etag_cache():
+    return db.get_etag_cache_stats()
+
+@router.get("/sessions", response_model=dict)
+def session_store():
+    return auth_service.get_session_stats()
+
+@router.get("/agents", response_model=dict)
+def agent_registry():
+    """Registered agents and whether each has been built in this worker yet."""
+    return get_agent_stats()
+
+@router.get("/queries", response_model=dict)
+def query_stats(top: int = Query(20, ge=1, le=500)):
+    """Heaviest SQL statements by total time, schema variant counts and recent slow queries."""
+    return QUERY_METRICS.snapshot(top)
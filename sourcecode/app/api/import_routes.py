@@ -0,0 +1,41 @@
+"""Bulk import routes — customers, vehicles and historical job cards from NDJSON or CSV."""
+from __future__ import annotations
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
+from app.api.responses import FastJSONResponse
+from app.application import bulk_import
+
+router = APIRouter(prefix="/import", tags=["Import"])
+
+@router.post("/{entity}", response_model=dict)
+async def import_entity(
+    entity: str,
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+    batch_size: int = Query(bulk_import.DEFAULT_BATCH_SIZE, ge=1, le=bulk_import.MAX_BATCH_SIZE),
+):
+    """Stream ``application/x-ndjson`` or ``text/csv`` rows in; returns per-batch progress and rejects.
+
+    If the body fails part-way (bad encoding, lost database) after some batches
+    were committed, the answer is 207 with the report and an ``aborted`` entry.
+    """
+    spec = bulk_import.IMPORTS.get(entity)
+    if spec is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown import entity {entity!r}; expected one of {', '.join(bulk_import.IMPORTS)}",
+        )
+    fmt = format or bulk_import.detect_format(request.headers.get("content-type"))
+    job = bulk_import.BulkImport(entity, fmt)
+    try:
+        async for batch in bulk_import.read_batches(request.stream(), fmt, spec, batch_size):
+            await run_in_threadpool(job.write, batch)
+    except (ValueError, RuntimeError) as exc:   # UnicodeDecodeError is a ValueError
+        status = 400 if isinstance(exc, ValueError) else 503
+        if not job.written:
+            raise HTTPException(status_code=status, detail=str(exc))
+        # Earlier batches are committed: report them rather than fail the whole request.
+        job.abort(status, str(exc))
+        return FastJSONResponse(status_code=207, content=job.report())
+    return job.report()
@@ -1,15 +1,21 @@
 """Job Card CRUD routes."""
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import Optional
 
 from app.domain.schemas import JobCardCreate, JobCardUpdate, JobCardStatusUpdate, JobCardResponse
 from app.application import db_service as db
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
+from app.api.conditional import conditional_json
+from app.api.responses import FastJSONResponse, json_rows
+from app.application.job_card_record import JobCardRecord
 
 router = APIRouter(prefix="/job-cards", tags=["Job Cards"])
 
-def _map(jc: dict) -> dict:
+def _map(jc) -> dict:
     """Normalise JSON fixture keys to snake_case for response."""
+    if isinstance(jc, JobCardRecord):
+        return jc.to_api()
     return {
         "id": jc.get("id"),
         "created_at": jc.get("createdAt", ""),
@@ -33,27 +39,46 @@ def _map(jc: dict) -> dict:
         "intake_payload_json": jc.get("intakePayloadJson")
     }
 
-@router.get("", response_model=list[dict])
+@router.get("", response_model=list[dict], response_class=FastJSONResponse)
 def list_job_cards(
     status: Optional[str] = None,
     advisor_id: Optional[str] = None,
     customer_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include: Optional[str] = Query(None, description="Deferred column groups to load: obd,tasks,intake"),
 ):
-    return [
-        _map(j)
-        for j in db.list_job_cards(
-            status=status,
-            advisor_id=advisor_id,
-            customer_id=customer_id,
-        )
-    ]
+    """Without ``limit``/``cursor`` every match is returned; otherwise one keyset page,
+    with the next page's cursor in the ``X-Next-Cursor`` header.  Only summary
+    columns are loaded unless ``include`` names deferred groups."""
+    groups = [g.strip() for g in include.split(",") if g.strip()] if include else []
+    next_cursor = None
+    try:
+        if limit is None and cursor is None:
+            rows = db.list_job_card_records(
+                status=status, advisor_id=advisor_id, customer_id=customer_id, include=groups
+            )
+        else:
+            rows, next_cursor = db.list_job_cards_page(
+                status=status,
+                advisor_id=advisor_id,
+                customer_id=customer_id,
+                limit=limit or DEFAULT_PAGE_SIZE,
+                cursor=cursor,
+                include=groups,
+            )
+    except (InvalidCursor, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return json_rows([_map(j) for j in rows], next_cursor)
 
 @router.get("/{job_id}", response_model=dict)
-def get_job_card(job_id: str):
-    jc = db.get_job_card(job_id)
-    if not jc:
-        raise HTTPException(status_code=404, detail=f"Job card {job_id} not found")
-    return _map(jc)
+def get_job_card(job_id: str, request: Request):
+    def load() -> dict:
+        jc = db.get_job_card(job_id)
+        if not jc:
+            raise HTTPException(status_code=404, detail=f"Job card {job_id} not found")
+        return _map(jc)
+    return conditional_json(request, db.JOB_CARD, job_id, load)
 
 @router.post("", response_model=dict)
 def create_job_card(payload: JobCardCreate):
@@ -0,0 +1,11 @@
+"""Prometheus scrape endpoint — SQL query metrics in text exposition format."""
+from __future__ import annotations
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.infrastructure.query_metrics import QUERY_METRICS
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(QUERY_METRICS.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,31 @@
+"""Reference-data cache routes — hit/miss stats and manual reload of the catalog tables."""
+from __future__ import annotations
+from fastapi import APIRouter, HTTPException
+from app.config.settings import is_sql_configured
+
+router = APIRouter(prefix="/reference-cache", tags=["Reference Cache"])
+
+
+def _cache():
+    if not is_sql_configured():
+        raise HTTPException(503, "SQL reference data is not configured")
+    from app.infrastructure.sql_repository import get_repository
+    return get_repository().reference_cache
+
+
+@router.get("", response_model=dict)
+def reference_cache_stats():
+    return _cache().stats()
+
+@router.post("/reload", response_model=dict)
+def reload_reference_cache():
+    cache = _cache()
+    if not cache.reload():
+        raise HTTPException(503, "Reference data reload failed; previous snapshot kept")
+    return cache.stats()
+
+@router.post("/invalidate", response_model=dict)
+def invalidate_reference_cache():
+    cache = _cache()
+    cache.invalidate()
+    return cache.stats()
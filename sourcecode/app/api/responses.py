@@ -0,0 +1,241 @@
+"""Response helpers for large JSON bodies — fast encoding and gzip/brotli.
+
+``FastJSONResponse`` serializes with orjson when it is installed (falling back
+to a compact ``json.dumps``).  ``RawJSON`` column values are spliced in as
+their stored text — as ``orjson.Fragment`` where available, otherwise by
+substituting a placeholder after encoding.  Routes that build their rows from trusted dicts
+return it directly, which skips FastAPI's per-element ``response_model``
+validation and ``jsonable_encoder`` pass; it is also the app's default
+response class.
+
+``CompressionMiddleware`` negotiates ``br`` (when the brotli package is
+installed) or ``gzip`` from Accept-Encoding for bodies of at least
+``minimum_size`` bytes, streaming bodies included.
+"""
+from __future__ import annotations
+import gzip
+import io
+import json
+import re
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+from fastapi.encoders import ENCODERS_BY_TYPE
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.application.raw_json import RawJSON
+
+try:
+    import orjson
+except ImportError:  # optional: compact json.dumps instead
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+
+def _default(obj: Any) -> Any:
+    """Types jsonable_encoder would have converted (and the DB drivers return)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, bytes)):
+        return obj.decode() if isinstance(obj, bytes) else str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_Fragment = getattr(orjson, "Fragment", None)   # orjson >= 3.9
+_SPLICE = f"rawjson-{uuid.uuid4().hex}:"
+_SPLICE_RE = re.compile(b'"' + re.escape(_SPLICE.encode()) + rb'(\d+)"')
+
+# Anything that still goes through jsonable_encoder (routes without a response_model).
+ENCODERS_BY_TYPE[RawJSON] = lambda v: v.value
+
+
+def dumps(content: Any) -> bytes:
+    spliced: list[bytes] = []
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, RawJSON):
+            data = obj.json_bytes()
+            if data is None:
+                return obj.value
+            if _Fragment is not None:
+                return _Fragment(data)
+            spliced.append(data)
+            return f"{_SPLICE}{len(spliced) - 1}"
+        return _default(obj)
+
+    if orjson is not None:
+        body = orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(content, default=default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if spliced:
+        body = _SPLICE_RE.sub(lambda m: spliced[int(m.group(1))], body)
+    return body
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_rows(rows: list, next_cursor: Optional[str] = None) -> FastJSONResponse:
+    """A list endpoint's already-mapped rows, plus the keyset cursor header when paginating."""
+    return FastJSONResponse(rows, headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
+
+
+# ─── Compression ──────────────────────────────────────────────────────────────
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4   # dynamic content: close to gzip -9 size at a fraction of the CPU
+
+_INCOMPRESSIBLE = ("image/", "audio/", "video/", "application/zip", "application/gzip", "application/octet-stream")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """``br`` or ``gzip`` from an Accept-Encoding header (q-values honoured), or None."""
+    offered: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    wildcard = offered.get("*", 0.0)
+    candidates = (("br",) if brotli is not None else ()) + ("gzip",)
+    best = max(candidates, key=lambda c: offered.get(c, wildcard))
+    return best if offered.get(best, wildcard) > 0 else None
+
+
+class _Encoder:
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._buffer = io.BytesIO()
+            self._gz = gzip.GzipFile(mode="wb", fileobj=self._buffer, compresslevel=GZIP_LEVEL)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._br.process(data)
+            return out + self._br.finish() if final else out + self._br.flush()
+        self._gz.write(data)
+        if final:
+            self._gz.close()
+        out = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return out
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressingResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressingResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None  # type: ignore[assignment]
+        self.start: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+        self.if_none_match = ""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        self.if_none_match = Headers(scope=scope).get("if-none-match", "")
+        await self.app(scope, receive, self._send)
+
+    def _eligible(self, headers: Headers) -> bool:
+        if self.start["status"] < 200 or self.start["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        return not headers.get("content-type", "").startswith(_INCOMPRESSIBLE)
+
+    def _client_holds_strong(self, etag: Optional[str]) -> bool:
+        return bool(etag) and any(c.strip() == etag for c in self.if_none_match.split(","))
+
+    @staticmethod
+    def _weaken_etag(headers: MutableHeaders) -> None:
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag   # a different representation: no longer byte-identical
+
+    def _encode_headers(self, length: Optional[int]) -> None:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        self._weaken_etag(headers)
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+
+    async def _send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if message["status"] == 304:
+                # Repeat the validator of the 200 the client holds: weak if that 200 was
+                # encoded, strong if it was small enough to go out as identity.
+                headers = MutableHeaders(raw=message["headers"])
+                if not self._client_holds_strong(headers.get("etag")):
+                    self._weaken_etag(headers)
+                self.passthrough = True
+                await self.send(message)
+                return
+            self.start = message   # held back until the first body chunk decides the encoding
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        body, more = message.get("body", b""), message.get("more_body", False)
+        if self.encoder is None:
+            if not self._eligible(Headers(raw=self.start["headers"])) or (not more and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            self.encoder = _Encoder(self.encoding)
+            if not more:
+                compressed = self.encoder.compress(body, final=True)
+                self._encode_headers(len(compressed))
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            self._encode_headers(None)
+            await self.send(self.start)
+        await self.send({
+            "type": "http.response.body",
+            "body": self.encoder.compress(body, final=not more),
+            "more_body": more,
+        })
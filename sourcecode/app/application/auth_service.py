@@ -1,9 +1,22 @@
-"""Auth service — simple in-memory session store for demo."""
+"""Auth service — demo credentials and login sessions.
+
+Sessions live in the store selected by SESSION_BACKEND: ``memory`` (per
+process) or ``sqlite`` (one WAL file shared by every worker on the host,
+required when running more than one worker).
+"""
 from __future__ import annotations
 
+import logging
 import secrets
+import threading
 from typing import Optional
 from app.application.db_service import find_employee, find_customer_by_email
+from app.config.settings import (
+    get_session_backend, get_session_max_entries, get_session_sqlite_path, get_session_ttl,
+)
+from app.infrastructure.session_store import MemorySessionStore, SqliteSessionStore
+
+logger = logging.getLogger("uvicorn.error")
 
 # Demo credential map: username → {password, role, user_id, name}
 _DEMO_USERS: dict[str, dict] = {
@@ -18,34 +31,52 @@ _DEMO_USERS: dict[str, dict] = {
     "customer":   {"password": "demo", "role": "customer", "user_id": "C002", "name": "Priya Verma"},
 }
 
-# token → user info
-_sessions: dict[str, dict] = {}
-
 def _normalize_identifier(identifier: str) -> str:
     return identifier.strip().lower()
 
+# user_id → first demo user with that id, so logging in by id is a dict lookup
+_DEMO_USERS_BY_ID: dict[str, dict] = {}
+for _user in _DEMO_USERS.values():
+    _DEMO_USERS_BY_ID.setdefault(_normalize_identifier(str(_user.get("user_id", ""))), _user)
+
+# token → user info
+_store = None
+_store_lock = threading.Lock()
+
+def _sessions():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = get_session_backend()
+                if backend == "sqlite":
+                    _store = SqliteSessionStore(
+                        get_session_sqlite_path(), ttl=get_session_ttl(), max_entries=get_session_max_entries()
+                    )
+                else:
+                    if backend != "memory":
+                        logger.warning(f"  Unknown SESSION_BACKEND {backend!r} — using in-memory sessions")
+                    _store = MemorySessionStore(ttl=get_session_ttl(), max_entries=get_session_max_entries())
+    return _store
+
+def get_session_stats() -> dict:
+    return _sessions().stats()
+
 def _resolve_demo_user(identifier: str) -> Optional[dict]:
     normalized_identifier = _normalize_identifier(identifier)
-    user = _DEMO_USERS.get(normalized_identifier)
-    if user:
-        return user
-
-    for demo_user in _DEMO_USERS.values():
-        if str(demo_user.get("user_id", "")).strip().lower() == normalized_identifier:
-            return demo_user
-    return None
+    return _DEMO_USERS.get(normalized_identifier) or _DEMO_USERS_BY_ID.get(normalized_identifier)
 
 def login(username: str, password: str) -> Optional[dict]:
     user = _resolve_demo_user(username)
     if user and user["password"] == password:
         token = secrets.token_hex(24)
         session = {"token": token, "role": user["role"], "user_id": user["user_id"], "name": user["name"]}
-        _sessions[token] = session
+        _sessions().put(token, session)
         return session
     return None
 
 def get_session(token: str) -> Optional[dict]:
-    return _sessions.get(token)
+    return _sessions().get(token)
 
 def logout(token: str) -> None:
-    _sessions.pop(token, None)
+    _sessions().delete(token)
@@ -0,0 +1,278 @@
+"""Bulk import of customers, vehicles and historical job cards.
+
+The request body is read as a stream of NDJSON objects or CSV records (header
+row first) and cut into batches as it arrives.  Each record is validated
+against its ``*Import`` schema and each batch is written as one transaction
+by ``db_service.bulk_insert``; rows that fail validation or that the database
+refuses are reported as rejects with their line number instead of failing
+the import.
+
+CSV cells are strings: empty cells are treated as missing, list columns are
+split (``risk_indicators`` / ``obd_fault_codes`` on ",", ``tasks`` on "|") and
+``intake_payload_json`` is parsed as JSON.
+"""
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, NamedTuple, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from app.application import db_service as db
+from app.domain.schemas import CustomerImport, JobCardImport, VehicleImport
+
+logger = logging.getLogger("uvicorn.error")
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 10000
+MAX_REPORTED_REJECTS = 100
+
+FORMATS = ("ndjson", "csv")
+
+
+class ImportSpec(NamedTuple):
+    table: str
+    schema: type[BaseModel]
+    columns: tuple[str, ...]
+    to_row: Callable[[Any], tuple]
+    csv_lists: dict[str, str] = {}  # list column → CSV separator
+
+
+def _new_id(prefix: str) -> str:
+    return f"{prefix}{uuid.uuid4().hex[:8].upper()}"
+
+
+def _customer_row(c: CustomerImport) -> tuple:
+    return (c.id or _new_id("C"), c.name, c.phone, c.email, c.city, c.state, c.preferred_contact)
+
+
+def _vehicle_row(v: VehicleImport) -> tuple:
+    return (v.id or _new_id("V"), v.customer_id, v.make, v.model, v.year,
+            v.fuel_type, v.transmission, v.registration_number, v.vin)
+
+
+def _job_card_row(j: JobCardImport) -> tuple:
+    created_at = j.created_at or datetime.now(timezone.utc)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    tasks = [str(t).strip() for t in j.tasks or [] if str(t).strip()]
+    intake = json.dumps(j.intake_payload_json, ensure_ascii=False) if j.intake_payload_json is not None else None
+    return (j.id or _new_id("J"), created_at.isoformat(), j.status.strip().lower(),
+            j.customer_name, j.vehicle_make, j.vehicle_model, j.vehicle_year, j.vin, j.mileage,
+            j.complaint, j.service_type, ",".join(j.risk_indicators or []), ",".join(j.obd_fault_codes or []),
+            j.obd_document_id, j.obd_report_text, j.obd_report_summary, "\n".join(tasks), intake,
+            j.customer_id, j.vehicle_id, j.advisor_id)
+
+
+IMPORTS: dict[str, ImportSpec] = {
+    "customers": ImportSpec(
+        "Customers", CustomerImport,
+        ("id", "name", "phone", "email", "city", "state", "preferred_contact"),
+        _customer_row,
+    ),
+    "vehicles": ImportSpec(
+        "Vehicles", VehicleImport,
+        ("id", "customer_id", "make", "model", "year", "fuel_type", "transmission", "registration_number", "vin"),
+        _vehicle_row,
+    ),
+    "job_cards": ImportSpec(
+        "Job_Cards", JobCardImport,
+        ("id", "created_at", "status", "customer_name", "vehicle_make", "vehicle_model", "vehicle_year",
+         "vin", "mileage", "complaint", "service_type", "risk_indicators", "obd_fault_codes",
+         "obd_document_id", "obd_report_text", "obd_report_summary", "tasks", "intake_payload_json",
+         "customer_id", "vehicle_id", "advisor_id"),
+        _job_card_row,
+        {"risk_indicators": ",", "obd_fault_codes": ",", "tasks": "|"},
+    ),
+}
+
+
+def detect_format(content_type: Optional[str]) -> str:
+    ct = (content_type or "").split(";")[0].strip().lower()
+    return "csv" if ct in ("text/csv", "application/csv") else "ndjson"
+
+
+# ─── Parsing ──────────────────────────────────────────────────────────────────
+
+Record = tuple[int, Any]  # (line number, parsed record or error message)
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines (without line endings), across chunk boundaries."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield pending.rstrip("\r")
+
+
+def _csv_record(header: list[str], cells: list[str], lists: dict[str, str]) -> dict:
+    record: dict[str, Any] = {}
+    for name, cell in zip(header, cells):
+        if cell == "":
+            continue
+        if name in lists:
+            record[name] = [part.strip() for part in cell.split(lists[name]) if part.strip()]
+        elif name == "intake_payload_json":
+            record[name] = json.loads(cell)
+        else:
+            record[name] = cell
+    return record
+
+
+async def read_records(chunks: AsyncIterator[bytes], fmt: str, spec: ImportSpec) -> AsyncIterator[Record]:
+    """Yield ``(line number, record)``; unparseable records yield an error string instead."""
+    if fmt == "ndjson":
+        line_no = 0
+        async for line in _lines(chunks):
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield line_no, f"Invalid JSON: {exc}"
+                continue
+            yield line_no, record if isinstance(record, dict) else "Expected a JSON object"
+        return
+
+    header: Optional[list[str]] = None
+    line_no, start, buffered = 0, 0, []
+    async for line in _lines(chunks):
+        line_no += 1
+        if not buffered:
+            start = line_no
+        buffered.append(line)
+        # A quoted cell may span lines: wait until the quotes balance.
+        text = "\n".join(buffered)
+        if text.count('"') % 2:
+            continue
+        buffered = []
+        if not text.strip():
+            continue
+        cells = next(csv.reader([text]))
+        if header is None:
+            header = [h.strip() for h in cells]
+            continue
+        try:
+            yield start, _csv_record(header, cells, spec.csv_lists)
+        except ValueError as exc:
+            yield start, f"Invalid intake_payload_json: {exc}"
+    if buffered:
+        yield start, "Unterminated quoted CSV cell"
+    if header is None:
+        raise ValueError("CSV body has no header row")
+
+
+async def read_batches(chunks: AsyncIterator[bytes], fmt: str, spec: ImportSpec, size: int) -> AsyncIterator[list[Record]]:
+    batch: list[Record] = []
+    async for record in read_records(chunks, fmt, spec):
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ─── Writing ──────────────────────────────────────────────────────────────────
+
+def _validation_errors(exc: ValidationError) -> list[str]:
+    return [f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}" for e in exc.errors()]
+
+
+class BulkImport:
+    """Validates and writes batches for one import request and keeps its report."""
+
+    def __init__(self, entity: str, fmt: str) -> None:
+        self.entity = entity
+        self.spec = IMPORTS[entity]
+        self.fmt = fmt
+        self._started = time.perf_counter()
+        self._batches: list[dict] = []
+        self._rejects: list[dict] = []
+        self._rows = self._inserted = self._rejected = 0
+        self._aborted: Optional[dict] = None
+
+    def _reject(self, line: int, errors: list[str]) -> None:
+        self._rejected += 1
+        if len(self._rejects) < MAX_REPORTED_REJECTS:
+            self._rejects.append({"line": line, "errors": errors})
+
+    def write(self, batch: list[Record]) -> dict:
+        """Validate and insert one batch (blocking; run it off the event loop)."""
+        started = time.perf_counter()
+        rejected_before = self._rejected
+        lines, rows = [], []
+        for line, record in batch:
+            if isinstance(record, str):
+                self._reject(line, [record])
+                continue
+            try:
+                model = self.spec.schema.model_validate(record)
+            except ValidationError as exc:
+                self._reject(line, _validation_errors(exc))
+                continue
+            lines.append(line)
+            rows.append(self.spec.to_row(model))
+        inserted, failed = db.bulk_insert(self.spec.table, self.spec.columns, rows)
+        for index, error in failed:
+            self._reject(lines[index], [error])
+        self._rows += len(batch)
+        self._inserted += inserted
+        rejected = self._rejected - rejected_before
+        summary = {
+            "batch": len(self._batches) + 1,
+            "status": "committed" if not rejected else "partial" if inserted else "rejected",
+            "rows": len(batch),
+            "inserted": inserted,
+            "rejected": rejected,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        self._batches.append(summary)
+        logger.info(
+            f" Import {self.entity}: batch {summary['batch']} — {inserted}/{len(batch)} rows "
+            f"({self._inserted} total) in {summary['elapsed_ms']} ms"
+        )
+        return summary
+
+    @property
+    def written(self) -> bool:
+        """At least one batch has been committed, so failing the request would hide it."""
+        return bool(self._batches)
+
+    def abort(self, status: int, error: str) -> None:
+        """The body stopped before its end; batches already written stay committed."""
+        self._aborted = {
+            "status": status,
+            "error": error,
+            "after_batch": len(self._batches),   # rows after this batch were not imported
+        }
+        logger.warning(f"  Import {self.entity} aborted after batch {len(self._batches)}: {error}")
+
+    def report(self) -> dict:
+        elapsed = time.perf_counter() - self._started
+        return {
+            "entity": self.entity,
+            "format": self.fmt,
+            "rows": self._rows,
+            "inserted": self._inserted,
+            "rejected": self._rejected,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "rows_per_second": round(self._rows / elapsed) if elapsed > 0 else None,
+            "batches": self._batches,
+            "rejects": self._rejects,
+            "rejects_truncated": self._rejected > len(self._rejects),
+            **({"aborted": self._aborted} if self._aborted else {}),
+        }
@@ -0,0 +1,201 @@
+"""Incrementally maintained dashboard KPI counters.
+
+Job card writes in db_service report each change as an (old, new) pair of
+``JobSummary`` values; the store moves one count from the old bucket to the
+new one.  Buckets are kept per advisor and for all advisors together, so a
+dashboard read folds a handful of (status, risk) cells regardless of how many
+job cards exist.  Writes that bypass db_service (or race with each other)
+are corrected by a periodic full recount.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Callable, Iterable, NamedTuple, Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+_ALL = "__all__"
+
+
+class JobSummary(NamedTuple):
+    advisor_id: Optional[str]
+    status: str
+    risk_level: str
+    is_today: bool
+
+
+Groups = Iterable[tuple[JobSummary, int]]
+
+
+def tally(groups: Groups) -> dict:
+    """Fold (summary, count) groups into the dashboard KPIs."""
+    kpis = {"open_jobs": 0, "pending_approval": 0, "in_progress": 0, "completed_today": 0, "at_risk": 0}
+    for summary, n in groups:
+        status = summary.status
+        if status not in ("completed", "closed"):
+            kpis["open_jobs"] += n
+        if status == "pending_approval":
+            kpis["pending_approval"] += n
+        elif status == "in_progress":
+            kpis["in_progress"] += n
+        elif status == "completed" and summary.is_today:
+            kpis["completed_today"] += n
+        if summary.risk_level == "high":
+            kpis["at_risk"] += n
+    return kpis
+
+
+def _utc_day() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+class DashboardCounters:
+    def __init__(
+        self,
+        recount: Callable[[], Groups],
+        interval: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        day: Callable[[], str] = _utc_day,
+    ) -> None:
+        self._recount = recount
+        self._interval = interval
+        self._clock = clock
+        self._day_fn = day
+        self._lock = threading.Lock()
+        self._counts: dict[str, Counter] = {}
+        self._day = day()
+        self._reconciled_at: Optional[float] = None
+        self._deltas = 0
+        self._reconciles = 0
+        self._last_drift = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._interval > 0
+
+    # ── writes ───────────────────────────────────────────────────────────────
+
+    def apply(self, old: Optional[JobSummary], new: Optional[JobSummary]) -> None:
+        """Move one job card from ``old`` to ``new`` (None for create/delete)."""
+        if not self.enabled or old == new:
+            return
+        with self._lock:
+            if self._reconciled_at is None:
+                return  # nothing counted yet; the first read recounts
+            self._roll_day()
+            if old is not None:
+                self._add(old, -1)
+            if new is not None:
+                self._add(new, 1)
+            self._deltas += 1
+
+    def invalidate(self) -> None:
+        """Recount on the next read (after bulk writes that skipped ``apply``)."""
+        with self._lock:
+            self._reconciled_at = None
+
+    def _add(self, summary: JobSummary, n: int) -> None:
+        for bucket in (_ALL, summary.advisor_id):
+            counter = self._counts.setdefault(bucket, Counter())
+            counter[summary] += n
+            if not counter[summary]:
+                del counter[summary]
+
+    def _roll_day(self) -> None:
+        """At midnight (UTC) nothing is "created today" any more."""
+        day = self._day_fn()
+        if day == self._day:
+            return
+        self._day = day
+        for bucket, counter in self._counts.items():
+            rolled: Counter = Counter()
+            for summary, n in counter.items():
+                rolled[summary._replace(is_today=False)] += n
+            self._counts[bucket] = rolled
+
+    # ── reads ────────────────────────────────────────────────────────────────
+
+    def kpis(self, advisor_id: Optional[str] = None) -> dict:
+        self._ensure_fresh()
+        with self._lock:
+            self._roll_day()
+            counter = self._counts.get(_ALL if advisor_id is None else advisor_id)
+            return tally(counter.items() if counter else ())
+
+    def _ensure_fresh(self) -> None:
+        reconciled_at = self._reconciled_at
+        if reconciled_at is None or self._clock() - reconciled_at >= self._interval:
+            self.reconcile()
+
+    def _full_recount(self) -> dict[str, Counter]:
+        counts: dict[str, Counter] = {}
+        for summary, n in self._recount():
+            for bucket in (_ALL, summary.advisor_id):
+                counts.setdefault(bucket, Counter())[summary] += n
+        return counts
+
+    def reconcile(self) -> int:
+        """Replace the counters with a full recount; returns how many cells drifted."""
+        try:
+            counts = self._full_recount()
+        except Exception as exc:
+            logger.warning(f"  Dashboard counter recount failed: {exc}")
+            return 0
+        with self._lock:
+            drifted = len(self._diff(self._counts, counts)) if self._reconciled_at is not None else 0
+            self._counts = counts
+            self._day = self._day_fn()
+            self._reconciled_at = self._clock()
+            self._reconciles += 1
+            self._last_drift = drifted
+        if drifted:
+            logger.warning(f"  Dashboard counters drifted in {drifted} cell(s); reconciled")
+        return drifted
+
+    def drift(self) -> dict:
+        """Compare the live counters with a fresh recount without replacing them."""
+        self._ensure_fresh()
+        actual = self._full_recount()
+        with self._lock:
+            self._roll_day()
+            diffs = self._diff(self._counts, actual)
+        return {
+            "in_sync": not diffs,
+            "cells": [
+                {
+                    "scope": "all" if bucket == _ALL else f"advisor:{bucket}",
+                    "status": summary.status,
+                    "risk_level": summary.risk_level,
+                    "is_today": summary.is_today,
+                    "counter": have,
+                    "actual": want,
+                }
+                for bucket, summary, have, want in diffs
+            ],
+        }
+
+    @staticmethod
+    def _diff(have: dict[str, Counter], want: dict[str, Counter]) -> list[tuple]:
+        diffs = []
+        for bucket in have.keys() | want.keys():
+            h, w = have.get(bucket, Counter()), want.get(bucket, Counter())
+            for summary in h.keys() | w.keys():
+                if h[summary] != w[summary]:
+                    diffs.append((bucket, summary, h[summary], w[summary]))
+        return diffs
+
+    def stats(self) -> dict:
+        with self._lock:
+            age = None if self._reconciled_at is None else round(self._clock() - self._reconciled_at, 1)
+            return {
+                "enabled": self.enabled,
+                "reconcile_interval_seconds": self._interval,
+                "seconds_since_reconcile": age,
+                "deltas_applied": self._deltas,
+                "reconciles": self._reconciles,
+                "last_drifted_cells": self._last_drift,
+            }
@@ -8,28 +8,80 @@ Column names match create_mvp_tables_v2.sql exactly:
   - Estimate_Line_Items has type (part|labor) + reference_id
 
 Fallback to synthetic JSON data is ONLY active when USE_JSON_FALLBACK=true in .env.
+DB_BACKEND=sqlite runs the same statements against a local SQLite file
+(app/infrastructure/sqlite_engine.py) for load tests and benchmarks.
 """
 from __future__ import annotations
 
 import json
 import logging
 import os
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from app.application.dashboard_counters import DashboardCounters, JobSummary, tally
+from app.application.job_card_record import (
+    JobCardRecord, parse_payload, records as job_card_records, split_csv as _split_csv, split_tasks,
+)
+from app.application.json_store import IndexedTable, field
+from app.application.raw_json import lazy_json
+from app.application.resource_versions import ResourceVersions
+from app.application.pagination import (
+    DEFAULT_PAGE_SIZE, decode_cursor, keyset_clause, page_from, paginate_rows, sql_cursor_value,
+)
+from app.application.vehicle_search import VehicleSearchIndex, normalize as normalize_vehicle_key
+from app.config.settings import (
+    get_dashboard_reconcile_seconds, get_db_backend, get_db_breaker_backoff, get_db_breaker_failures,
+    get_db_breaker_max_backoff, get_db_connect_timeout, get_db_pool_max_overflow, get_db_pool_pre_ping_idle,
+    get_db_pool_size, get_db_pool_timeout, get_etag_cache_ttl, get_etag_version_backend,
+    get_etag_version_sqlite_path, get_sqlite_path, get_sqlite_seed, get_vehicle_index_ttl, get_web_concurrency,
+    use_json_fallback,
+)
+from app.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.infrastructure.connection_pool import ConnectionPool
+from app.infrastructure.query_metrics import QUERY_METRICS, result_bytes
+from app.infrastructure.version_store import MemoryVersionStore, SqliteVersionStore, Version
 
 logger = logging.getLogger("uvicorn.error")
 
 # ─── Config ───────────────────────────────────────────────────────────────────
 
 def _use_json_fallback() -> bool:
-    return os.getenv("USE_JSON_FALLBACK", "false").lower() == "true"
+    return use_json_fallback()
 
 # ─── JSON fixture loader ──────────────────────────────────────────────────────
 
 _DATA_DIR = Path(__file__).parent.parent.parent.parent / "docs" / "backend" / "data"
-_json_store: dict[str, list[dict]] = {}
+_json_store: dict[str, IndexedTable] = {}
+
+def _lower_id(*names: str):
+    key = field(*names)
+    return lambda row: (str(key(row)).strip().lower() or None) if key(row) is not None else None
+
+# key → (fixture file, hash indexes, created_at key for the sorted index)
+_JSON_TABLES: dict[str, tuple] = {
+    "job_cards": ("job_cards.json", {
+        "id":            field("id"),
+        "customer_id":   _lower_id("customerId", "customer_id"),
+        "customer_name": field("customerName", "customer_name"),
+        "advisor_id":    field("advisorId", "advisor_id"),
+        "status":        field("status"),
+    }, field("createdAt")),
+    "estimates": ("estimates.json", {
+        "id":          field("id"),
+        "job_card_id": field("job_card_id"),
+        "status":      field("status"),
+    }, field("createdAt")),
+    "eli":       ("estimate_line_item.json", {"id": field("id"), "estimate_id": field("estimate_id")}, None),
+    "customers": ("customers.json", {"id": field("id"), "email": field("email")}, None),
+    "vehicles":  ("vehicles.json", {"id": field("id"), "customer_id": field("customer_id")}, None),
+    "emp":       ("employee.json", {"username": field("username"), "email": field("email")}, None),
+}
 
 def _load(filename: str) -> list[dict]:
     path = _DATA_DIR / filename
@@ -43,9 +95,10 @@ def _load(filename: str) -> list[dict]:
             logger.warning(f"  Could not parse {filename}: {exc} — using empty list")
     return []
 
-def _json(key: str, filename: str) -> list[dict]:
+def _json(key: str) -> IndexedTable:
     if key not in _json_store:
-        _json_store[key] = _load(filename)
+        filename, indexes, created_at = _JSON_TABLES[key]
+        _json_store[key] = IndexedTable(_load(filename), indexes, created_at)
     return _json_store[key]
 
 def _now() -> str:
@@ -62,7 +115,10 @@ _ODBC_DRIVERS = [
     "ODBC Driver 13 for SQL Server",
     "SQL Server",
 ]
-_conn = None
+_odbc_driver: Optional[str] = None
+_pool: Optional[ConnectionPool] = None
+_breaker: Optional[CircuitBreaker] = None
+_pool_lock = threading.Lock()
 
 def _parse_ado_parts() -> Optional[dict]:
     cs = os.getenv("AZURE_SQL_CONNECTION_STRING", "").strip()
@@ -90,34 +146,53 @@ def _build_odbc_str(driver: str) -> Optional[str]:
         f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};"
         f"UID={uid};PWD={pwd};"
         f"Encrypt={encrypt};TrustServerCertificate={trust};Connection Timeout=30;"
-        f"MARS_Connection=yes;"  # allow multiple active result sets on one connection
     )
 
+def _candidate_drivers(pyodbc) -> list[str]:
+    """The driver that last connected; until one has, every installed driver in preference order."""
+    if _odbc_driver is not None:
+        return [_odbc_driver]
+    installed = set(pyodbc.drivers())
+    return [d for d in _ODBC_DRIVERS if d in installed] or list(_ODBC_DRIVERS)
+
+def _use_sqlite() -> bool:
+    return get_db_backend() == "sqlite"
+
+def _sql_configured() -> bool:
+    return _use_sqlite() or bool(_parse_ado_parts())
+
+def _get_sqlite_conn():
+    try:
+        from app.infrastructure import sqlite_engine
+        return sqlite_engine.connect(get_sqlite_path(), seed=get_sqlite_seed())
+    except Exception as exc:
+        logger.warning(f"  SQLite error: {exc}")
+        return None
+
 def _get_conn():
-    global _conn
+    """Open a new autocommit connection (ODBC, or SQLite when DB_BACKEND=sqlite), or None if unreachable."""
+    if _use_sqlite():
+        return _get_sqlite_conn()
     if not _parse_ado_parts():
         return None
-    if _conn is not None:
-        try:
-            _conn.execute("SELECT 1")
-            return _conn
-        except Exception:
-            _conn = None
+    global _odbc_driver
     try:
         import pyodbc
-        for driver in _ODBC_DRIVERS:
-            odbc_str = _build_odbc_str(driver)
-            if not odbc_str:
-                continue
+        last_error: Optional[Exception] = None
+        for driver in _candidate_drivers(pyodbc):
             try:
-                c = pyodbc.connect(odbc_str, timeout=10)
-                c.autocommit = True
-                _conn = c
-                logger.info(f" Azure SQL connected via [{driver}]")
-                return _conn
-            except pyodbc.Error:
+                c = pyodbc.connect(_build_odbc_str(driver), timeout=get_db_connect_timeout())
+            except pyodbc.Error as exc:
+                last_error = exc
                 continue
-        logger.warning("  No suitable ODBC driver — install 'ODBC Driver 18' from https://aka.ms/odbc18")
+            c.autocommit = True
+            if _odbc_driver is None:
+                _odbc_driver = driver   # cache only a driver that has connected
+                logger.info(f" Azure SQL connected via [{driver}]")
+            return c
+        if _odbc_driver is None:
+            logger.warning("  No suitable ODBC driver — install 'ODBC Driver 18' from https://aka.ms/odbc18")
+        logger.warning(f"  Azure SQL error: {last_error}")
         return None
     except ImportError:
         logger.warning("  pyodbc not installed — pip install pyodbc")
@@ -126,64 +201,244 @@ def _get_conn():
         logger.warning(f"  Azure SQL error: {exc}")
         return None
 
+def _get_breaker() -> CircuitBreaker:
+    global _breaker
+    if _breaker is None:
+        with _pool_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker(
+                    "azure_sql",
+                    failure_threshold=get_db_breaker_failures(),
+                    base_backoff=get_db_breaker_backoff(),
+                    max_backoff=get_db_breaker_max_backoff(),
+                )
+    return _breaker
+
+def _connect():
+    breaker = _get_breaker()
+    if not breaker.allow():
+        raise CircuitOpenError("Azure SQL circuit is open — failing fast")
+    conn = _get_conn()
+    if conn is None:
+        breaker.record_failure("connect failed")
+        raise ConnectionError("Azure SQL is not reachable")
+    breaker.record_success()
+    return conn
+
+def _is_disconnect(exc: BaseException) -> bool:
+    try:
+        import pyodbc
+    except ImportError:
+        return False
+    return isinstance(exc, (pyodbc.OperationalError, pyodbc.InterfaceError))
+
+def _on_query_error(exc: BaseException) -> None:
+    """A dropped connection counts against the breaker and flushes idle connections."""
+    if _is_disconnect(exc):
+        _get_breaker().record_failure(exc)
+        if _pool is not None:
+            _pool.dispose()
+
+def _get_pool() -> Optional[ConnectionPool]:
+    global _pool
+    if not _sql_configured():
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _connect,
+                    size=get_db_pool_size(),
+                    max_overflow=get_db_pool_max_overflow(),
+                    timeout=get_db_pool_timeout(),
+                    pre_ping_idle=get_db_pool_pre_ping_idle(),
+                    is_disconnect=_is_disconnect,
+                )
+    return _pool
+
 def _db_available() -> bool:
-    return _get_conn() is not None
+    """SQL is configured and the breaker would let a call through — no connection is checked out.
 
-def _sql_rows(query: str, params: tuple = ()) -> list[dict]:
-    conn = _get_conn()
-    if not conn:
-        return []
-    cur = None
+    The query's own checkout is what fails when the database is down; that
+    failure trips the breaker, which moves later calls onto the fallback.
+    """
+    return _get_pool() is not None and _get_breaker().would_allow()
+
+def warm_pool() -> bool:
+    """Open the first pooled connection (seeding a new SQLite file) ahead of the first request."""
+    pool = _get_pool()
+    if pool is None:
+        return False
     try:
-        cur = conn.cursor()
-        cur.execute(query, params)
-        cols = [d[0] for d in cur.description]
-        rows = [dict(zip(cols, row)) for row in cur.fetchall()]
-        return rows
+        with pool.connection():
+            return True
+    except CircuitOpenError:
+        return False
+    except Exception as exc:
+        logger.warning(f"  Azure SQL unavailable: {exc}")
+        return False
+
+def get_pool_stats() -> Optional[dict]:
+    return _pool.stats() if _pool is not None else None
+
+def get_breaker_state() -> Optional[dict]:
+    if not _sql_configured():
+        return None
+    return {**_get_breaker().snapshot(), "driver": "sqlite" if _use_sqlite() else _odbc_driver}
+
+def _sql_tuples(query: str, params: tuple = ()) -> tuple[list[str], list]:
+    """Column names and the driver's rows as fetched (no per-row dict); ([], []) on failure."""
+    pool = _get_pool()
+    if not pool:
+        return [], []
+    try:
+        with QUERY_METRICS.track(query, "db_service") as q, pool.connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute(query, params)
+                return [d[0] for d in cur.description], q.fetched(cur.fetchall())
+            finally:
+                try: cur.close()
+                except Exception: pass
     except Exception as exc:
+        _on_query_error(exc)
         logger.warning(f"  SQL query failed: {exc}")
-        return []
-    finally:
-        if cur:
-            try: cur.close()
-            except Exception: pass
+        return [], []
+
+def _sql_rows(query: str, params: tuple = ()) -> list[dict]:
+    cols, rows = _sql_tuples(query, params)
+    return [dict(zip(cols, row)) for row in rows]
 
 def _sql_exec(query: str, params: tuple = ()) -> bool:
-    conn = _get_conn()
-    if not conn:
+    pool = _get_pool()
+    if not pool:
         return False
     try:
-        conn.execute(query, params)
+        with QUERY_METRICS.track(query, "db_service"), pool.connection() as conn:
+            conn.execute(query, params)
         return True
     except Exception as exc:
+        _on_query_error(exc)
         logger.warning(f"  SQL exec failed: {exc}")
         return False
 
+def _run_batch(pool: ConnectionPool, statements: list[tuple[str, tuple]]) -> list[list[dict]]:
+    batch = "SET NOCOUNT ON;\n" + ";\n".join(q for q, _ in statements) + ";"
+    params = tuple(p for _, ps in statements for p in ps)
+    with QUERY_METRICS.track(batch, "db_service") as q, pool.connection() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute(batch, params)
+            results: list[list[dict]] = []
+            while True:
+                if cur.description is not None:
+                    cols = [d[0] for d in cur.description]
+                    results.append(q.fetched([dict(zip(cols, row)) for row in cur.fetchall()]))
+                if not cur.nextset():
+                    break
+            return results + [[] for _ in range(len(statements) - len(results))]
+        finally:
+            try: cur.close()
+            except Exception: pass
+
+def _sql_batch(statements: list[tuple[str, tuple]]) -> list[list[dict]]:
+    """Run several SELECTs in one round trip; one row list per statement ([] each on failure).
+
+    On SQLite the cursor replays the statements one by one behind ``nextset()``.
+    """
+    pool = _get_pool()
+    if not pool:
+        return [[] for _ in statements]
+    try:
+        return _run_batch(pool, statements)
+    except Exception as exc:
+        _on_query_error(exc)
+        logger.warning(f"  SQL batch failed: {exc}")
+        return [[] for _ in statements]
+
+def _sql_write(statements: list[tuple[str, tuple]]) -> Optional[list[list[dict]]]:
+    """Run write statements with ``OUTPUT`` clauses (plus any SELECTs) in one round trip.
+
+    Returns one row list per statement, or None if the batch failed.
+    """
+    pool = _get_pool()
+    if not pool:
+        return None
+    try:
+        return _run_batch(pool, statements)
+    except Exception as exc:
+        _on_query_error(exc)
+        logger.warning(f"  SQL write failed: {exc}")
+        return None
+
+@contextmanager
+def _sql_transaction(pool: ConnectionPool):
+    """Cursor on one pooled connection inside a transaction.
+
+    Commits when the block exits normally, rolls back if it raises; the
+    connection goes back to the pool in autocommit mode either way.
+    """
+    with pool.connection() as conn:
+        conn.autocommit = False
+        cur = conn.cursor()
+        try:
+            yield cur
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            try: cur.close()
+            except Exception: pass
+            conn.autocommit = True
+
+def _output(prefix: str, columns: str) -> str:
+    """``"a, b"`` → ``"INSERTED.a, INSERTED.b"`` for an OUTPUT clause."""
+    return ", ".join(f"{prefix}.{c.strip()}" for c in columns.split(","))
+
+def _keyset_where(where: list[str], params: list, cursor: Optional[str]) -> tuple[str, tuple]:
+    where, params = list(where), list(params)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        clause, extra = keyset_clause(sql_cursor_value(created_at), row_id)
+        where.append(clause); params.extend(extra)
+    return ("WHERE " + " AND ".join(where)) if where else "", tuple(params)
+
+def _sql_page(
+    table: str, where: list[str], params: list, limit: int, cursor: Optional[str], columns: str = "*"
+) -> tuple[list[dict], Optional[str]]:
+    """Keyset page of raw rows, newest first; fetches ``limit + 1`` to detect a next page."""
+    clause, params = _keyset_where(where, params, cursor)
+    rows = _sql_rows(
+        f"SELECT TOP {int(limit) + 1} {columns} FROM {table} {clause} ORDER BY created_at DESC, id DESC",
+        params,
+    )
+    return page_from(rows, limit, lambda r: (r.get("created_at"), r.get("id")))
+
 # ─── Column mappers (v2 schema) ───────────────────────────────────────────────
 
-def _split_csv(v) -> list:
-    """Turn a comma-separated string or list into a list."""
-    if not v:
-        return []
-    if isinstance(v, list):
-        return v
-    return [x.strip() for x in str(v).split(",") if x.strip()]
+def _map_job_deferred(row: dict) -> dict:
+    """Map whichever deferred column groups the row was selected with."""
+    out: dict = {}
+    if "obd_report_text" in row or "obd_report_summary" in row:
+        out["obdReportText"] = row.get("obd_report_text")
+        out["obdReportSummary"] = row.get("obd_report_summary")
+    if "tasks" in row:
+        out["tasks"] = split_tasks(row.get("tasks"))
+    if "intake_payload_json" in row:
+        out["intakePayloadJson"] = parse_payload(row.get("intake_payload_json"))
+    return out
 
 def _map_job(row: dict) -> dict:
-    """Map v2 Job_Cards row → internal dict (camelCase for FE compatibility)."""
+    """Map v2 Job_Cards row → internal dict (camelCase for FE compatibility).
+
+    Deferred fields (OBD report text, tasks, intake payload) are only present
+    when their columns were selected; see ``load_deferred_columns``.
+    """
     status_raw = row.get("status", "draft")
     status = status_raw
     if isinstance(status_raw, str):
         status = status_raw.strip().lower()
-    tasks_raw = row.get("tasks")
-    payload_raw = row.get("intake_payload_json")
-    tasks = [t.strip() for t in str(tasks_raw or "").splitlines() if t and t.strip()]
-    intake_payload = None
-    if payload_raw:
-        try:
-            intake_payload = json.loads(payload_raw) if isinstance(payload_raw, str) else payload_raw
-        except Exception:
-            intake_payload = None
 
     return {
         "id":             row.get("id", ""),
@@ -201,25 +456,14 @@ def _map_job(row: dict) -> dict:
         "riskIndicators": _split_csv(row.get("risk_indicators")),
         "obdFaultCodes":  _split_csv(row.get("obd_fault_codes")),
         "obdDocumentId":  row.get("obd_document_id"),
-        "obdReportText":  row.get("obd_report_text"),
-        "obdReportSummary": row.get("obd_report_summary"),
-        "tasks":          tasks,
-        "intakePayloadJson": intake_payload,
         "vehicleId":      row.get("vehicle_id"),
         "advisorId":      row.get("advisor_id"),
+        **_map_job_deferred(row),
     }
 
 def _map_est(row: dict) -> dict:
-    estimation_json_raw = row.get("estimation_json")
-    estimation_json = None
-    if estimation_json_raw:
-        if isinstance(estimation_json_raw, (dict, list)):
-            estimation_json = estimation_json_raw
-        elif isinstance(estimation_json_raw, str):
-            try:
-                estimation_json = json.loads(estimation_json_raw)
-            except Exception:
-                estimation_json = estimation_json_raw
+    # Lazily parsed: listings splice the stored text into the response as is.
+    estimation_json = lazy_json(row.get("estimation_json"), keep_invalid=True)
 
     return {
         "id":          row.get("id", ""),
@@ -258,51 +502,207 @@ def _map_vehicle(row: dict) -> dict:
         "vin":                 row.get("vin"),
     }
 
-# Job_Cards SELECT — uses v2 column names
-_JC_SELECT = "SELECT * FROM Job_Cards"
+# Job_Cards column groups — list views select only "summary"; the large text
+# columns are deferred and loaded on demand (detail route, agents).
+_JC_COLUMN_GROUPS: dict[str, tuple[str, ...]] = {
+    "summary": (
+        "id", "created_at", "status", "customer_name", "customer_id", "vehicle_id",
+        "vehicle_make", "vehicle_model", "vehicle_year", "vin", "mileage", "complaint",
+        "service_type", "risk_indicators", "obd_fault_codes", "obd_document_id", "advisor_id",
+    ),
+    "obd":    ("obd_report_text", "obd_report_summary"),
+    "tasks":  ("tasks",),
+    "intake": ("intake_payload_json",),
+}
+JC_DEFERRED_GROUPS = ("obd", "tasks", "intake")
+
+def _check_groups(groups) -> tuple[str, ...]:
+    groups = tuple(dict.fromkeys(groups or ()))
+    unknown = [g for g in groups if g not in JC_DEFERRED_GROUPS]
+    if unknown:
+        raise ValueError(f"Unknown job card column group(s): {', '.join(unknown)}")
+    return groups
+
+def _jc_columns(groups=()) -> str:
+    cols = list(_JC_COLUMN_GROUPS["summary"])
+    for group in groups:
+        cols.extend(_JC_COLUMN_GROUPS[group])
+    return ", ".join(cols)
+
+# Job_Cards SELECT — summary columns only (v2 column names)
+_JC_SELECT = f"SELECT {_jc_columns()} FROM Job_Cards"
+
+# Writes hand the full row back in the same statement; updates also return the
+# pre-update counter bucket for the dashboard counters.
+_JC_OUTPUT = _output("INSERTED", _jc_columns(JC_DEFERRED_GROUPS))
+_JC_OLD_SUMMARY = (
+    "DELETED.advisor_id AS old_advisor_id, DELETED.status AS old_status, "
+    "DELETED.risk_indicators AS old_risk_indicators, DELETED.created_at AS old_created_at"
+)
+
+# ─── Resource versions (ETags) ────────────────────────────────────────────────
+
+# Resources the API serves conditionally; see app/api/conditional.py.
+JOB_CARD, ESTIMATE_FOR_JOB, CUSTOMER_JOBS = "job_card", "estimate_job", "customer_jobs"
+
+def _version_store():
+    """Where resource versions live: per process, or a SQLite file every worker shares."""
+    backend = get_etag_version_backend()
+    if backend == "sqlite":
+        return SqliteVersionStore(get_etag_version_sqlite_path())
+    if backend != "memory":
+        logger.warning(f"  Unknown ETAG_VERSION_BACKEND {backend!r} — using in-process versions")
+    return MemoryVersionStore()
+
+_versions = ResourceVersions(ttl=get_etag_cache_ttl(), store=_version_store())
+
+def cached_etag(kind: str, key: str, variant: str = "") -> Optional[str]:
+    return _versions.get(kind, key, variant)
+
+def etag_token(kind: str, key: str) -> Optional[Version]:
+    return _versions.token(kind, key)
+
+def remember_etag(kind: str, key: str, etag: str, token: Optional[Version], variant: str = "") -> None:
+    _versions.remember(kind, key, etag, token, variant)
+
+def get_etag_cache_stats() -> dict:
+    return _versions.stats()
+
+def _job_card_changed(job_id: Optional[str], customer_id: Optional[str] = None) -> None:
+    if job_id:
+        _versions.bump(JOB_CARD, job_id)
+    # Without the owner every customer's job list is suspect.
+    _versions.bump(CUSTOMER_JOBS, customer_id or None)
+
+def repository_write(entity: str, params: dict) -> None:
+    """SqlRepository (the agent tools) wrote ``entity`` — drop what the write made stale."""
+    if entity == "update_job_card_status":
+        _job_card_changed(params.get("job_card_id"))
+        _counters.invalidate()   # the old status is unknown here; recount on the next read
 
 # ─── Job Cards ────────────────────────────────────────────────────────────────
 
+def _job_card_where(
+    status: Optional[str], advisor_id: Optional[str], customer_id: Optional[str]
+) -> tuple[list[str], list]:
+    where, params = [], []
+    if status:
+        where.append("status = ?"); params.append(status)
+    if advisor_id:
+        where.append("advisor_id = ?"); params.append(advisor_id)
+    if customer_id:
+        where.append("customer_id = ?"); params.append(customer_id)
+    return where, params
+
+def _filter_json_job_cards(
+    status: Optional[str], advisor_id: Optional[str], customer_id: Optional[str]
+) -> list[dict]:
+    criteria = {}
+    if status:
+        criteria["status"] = status
+    if advisor_id:
+        criteria["advisor_id"] = advisor_id
+    if customer_id:
+        criteria["customer_id"] = str(customer_id).strip().lower()
+    return _json("job_cards").where(**criteria)
+
+def _newest_first(rows: Optional[list[dict]] = None) -> list[dict]:
+    """Job cards newest first; walks the sorted created_at index when ``rows`` is None."""
+    return _json("job_cards").newest_first(rows)
+
 def list_job_cards(
     status: Optional[str] = None,
     advisor_id: Optional[str] = None,
     customer_id: Optional[str] = None,
 ) -> list[dict]:
     if _db_available():
-        where, params = [], []
-        if status:
-            where.append("status = ?"); params.append(status)
-        if advisor_id:
-            where.append("advisor_id = ?"); params.append(advisor_id)
-        if customer_id:
-            where.append("customer_id = ?"); params.append(customer_id)
+        where, params = _job_card_where(status, advisor_id, customer_id)
         clause = ("WHERE " + " AND ".join(where)) if where else ""
-        rows = _sql_rows(f"{_JC_SELECT} {clause} ORDER BY created_at DESC", tuple(params))
+        rows = _sql_rows(f"{_JC_SELECT} {clause} ORDER BY created_at DESC, id DESC", tuple(params))
         return [_map_job(r) for r in rows]
 
     if _use_json_fallback():
-        jcs = list(_json("job_cards", "job_cards.json"))
-        if status:
-            jcs = [j for j in jcs if j.get("status") == status]
-        if advisor_id:
-            jcs = [j for j in jcs if j.get("advisorId") == advisor_id]
-        if customer_id:
-            normalized_customer_id = str(customer_id).strip().lower()
-            jcs = [
-                j
-                for j in jcs
-                if str(j.get("customerId", "")).strip().lower() == normalized_customer_id
-            ]
-        return sorted(jcs, key=lambda j: j.get("createdAt", ""), reverse=True)
+        if not (status or advisor_id or customer_id):
+            return _newest_first()
+        return _newest_first(_filter_json_job_cards(status, advisor_id, customer_id))
     return []
 
-def get_job_card(job_id: str) -> Optional[dict]:
+def list_job_card_records(
+    status: Optional[str] = None,
+    advisor_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    include=(),
+) -> list:
+    """``list_job_cards`` for routes that render rows straight to the API shape.
+
+    From SQL the rows are ``JobCardRecord``s (summary columns plus the deferred
+    groups in ``include``, one query); from the JSON fallback, fixture dicts.
+    """
+    groups = _check_groups(include)
+    if _db_available():
+        where, params = _job_card_where(status, advisor_id, customer_id)
+        clause = ("WHERE " + " AND ".join(where)) if where else ""
+        return job_card_records(*_sql_tuples(
+            f"SELECT {_jc_columns(groups)} FROM Job_Cards {clause} ORDER BY created_at DESC, id DESC", tuple(params)
+        ))
+    return list_job_cards(status, advisor_id, customer_id)
+
+def list_job_cards_page(
+    status: Optional[str] = None,
+    advisor_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include=(),
+) -> tuple[list, Optional[str]]:
+    """One keyset page of job cards (newest first) and the cursor for the next page.
+
+    Rows are as for ``list_job_card_records``.
+    """
+    groups = _check_groups(include)
     if _db_available():
-        rows = _sql_rows(f"{_JC_SELECT} WHERE id = ?", (job_id,))
+        where, params = _job_card_where(status, advisor_id, customer_id)
+        clause, params = _keyset_where(where, params, cursor)
+        rows = job_card_records(*_sql_tuples(
+            f"SELECT TOP {int(limit) + 1} {_jc_columns(groups)} FROM Job_Cards {clause} "
+            "ORDER BY created_at DESC, id DESC",
+            params,
+        ))
+        return page_from(rows, limit, JobCardRecord.cursor_key)
+
+    if _use_json_fallback():
+        return paginate_rows(_filter_json_job_cards(status, advisor_id, customer_id), limit, cursor)
+    return [], None
+
+def get_job_card(job_id: str, include=JC_DEFERRED_GROUPS) -> Optional[dict]:
+    """One job card with the summary columns plus the deferred groups in ``include``."""
+    if _db_available():
+        rows = _sql_rows(f"SELECT {_jc_columns(_check_groups(include))} FROM Job_Cards WHERE id = ?", (job_id,))
         return _map_job(rows[0]) if rows else None
     if _use_json_fallback():
-        return next((j for j in _json("job_cards", "job_cards.json") if j["id"] == job_id), None)
+        return _json("job_cards").get(job_id)
     return None
+
+def load_deferred_columns(jobs: list[dict], include=JC_DEFERRED_GROUPS) -> list[dict]:
+    """Fill deferred column groups into already-mapped job cards, one query per 500 ids."""
+    groups = _check_groups(include)
+    if not groups or not jobs or not _db_available():
+        return jobs
+    cols = [c for g in groups for c in _JC_COLUMN_GROUPS[g]]
+    by_id = {j.get("id"): j for j in jobs if j.get("id")}
+    ids = list(by_id)
+    for lo in range(0, len(ids), 500):
+        chunk = ids[lo:lo + 500]
+        rows = _sql_rows(
+            f"SELECT id, {', '.join(cols)} FROM Job_Cards WHERE id IN ({','.join('?' * len(chunk))})",
+            tuple(chunk),
+        )
+        for row in rows:
+            job = by_id.get(row.get("id"))
+            if job is not None:
+                job.update(_map_job_deferred(row))
+    return jobs
+
 def get_job_card_for_customer(job_id: str, customer_id: str) -> Optional[dict]:
     jc = get_job_card(job_id)
     if not jc:
@@ -358,12 +758,13 @@ def create_job_card(data: dict) -> dict:
             intake_payload_str = None
 
     if _db_available():
-        ok = _sql_exec(
-            """INSERT INTO Job_Cards
+        written = _sql_write([(
+            f"""INSERT INTO Job_Cards
                (id, created_at, status, customer_name, vehicle_make, vehicle_model, vehicle_year,
                 vin, mileage, complaint, service_type, risk_indicators, obd_fault_codes,
                 obd_document_id, obd_report_text, obd_report_summary, tasks, intake_payload_json,
                 customer_id, vehicle_id, advisor_id)
+               OUTPUT {_JC_OUTPUT}
                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
             (jc_id, now, "draft",
              data.get("customer_name"), data.get("vehicle_make"), data.get("vehicle_model"),
@@ -372,11 +773,12 @@ def create_job_card(data: dict) -> dict:
              risk_str, obd_str, data.get("obd_document_id"), data.get("obd_report_text"),
              data.get("obd_report_summary"), tasks_str, intake_payload_str,
              data.get("customer_id"), data.get("vehicle_id"), data.get("advisor_id"))
-        )
-        if ok:
-            fetched = get_job_card(jc_id)
-            if fetched:
-                return fetched
+        )])
+        if written and written[0]:
+            created = _map_job(written[0][0])
+            _counters.apply(None, _summary_of(created))
+            _job_card_changed(jc_id, data.get("customer_id"))
+            return created
     # In-memory fallback
     jc = {
         **data, "id": jc_id, "createdAt": now, "status": "draft",
@@ -388,7 +790,9 @@ def create_job_card(data: dict) -> dict:
         "intake_payload_json": intake_payload,
     }
     if _use_json_fallback():
-        _json("job_cards", "job_cards.json").append(jc)
+        _json("job_cards").insert(jc)
+        _counters.apply(None, _summary_of(jc))
+        _job_card_changed(jc_id, data.get("customer_id"))
     return jc
 
 def update_job_card(job_id: str, data: dict) -> Optional[dict]:
@@ -405,15 +809,36 @@ def update_job_card(job_id: str, data: dict) -> Optional[dict]:
             if val is not None:
                 sets.append(f"{col} = ?")
                 params.append(",".join(val) if isinstance(val, list) else val)
-        if sets:
-            params.append(job_id)
-            _sql_exec(f"UPDATE Job_Cards SET {', '.join(sets)} WHERE id = ?", tuple(params))
-        return get_job_card(job_id)
+        if not sets:
+            return get_job_card(job_id)
+        params.append(job_id)
+        written = _sql_write([(
+            f"UPDATE Job_Cards SET {', '.join(sets)} OUTPUT {_JC_OLD_SUMMARY}, {_JC_OUTPUT} WHERE id = ?",
+            tuple(params),
+        )])
+        if written is None:
+            _job_card_changed(job_id)
+            return get_job_card(job_id)
+        if not written[0]:
+            return None
+        row = written[0][0]
+        jc = _map_job(row)
+        _job_card_changed(job_id, jc.get("customerId"))
+        _track_job_change(
+            _job_summary(row.get("old_advisor_id"), row.get("old_status"),
+                         row.get("old_risk_indicators"), row.get("old_created_at")),
+            jc,
+        )
+        return jc
     if _use_json_fallback():
-        for jc in _json("job_cards", "job_cards.json"):
-            if jc["id"] == job_id:
-                jc.update({k: v for k, v in data.items() if v is not None})
-                return jc
+        table = _json("job_cards")
+        jc = table.get(job_id)
+        if jc:
+            old = _summary_of(jc)
+            table.update(jc, {k: v for k, v in data.items() if v is not None})
+            _track_job_change(old, jc)
+            _job_card_changed(job_id, jc.get("customerId") or jc.get("customer_id"))
+            return jc
     return None
 
 def update_job_card_status(job_id: str, status: str) -> Optional[dict]:
@@ -424,19 +849,45 @@ def delete_job_card(job_id: str) -> bool:
 
 # ─── Estimates ────────────────────────────────────────────────────────────────
 
+_EST_ORDER = "ORDER BY created_at DESC, id DESC"
+_EST_WITH_JOB = ["job_card_id IS NOT NULL", "job_card_id <> ''"]
+
+def _attach_line_items(estimates: list[dict], items: list[dict]) -> list[dict]:
+    """Group line items onto their estimates in one pass."""
+    slots: dict = {}
+    for est in estimates:
+        est["lineItems"] = []
+        slots[est.get("id")] = est["lineItems"]
+    for item in items:
+        slot = slots.get(item.get("estimate_id"))
+        if slot is not None:
+            slot.append(item)
+    return estimates
+
+def _sql_estimates(
+    where: str, params: tuple, top: Optional[int] = None, with_items: bool = True
+) -> list[dict]:
+    """Estimates matching ``where`` plus their line items — two result sets, one round trip."""
+    top_sql = f"TOP {int(top)} " if top else ""
+    est_sql = f"SELECT {top_sql}* FROM Estimates {where} {_EST_ORDER}"
+    if not with_items:
+        return [_map_est(r) for r in _sql_rows(est_sql, params)]
+    ids_sql = f"SELECT {top_sql}id FROM Estimates {where} {_EST_ORDER if top else ''}"
+    est_rows, item_rows = _sql_batch([
+        (est_sql, params),
+        (f"SELECT * FROM Estimate_Line_Items WHERE estimate_id IN ({ids_sql}) ORDER BY estimate_id, id", params),
+    ])
+    return _attach_line_items([_map_est(r) for r in est_rows], item_rows)
+
 def get_estimate_by_job(job_card_id: str) -> Optional[dict]:
     if _db_available():
-        rows = _sql_rows("SELECT * FROM Estimates WHERE job_card_id = ?", (job_card_id,))
-        if rows:
-            est = _map_est(rows[0])
-            est["lineItems"] = _sql_rows(
-                "SELECT * FROM Estimate_Line_Items WHERE estimate_id = ?", (est["id"],)
-            )
-            return est
+        ests = _sql_estimates("WHERE job_card_id = ?", (job_card_id,), top=1)
+        if ests:
+            return ests[0]
     if _use_json_fallback():
-        est = next((e for e in _json("estimates", "estimates.json") if e.get("job_card_id") == job_card_id), None)
+        est = _json("estimates").first("job_card_id", job_card_id)
         if est:
-            est["lineItems"] = [li for li in _json("eli", "estimate_line_item.json") if li.get("estimate_id") == est.get("id")]
+            est["lineItems"] = _json("eli").find("estimate_id", est.get("id"))
         return est
     return None
 def get_estimate_by_job_for_customer(job_card_id: str, customer_id: str) -> Optional[dict]:
@@ -447,20 +898,105 @@ def get_estimate_by_job_for_customer(job_card_id: str, customer_id: str) -> Opti
 
 def get_estimate(estimate_id: str) -> Optional[dict]:
     if _db_available():
-        rows = _sql_rows("SELECT * FROM Estimates WHERE id = ?", (estimate_id,))
-        if rows:
-            est = _map_est(rows[0])
-            est["lineItems"] = _sql_rows(
-                "SELECT * FROM Estimate_Line_Items WHERE estimate_id = ?", (est["id"],)
-            )
-            return est
+        ests = _sql_estimates("WHERE id = ?", (estimate_id,))
+        if ests:
+            return ests[0]
     if _use_json_fallback():
-        est = next((e for e in _json("estimates", "estimates.json") if e["id"] == estimate_id), None)
+        est = _json("estimates").get(estimate_id)
         if est:
-            est["lineItems"] = [li for li in _json("eli", "estimate_line_item.json") if li.get("estimate_id") == estimate_id]
+            est["lineItems"] = _json("eli").find("estimate_id", estimate_id)
         return est
     return None
 
+_ELI_COLUMNS = ("id", "estimate_id", "type", "reference_id", "quantity", "unit_price", "total")
+
+# The job's current estimate (its latest); the range lock makes a concurrent
+# upsert for the same job wait here until this transaction commits.
+_LATEST_ESTIMATE = (
+    "SELECT TOP 1 id FROM Estimates WITH (UPDLOCK, HOLDLOCK) "
+    "WHERE job_card_id = ? ORDER BY created_at DESC, id DESC"
+)
+
+_ESTIMATE_MERGE = """
+MERGE Estimates WITH (HOLDLOCK) AS target
+USING (SELECT ? AS id, ? AS job_card_id) AS source
+ON target.id = source.id
+WHEN MATCHED THEN
+    UPDATE SET parts_total = ?, labor_total = ?, tax = ?, grand_total = ?, estimation_json = ?
+WHEN NOT MATCHED THEN
+    INSERT (id, job_card_id, status, parts_total, labor_total, tax, grand_total, estimation_json)
+    VALUES (source.id, source.job_card_id, 'pending', ?, ?, ?, ?, ?)
+OUTPUT INSERTED.*"""
+
+def _number(value, default: float = 0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def _line_item_rows(estimate_id: str, items: list) -> list[dict]:
+    """Estimator ``line_items`` → Estimate_Line_Items rows with ids ``{estimate_id}-L01``, ``-L02``…"""
+    rows = []
+    for n, item in enumerate((i for i in items if isinstance(i, dict)), 1):
+        kind = str(item.get("type") or "part").lower()
+        quantity = _number(item.get("quantity"), 1)
+        unit_price = _number(item.get("unit_price", item.get("unitPrice")))
+        total = item.get("total")
+        rows.append({
+            "id": f"{estimate_id}-L{n:02d}",
+            "estimate_id": estimate_id,
+            "type": "labor" if kind == "labour" else kind,
+            "reference_id": item.get("reference_id") or item.get("referenceId"),
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "total": _number(total) if total is not None else round(quantity * unit_price, 2),
+        })
+    return rows
+
+def _sql_upsert_estimate(job_card_id: str, est: dict, estimation_json_str: Optional[str]) -> Optional[dict]:
+    """MERGE the estimate header and replace its line items in one transaction.
+
+    Only the job's latest estimate is updated (other estimates for the job
+    are left alone); with none, ``est["id"]`` is inserted.  The locked read of
+    that id keeps two concurrent estimates for the same job from both taking
+    the insert branch.  Returns the written estimate with its line items, or
+    None if the transaction failed and was rolled back.
+    """
+    pool = _get_pool()
+    if not pool:
+        return None
+    totals = (est["parts_total"], est["labor_total"], est["tax"], est["grand_total"], estimation_json_str)
+    try:
+        with QUERY_METRICS.track(_ESTIMATE_MERGE, "db_service"), _sql_transaction(pool) as cur:
+            cur.execute(_LATEST_ESTIMATE, (job_card_id,))
+            latest = cur.fetchone()
+            est_id = latest[0] if latest else est["id"]
+            cur.execute("SET NOCOUNT ON;\n" + _ESTIMATE_MERGE + ";", (est_id, job_card_id, *totals, *totals))
+            cols = [d[0] for d in cur.description]
+            est_rows = [dict(zip(cols, row)) for row in cur.fetchall()]
+            items = _line_item_rows(est_id, est["lineItems"])
+            cur.execute("DELETE FROM Estimate_Line_Items WHERE estimate_id = ?", (est_id,))
+            if items:
+                cur.fast_executemany = True
+                cur.executemany(
+                    f"INSERT INTO Estimate_Line_Items ({', '.join(_ELI_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_ELI_COLUMNS))})",
+                    [tuple(li[c] for c in _ELI_COLUMNS) for li in items],
+                )
+    except Exception as exc:
+        _on_query_error(exc)
+        logger.warning(f"  Estimate upsert failed: {exc}")
+        return None
+    if not est_rows:
+        return None
+    return _attach_line_items([_map_est(est_rows[0])], items)[0]
+
+def _replace_json_line_items(estimate_id: str, items: list) -> list[dict]:
+    table = _json("eli")
+    for stale in table.find("estimate_id", estimate_id):
+        table.delete(stale)
+    return [table.insert(row) for row in _line_item_rows(estimate_id, items)]
+
 def create_estimate(job_card_id: str, data: dict) -> dict:
     estimate_payload = data.get("estimate") if isinstance(data.get("estimate"), dict) else data
     estimation_json_obj = data.get("estimation_json")
@@ -472,7 +1008,7 @@ def create_estimate(job_card_id: str, data: dict) -> dict:
     except Exception:
         estimation_json_str = None
 
-    est_id = f"E{len(_json('estimates','estimates.json'))+1:03d}" if _use_json_fallback() else _new_id()
+    est_id = f"E{len(_json('estimates'))+1:03d}" if _use_json_fallback() else _new_id()
     now = _now()
     est = {
         "id": est_id,
@@ -487,80 +1023,79 @@ def create_estimate(job_card_id: str, data: dict) -> dict:
         "lineItems": estimate_payload.get("line_items") or estimate_payload.get("lineItems") or [],
     }
     if _db_available():
-        existing_rows = _sql_rows("SELECT id, status FROM Estimates WHERE job_card_id = ?", (job_card_id,))
-        if existing_rows:
-            existing_id = existing_rows[0].get("id")
-            existing_status = existing_rows[0].get("status") or "pending"
-            est["id"] = existing_id
-            est["status"] = existing_status
-            ok = _sql_exec(
-                """UPDATE Estimates
-                   SET parts_total = ?, labor_total = ?, tax = ?, grand_total = ?, estimation_json = ?
-                   WHERE id = ?""",
-                (est["parts_total"], est["labor_total"], est["tax"], est["grand_total"], estimation_json_str, existing_id)
-            )
-            if ok:
-                return get_estimate(existing_id) or est
-        else:
-            ok = _sql_exec(
-                """INSERT INTO Estimates (id, job_card_id, status, parts_total, labor_total, tax, grand_total, estimation_json)
-                   VALUES (?,?,?,?,?,?,?,?)""",
-                (est_id, job_card_id, "pending",
-                 est["parts_total"], est["labor_total"], est["tax"], est["grand_total"], estimation_json_str)
-            )
-            if ok:
-                return get_estimate(est_id) or est
+        written = _sql_upsert_estimate(job_card_id, est, estimation_json_str)
+        _versions.bump(ESTIMATE_FOR_JOB, job_card_id)
+        if written is not None:
+            return written
     if _use_json_fallback():
-        existing = next((e for e in _json("estimates", "estimates.json") if e.get("job_card_id") == job_card_id), None)
+        table = _json("estimates")
+        existing = table.first("job_card_id", job_card_id)
         if existing:
             existing_status = existing.get("status", "pending")
-            existing.update({
+            table.update(existing, {
                 "parts_total": est["parts_total"],
                 "labor_total": est["labor_total"],
                 "tax": est["tax"],
                 "grand_total": est["grand_total"],
                 "estimation_json": est["estimation_json"],
-                "lineItems": est["lineItems"],
+                "status": existing_status,
             })
-            existing["status"] = existing_status
+            existing["lineItems"] = _replace_json_line_items(existing["id"], est["lineItems"])
+            _versions.bump(ESTIMATE_FOR_JOB, job_card_id)
             return existing
-        _json("estimates", "estimates.json").append(est)
+        table.insert(est)
+        est["lineItems"] = _replace_json_line_items(est_id, est["lineItems"])
+        _versions.bump(ESTIMATE_FOR_JOB, job_card_id)
     return est
 
 def update_estimate_status(estimate_id: str, status: str) -> Optional[dict]:
     if _db_available():
-        _sql_exec("UPDATE Estimates SET status = ? WHERE id = ?", (status, estimate_id))
-        return get_estimate(estimate_id)
+        written = _sql_write([
+            ("UPDATE Estimates SET status = ? OUTPUT INSERTED.* WHERE id = ?", (status, estimate_id)),
+            ("SELECT * FROM Estimate_Line_Items WHERE estimate_id = ? ORDER BY id", (estimate_id,)),
+        ])
+        if written is None:
+            _versions.bump(ESTIMATE_FOR_JOB)
+            return get_estimate(estimate_id)
+        est_rows, items = written
+        if not est_rows:
+            return None
+        _versions.bump(ESTIMATE_FOR_JOB, est_rows[0].get("job_card_id"))
+        return _attach_line_items([_map_est(est_rows[0])], items)[0]
     if _use_json_fallback():
-        for est in _json("estimates", "estimates.json"):
-            if est["id"] == estimate_id:
-                est["status"] = status
-                return est
+        table = _json("estimates")
+        est = table.get(estimate_id)
+        if est:
+            table.update(est, {"status": status})
+            _versions.bump(ESTIMATE_FOR_JOB, est.get("job_card_id"))
+            return est
     return None
 
 # ─── Estimates ────────────────────────────────────────────────────────────────
 
-def get_all_estimates_with_job() -> list[dict]:
-    results = []
-
-    # SQL MODE
+def get_all_estimates_with_job(include_line_items: bool = False) -> list[dict]:
     if _db_available():
-        rows = _sql_rows("SELECT * FROM Estimates", ())
+        where = "WHERE " + " AND ".join(_EST_WITH_JOB)
+        return _sql_estimates(where, (), with_items=include_line_items)
 
-        for r in rows:
-            est = _map_est(r)
-
-            # # attach line items (same pattern you already use)
-            # est["lineItems"] = _sql_rows(
-            #     "SELECT * FROM Estimate_Line_Items WHERE estimate_id = ?",
-            #     (est["id"],)
-            # )
-
-            # Only include if estimate exists (extra safety)
-            if est.get("job_card_id"):
-                results.append(est)
+    if _use_json_fallback():
+        ests = [dict(e) for e in _json("estimates") if e.get("job_card_id")]
+        if include_line_items:
+            _attach_line_items(ests, list(_json("eli")))
+        return ests
+    return []
 
-        return results
+def list_estimates_page(
+    limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, include_line_items: bool = False
+) -> tuple[list[dict], Optional[str]]:
+    """One keyset page of estimates that belong to a job card, newest first."""
+    if _db_available():
+        where, params = _keyset_where(_EST_WITH_JOB, [], cursor)
+        ests = _sql_estimates(where, params, top=limit + 1, with_items=include_line_items)
+        return page_from(ests, limit, lambda e: (e.get("createdAt"), e.get("id")))
+    if _use_json_fallback():
+        return paginate_rows(get_all_estimates_with_job(include_line_items), limit, cursor)
+    return [], None
 
 # ─── Customers ────────────────────────────────────────────────────────────────
 
@@ -569,7 +1104,7 @@ def get_customer(customer_id: str) -> Optional[dict]:
         rows = _sql_rows("SELECT * FROM Customers WHERE id = ?", (customer_id,))
         return _map_customer(rows[0]) if rows else None
     if _use_json_fallback():
-        return next((c for c in _json("customers", "customers.json") if c["id"] == customer_id), None)
+        return _json("customers").get(customer_id)
     return None
 
 def list_customers() -> list[dict]:
@@ -577,7 +1112,7 @@ def list_customers() -> list[dict]:
         rows = _sql_rows("SELECT * FROM Customers ORDER BY name", ())
         return [_map_customer(r) for r in rows]
     if _use_json_fallback():
-        return list(_json("customers", "customers.json"))
+        return list(_json("customers"))
     return []
 
 def get_customer_vehicles(customer_id: str) -> list[dict]:
@@ -585,41 +1120,94 @@ def get_customer_vehicles(customer_id: str) -> list[dict]:
         rows = _sql_rows("SELECT * FROM Vehicles WHERE customer_id = ?", (customer_id,))
         return [_map_vehicle(r) for r in rows]
     if _use_json_fallback():
-        return [v for v in _json("vehicles", "vehicles.json") if v.get("customer_id") == customer_id]
+        return _json("vehicles").find("customer_id", customer_id)
     return []
 
-def search_vehicle_by_number(query: str) -> Optional[dict]:
-    """Search by VIN or registration_number (partial match). Returns vehicle + owner."""
+_VEHICLE_WITH_OWNER = (
+    "SELECT v.*, c.name AS customer_name, c.phone AS customer_phone, c.email AS customer_email "
+    "FROM Vehicles v JOIN Customers c ON c.id = v.customer_id"
+)
+
+def _vehicle_hit(row: dict, owner: Optional[dict] = None) -> dict:
+    """Vehicle plus owner contact, the shape vehicle search returns."""
+    owner = owner if owner is not None else {
+        "id": row.get("customer_id"), "name": row.get("customer_name"),
+        "phone": row.get("customer_phone"), "email": row.get("customer_email"),
+    }
+    return {"found": True, **_map_vehicle(row),
+            "customer_id":    owner.get("id"),
+            "customer_name":  owner.get("name"),
+            "customer_phone": owner.get("phone"),
+            "customer_email": owner.get("email")}
+
+def _vehicle_hits() -> list[dict]:
+    """Every vehicle with its owner — the search index loader."""
+    if _db_available():
+        return [_vehicle_hit(r) for r in _sql_rows(_VEHICLE_WITH_OWNER, ())]
+    if _use_json_fallback():
+        customers = _json("customers")
+        hits = []
+        for v in _json("vehicles"):
+            cust = customers.get(v.get("customer_id", ""))
+            if cust:
+                hits.append(_vehicle_hit(v, cust))
+        return hits
+    return []
+
+_vehicle_index = VehicleSearchIndex(_vehicle_hits, ttl=get_vehicle_index_ttl())
+
+def _index_vehicle(vehicle_id: str) -> Optional[dict]:
+    """Re-read one vehicle with its owner and refresh its search index entry."""
+    hit = None
+    if _db_available():
+        rows = _sql_rows(f"{_VEHICLE_WITH_OWNER} WHERE v.id = ?", (vehicle_id,))
+        hit = _vehicle_hit(rows[0]) if rows else None
+    elif _use_json_fallback():
+        v = _json("vehicles").get(vehicle_id)
+        cust = _json("customers").get(v.get("customer_id", "")) if v else None
+        hit = _vehicle_hit(v, cust) if cust else None
+    if hit is not None:
+        _vehicle_index.upsert(hit)
+    else:
+        _vehicle_index.remove(vehicle_id)
+    return hit
+
+def get_vehicle_search_stats() -> dict:
+    return _vehicle_index.stats()
+
+def search_vehicles(query: str, limit: int = 10) -> list[dict]:
+    """Vehicles whose VIN or registration number contains ``query``, best match first."""
+    hits = _vehicle_index.search(query, limit)
+    if hits or (hits is not None and not (normalize_vehicle_key(query) and _db_available())):
+        return hits
+    # Index disabled (VEHICLE_INDEX_TTL=0) or unavailable, or no hits — the index
+    # is per process, so a vehicle added on another worker is missing until the
+    # next rebuild: scan with LIKE, and index what it finds.
     q = query.strip().upper()
     if _db_available():
         rows = _sql_rows(
-            "SELECT v.*, c.name AS customer_name, c.phone AS customer_phone, c.email AS customer_email "
-            "FROM Vehicles v JOIN Customers c ON c.id = v.customer_id "
-            "WHERE UPPER(v.registration_number) LIKE ? OR UPPER(v.vin) LIKE ?",
+            f"SELECT TOP {int(limit)} * FROM ({_VEHICLE_WITH_OWNER} "
+            "WHERE UPPER(v.registration_number) LIKE ? OR UPPER(v.vin) LIKE ?) hits ORDER BY id",
             (f"%{q}%", f"%{q}%")
         )
-        if rows:
-            r = rows[0]
-            return {"found": True, **_map_vehicle(r),
-                    "customer_id":    r.get("customer_id"),
-                    "customer_name":  r.get("customer_name"),
-                    "customer_phone": r.get("customer_phone"),
-                    "customer_email": r.get("customer_email")}
+        found = [_vehicle_hit(r) for r in rows]
+        for hit in found:
+            _vehicle_index.upsert(hit)
+        return found
     if _use_json_fallback():
-        for v in _json("vehicles", "vehicles.json"):
-            reg = (v.get("registration_number") or "").upper()
-            vin = (v.get("vin") or "").upper()
-            if q in reg or q in vin:
-                cust = get_customer(v.get("customer_id", "")) or {}
-                return {"found": True, **_map_vehicle(v),
-                        "customer_id":    cust.get("id"),
-                        "customer_name":  cust.get("name"),
-                        "customer_phone": cust.get("phone"),
-                        "customer_email": cust.get("email")}
-    return {"found": False}
+        return [
+            h for h in _vehicle_hits()
+            if q in (h.get("registration_number") or "").upper() or q in (h.get("vin") or "").upper()
+        ][:limit]
+    return []
+
+def search_vehicle_by_number(query: str) -> Optional[dict]:
+    """Search by VIN or registration_number (partial match). Returns the best vehicle + owner."""
+    hits = search_vehicles(query, limit=1)
+    return hits[0] if hits else {"found": False}
 
 def add_vehicle(customer_id: str, data: dict) -> dict:
-    vid = f"V{len(_json('vehicles','vehicles.json'))+1:03d}" if _use_json_fallback() else _new_id()
+    vid = f"V{len(_json('vehicles'))+1:03d}" if _use_json_fallback() else _new_id()
     v = {"id": vid, "customer_id": customer_id, "make": data["make"],
          "model": data["model"], "year": data["year"],
          "fuel_type": data.get("fuel_type"), "transmission": data.get("transmission"),
@@ -632,86 +1220,361 @@ def add_vehicle(customer_id: str, data: dict) -> dict:
              v["fuel_type"], v["transmission"], v["registration_number"], v["vin"])
         )
         if ok:
+            if _vehicle_index.loaded:
+                _index_vehicle(vid)
             return v
     if _use_json_fallback():
-        _json("vehicles", "vehicles.json").append(v)
+        _json("vehicles").insert(v)
+        if _vehicle_index.loaded:
+            _index_vehicle(vid)
     return v
 
 def update_vehicle(vehicle_id: str, data: dict) -> Optional[dict]:
+    cols = ["make", "model", "year", "vin", "fuel_type", "transmission", "registration_number"]
+    changes = {col: data[col] for col in cols if col in data and data[col] is not None}
     if _db_available():
-        cols = ["make", "model", "year", "vin", "fuel_type", "transmission", "registration_number"]
         sets, params = [], []
-        for col in cols:
-            if col in data and data[col] is not None:
-                sets.append(f"{col} = ?"); params.append(data[col])
+        for col, val in changes.items():
+            sets.append(f"{col} = ?"); params.append(val)
         if sets:
             params.append(vehicle_id)
             _sql_exec(f"UPDATE Vehicles SET {', '.join(sets)} WHERE id = ?", tuple(params))
+        return _index_vehicle(vehicle_id)
+    if _use_json_fallback():
+        table = _json("vehicles")
+        v = table.get(vehicle_id)
+        if v:
+            table.update(v, changes)
+            _index_vehicle(vehicle_id)
+            return v
     return None
 
+def _json_customer_jobs(customer_id: str) -> list[dict]:
+    cust = get_customer(customer_id)
+    if not cust:
+        return []
+    name = cust.get("name", "")
+    return _json("job_cards").find("customer_name", name)
+
 def get_customer_history(customer_id: str) -> list[dict]:
     if _db_available():
-        rows = _sql_rows("SELECT * FROM Job_Cards WHERE customer_id = ? ORDER BY created_at DESC", (customer_id,))
+        rows = _sql_rows(
+            f"{_JC_SELECT} WHERE customer_id = ? ORDER BY created_at DESC, id DESC",
+            (customer_id,),
+        )
         return [_map_job(r) for r in rows]
     if _use_json_fallback():
-        cust = get_customer(customer_id)
-        if not cust:
-            return []
-        name = cust.get("name", "")
-        jobs = [j for j in _json("job_cards", "job_cards.json") if j.get("customerName") == name]
-        return sorted(jobs, key=lambda j: j.get("createdAt", ""), reverse=True)
+        return _newest_first(_json_customer_jobs(customer_id))
     return []
 
+def get_customer_history_page(
+    customer_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    if _db_available():
+        rows, next_cursor = _sql_page(
+            "Job_Cards", ["customer_id = ?"], [customer_id], limit, cursor, _jc_columns()
+        )
+        return [_map_job(r) for r in rows], next_cursor
+    if _use_json_fallback():
+        return paginate_rows(_json_customer_jobs(customer_id), limit, cursor)
+    return [], None
+
 def get_latest_job_card(customer_id: str) -> Optional[dict]:
     if _db_available():
         rows = _sql_rows(
-            "SELECT TOP 1 * FROM Job_Cards WHERE customer_id = ? ORDER BY created_at DESC",
+            f"SELECT TOP 1 {_jc_columns()} FROM Job_Cards WHERE customer_id = ? ORDER BY created_at DESC, id DESC",
             (customer_id,),
         )
         return _map_job(rows[0]) if rows else None
     if _use_json_fallback():
-        cust = get_customer(customer_id)
-        if not cust:
-            return None
-        name = cust.get("name", "")
-        jobs = [j for j in _json("job_cards", "job_cards.json") if j.get("customerName") == name]
-        jobs = sorted(jobs, key=lambda j: j.get("createdAt", ""), reverse=True)
+        jobs = _newest_first(_json_customer_jobs(customer_id))
         return jobs[0] if jobs else None
     return None
 
+# ─── Export ───────────────────────────────────────────────────────────────────
+
+# Rows per fetchmany(); also the size of the line item IN (...) list per batch,
+# which must stay under SQL Server's 2100 parameter limit.
+EXPORT_FETCH_SIZE = 500
+
+def _sql_stream(query: str, params: tuple = (), size: int = EXPORT_FETCH_SIZE) -> Iterator[tuple[list[str], list]]:
+    """``(column names, rows)`` for each ``fetchmany(size)`` batch, on one pooled connection.
+
+    The connection is held until the generator is exhausted or closed.  Unlike
+    ``_sql_rows`` a failure raises RuntimeError — an export must not end early
+    without saying so.  Only time spent in the driver is recorded as query time,
+    not the time the consumer takes between batches.
+    """
+    pool = _get_pool()
+    if not pool:
+        raise RuntimeError("No database configured for export")
+    elapsed, rows_read, nbytes, failed = 0.0, 0, 0, False
+    try:
+        with pool.connection() as conn:
+            cur = conn.cursor()
+            try:
+                start = time.perf_counter()
+                cur.execute(query, params)
+                cols = [d[0] for d in cur.description]
+                while True:
+                    rows = cur.fetchmany(size)
+                    elapsed += time.perf_counter() - start
+                    if not rows:
+                        return
+                    rows_read += len(rows)
+                    nbytes += result_bytes(rows)
+                    yield cols, rows
+                    start = time.perf_counter()
+            finally:
+                try: cur.close()
+                except Exception: pass
+    except Exception as exc:
+        failed = True
+        _on_query_error(exc)
+        logger.warning(f"  SQL export failed: {exc}")
+        raise RuntimeError(f"Export query failed: {exc}") from exc
+    finally:
+        QUERY_METRICS.observe(query, "db_service", elapsed, rows_read, nbytes, failed)
+
+def export_job_cards(
+    status: Optional[str] = None,
+    advisor_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    include=(),
+) -> Iterator[dict]:
+    """Every matching job card, newest first, as ``JobCardRecord``s built one fetch batch at a time."""
+    groups = _check_groups(include)
+    if _db_available():
+        where, params = _job_card_where(status, advisor_id, customer_id)
+        clause = ("WHERE " + " AND ".join(where)) if where else ""
+        query = f"SELECT {_jc_columns(groups)} FROM Job_Cards {clause} ORDER BY created_at DESC, id DESC"
+        for cols, rows in _sql_stream(query, tuple(params)):
+            yield from job_card_records(cols, rows)
+    elif _use_json_fallback():
+        yield from list_job_cards(status, advisor_id, customer_id)
+    else:
+        raise RuntimeError("No database configured for export")
+
+def export_estimates(include_line_items: bool = False) -> Iterator[dict]:
+    """Every estimate that belongs to a job card, newest first; line items are
+    fetched per batch of estimates rather than for the whole table."""
+    if _db_available():
+        where = "WHERE " + " AND ".join(_EST_WITH_JOB)
+        for cols, rows in _sql_stream(f"SELECT * FROM Estimates {where} {_EST_ORDER}"):
+            ests = [_map_est(dict(zip(cols, r))) for r in rows]
+            if include_line_items:
+                ids = tuple(e["id"] for e in ests)
+                item_sql = (
+                    f"SELECT * FROM Estimate_Line_Items WHERE estimate_id IN ({', '.join('?' * len(ids))}) "
+                    "ORDER BY estimate_id, id"
+                )
+                items = [dict(zip(c, r)) for c, batch in _sql_stream(item_sql, ids) for r in batch]
+                _attach_line_items(ests, items)
+            yield from ests
+    elif _use_json_fallback():
+        yield from get_all_estimates_with_job(include_line_items)
+    else:
+        raise RuntimeError("No database configured for export")
+
+# ─── Bulk import ──────────────────────────────────────────────────────────────
+
+# SQL table → (JSON fixture table, row → fixture-shaped dict)
+_JSON_IMPORT_TABLES = {
+    "Customers": ("customers", dict),
+    "Vehicles":  ("vehicles", dict),
+    "Job_Cards": ("job_cards", _map_job),
+}
+
+def _connection_lost(exc: BaseException) -> bool:
+    return isinstance(exc, ConnectionError) or _is_disconnect(exc)
+
+def _retry_rows(table: str, sql: str, rows: list[tuple], pool: ConnectionPool, exc: Exception) -> list[tuple[int, str]]:
+    """Replay a failed batch row by row; every row is rejected if the connection is gone."""
+    if _connection_lost(exc):
+        logger.warning(f"  Bulk insert into {table} failed ({exc}); batch rejected")
+        return [(i, str(exc)) for i in range(len(rows))]
+    logger.warning(f"  Bulk insert into {table} failed ({exc}); retrying row by row")
+    rejects = []
+    try:
+        with _sql_transaction(pool) as cur:
+            for i, row in enumerate(rows):
+                try:
+                    cur.execute(sql, row)
+                except Exception as row_exc:
+                    if _connection_lost(row_exc):
+                        raise
+                    rejects.append((i, str(row_exc)))
+    except Exception as retry_exc:
+        _on_query_error(retry_exc)
+        logger.warning(f"  Row-by-row insert into {table} failed ({retry_exc}); batch rejected")
+        return [(i, str(retry_exc)) for i in range(len(rows))]
+    return rejects
+
+def bulk_insert(table: str, columns: tuple[str, ...], rows: list[tuple]) -> tuple[int, list[tuple[int, str]]]:
+    """Insert ``rows`` into ``table`` as one transaction (pyodbc ``fast_executemany``).
+
+    If the batch fails as a whole it is rolled back and replayed row by row in a
+    second transaction, so a bad row only rejects itself.  If the connection is
+    lost (or the circuit breaker is open) nothing was written: every row is
+    rejected with that error instead.  Returns the number of rows inserted and
+    ``(index into rows, error)`` for each reject.
+    Raises RuntimeError when neither SQL nor the JSON fallback is available.
+    """
+    if not rows:
+        return 0, []
+    if _db_available():
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        pool = _get_pool()
+        try:
+            with QUERY_METRICS.track(sql, "db_service"), _sql_transaction(pool) as cur:
+                cur.fast_executemany = True
+                cur.executemany(sql, rows)
+            rejects = []
+        except Exception as exc:
+            _on_query_error(exc)
+            rejects = _retry_rows(table, sql, rows, pool, exc)
+    elif _use_json_fallback():
+        key, to_fixture = _JSON_IMPORT_TABLES[table]
+        store = _json(key)
+        rejects = []
+        for i, row in enumerate(rows):
+            record = dict(zip(columns, row))
+            if store.get(record.get("id")) is not None:
+                rejects.append((i, f"Duplicate id {record.get('id')}"))
+            else:
+                store.insert(to_fixture(record))
+    else:
+        raise RuntimeError("No database configured for import")
+    if table == "Vehicles":
+        _vehicle_index.invalidate()
+    elif table == "Job_Cards":
+        _counters.invalidate()
+        _versions.bump(JOB_CARD)
+        _versions.bump(CUSTOMER_JOBS)
+    return len(rows) - len(rejects), rejects
+
 # ─── Dashboard ────────────────────────────────────────────────────────────────
 
+_RISKY = {"high", "high engine temperature", "high brake risk"}
+
+def _risk_level(indicators) -> str:
+    indicators = [r.lower() for r in (indicators or [])]
+    if any(r in _RISKY for r in indicators): return "high"
+    if any("medium" in r for r in indicators): return "medium"
+    return "low"
+
+def _today_bounds() -> tuple[str, datetime, datetime]:
+    start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return start.date().isoformat(), start.replace(tzinfo=None), (start + timedelta(days=1)).replace(tzinfo=None)
+
+def _job_summary(advisor_id, status, risk_indicators, created_at) -> JobSummary:
+    today, _, _ = _today_bounds()
+    return JobSummary(
+        advisor_id,
+        str(status or "").strip().lower(),
+        _risk_level(_split_csv(risk_indicators)),
+        str(created_at or "").startswith(today),
+    )
+
+def _summary_of(jc: dict) -> JobSummary:
+    """Counter bucket of a mapped or JSON-fixture job card."""
+    return _job_summary(
+        jc.get("advisorId") or jc.get("advisor_id"),
+        jc.get("status"),
+        jc.get("riskIndicators") or jc.get("risk_indicators"),
+        jc.get("createdAt"),
+    )
+
+def _sql_job_groups(advisor_id: Optional[str] = None) -> list[tuple[JobSummary, int]]:
+    """Job cards counted per (advisor, status, risk_indicators, created today) in one grouped scan."""
+    _, start, end = _today_bounds()
+    where, params = ("WHERE advisor_id = ?", (advisor_id,)) if advisor_id else ("", ())
+    rows = _sql_rows(
+        f"""SELECT advisor_id, status, risk_indicators, is_today, COUNT(*) AS n
+            FROM (
+                SELECT advisor_id,
+                       LOWER(LTRIM(RTRIM(COALESCE(status, '')))) AS status,
+                       risk_indicators,
+                       CASE WHEN created_at >= ? AND created_at < ? THEN 1 ELSE 0 END AS is_today
+                FROM Job_Cards {where}
+            ) jc
+            GROUP BY advisor_id, status, risk_indicators, is_today""",
+        (start, end, *params),
+    )
+    risk_of: dict = {}
+    groups = []
+    for r in rows:
+        raw = r.get("risk_indicators")
+        if raw not in risk_of:
+            risk_of[raw] = _risk_level(_split_csv(raw))
+        summary = JobSummary(r.get("advisor_id"), r.get("status"), risk_of[raw], bool(r.get("is_today")))
+        groups.append((summary, int(r.get("n") or 0)))
+    return groups
+
+def _job_groups(advisor_id: Optional[str] = None) -> list[tuple[JobSummary, int]]:
+    if _db_available():
+        return _sql_job_groups(advisor_id)
+    if _use_json_fallback():
+        return [(_summary_of(j), 1) for j in list_job_cards(advisor_id=advisor_id)]
+    return []
+
+def _counter_interval() -> float:
+    """Counters are per process; with several workers each would miss the others' writes, so count per read."""
+    if (get_web_concurrency() or 1) > 1:
+        return 0.0
+    return get_dashboard_reconcile_seconds()
+
+_counters = DashboardCounters(_job_groups, interval=_counter_interval())
+
+def _track_job_change(old: Optional[JobSummary], jc: Optional[dict]) -> None:
+    if old is not None and jc is not None:
+        _counters.apply(old, _summary_of(jc))
+
+def get_dashboard_counter_stats() -> dict:
+    return _counters.stats()
+
+def get_dashboard_drift(reconcile: bool = False) -> dict:
+    report = _counters.drift()
+    if reconcile and not report["in_sync"]:
+        _counters.reconcile()
+    return report
+
+def _dashboard_kpis(advisor_id: Optional[str]) -> dict:
+    if _counters.enabled:
+        return _counters.kpis(advisor_id)
+    return tally(_job_groups(advisor_id))
+
+def _recent_jobs(advisor_id: Optional[str], top: int) -> list[dict]:
+    """The newest ``top`` job cards, projected to the columns the dashboard renders."""
+    if _db_available():
+        where, params = ("WHERE advisor_id = ?", (advisor_id,)) if advisor_id else ("", ())
+        rows = _sql_rows(
+            f"SELECT TOP {int(top)} {_jc_columns()} FROM Job_Cards {where} "
+            "ORDER BY created_at DESC, id DESC",
+            params,
+        )
+        return [_map_job(r) for r in rows]
+    return list_job_cards(advisor_id=advisor_id)[:top]
+
 def get_advisor_dashboard(advisor_id: Optional[str] = None) -> dict:
-    jobs = list_job_cards(advisor_id=advisor_id)
-    today = datetime.now(timezone.utc).date().isoformat()
+    kpis, recent = _dashboard_kpis(advisor_id), _recent_jobs(advisor_id, top=10)
     return {
-        "open_jobs":        sum(1 for j in jobs if j.get("status") not in ("completed", "closed")),
-        "pending_approval": sum(1 for j in jobs if j.get("status") == "pending_approval"),
-        "in_progress":      sum(1 for j in jobs if j.get("status") == "in_progress"),
-        "completed_today":  sum(1 for j in jobs if j.get("status") == "completed"
-                               and j.get("createdAt", "").startswith(today)),
-        "recent_jobs": jobs[:10],
+        "open_jobs":        kpis["open_jobs"],
+        "pending_approval": kpis["pending_approval"],
+        "in_progress":      kpis["in_progress"],
+        "completed_today":  kpis["completed_today"],
+        "recent_jobs": recent,
     }
 
 def get_manager_dashboard() -> dict:
-    jobs = list_job_cards()
-    today = datetime.now(timezone.utc).date().isoformat()
-    risky = {"high", "high engine temperature", "high brake risk"}
-
-    def risk_level(j: dict) -> str:
-        indicators = [r.lower() for r in (j.get("riskIndicators") or [])]
-        if any(r in risky for r in indicators): return "high"
-        if any("medium" in r for r in indicators): return "medium"
-        return "low"
-
-    jobs_with_eta = [{**j, "eta": "2026-03-01", "riskLevel": risk_level(j)} for j in jobs]
+    kpis, recent = _dashboard_kpis(None), _recent_jobs(None, top=20)
+    jobs_with_eta = [{**j, "eta": "2026-03-01", "riskLevel": _risk_level(j.get("riskIndicators"))} for j in recent]
     return {
-        "in_progress":      sum(1 for j in jobs if j.get("status") == "in_progress"),
-        "at_risk":          sum(1 for j in jobs if risk_level(j) == "high"),
-        "pending_approval": sum(1 for j in jobs if j.get("status") == "pending_approval"),
-        "completed_today":  sum(1 for j in jobs if j.get("status") == "completed"
-                               and j.get("createdAt", "").startswith(today)),
-        "jobs_with_eta": jobs_with_eta[:20],
+        "in_progress":      kpis["in_progress"],
+        "at_risk":          kpis["at_risk"],
+        "pending_approval": kpis["pending_approval"],
+        "completed_today":  kpis["completed_today"],
+        "jobs_with_eta": jobs_with_eta,
     }
 
 # ─── Auth helpers ─────────────────────────────────────────────────────────────
@@ -721,8 +1584,8 @@ def find_employee(username: str) -> Optional[dict]:
         rows = _sql_rows("SELECT * FROM Employee WHERE username = ? OR email = ?", (username, username))
         return rows[0] if rows else None
     if _use_json_fallback():
-        return next((e for e in _json("emp", "employee.json")
-                     if e.get("username") == username or e.get("email") == username), None)
+        employees = _json("emp")
+        return employees.first("username", username) or employees.first("email", username)
     return None
 
 def find_customer_by_email(email: str) -> Optional[dict]:
@@ -730,5 +1593,5 @@ def find_customer_by_email(email: str) -> Optional[dict]:
         rows = _sql_rows("SELECT * FROM Customers WHERE email = ?", (email,))
         return _map_customer(rows[0]) if rows else None
     if _use_json_fallback():
-        return next((c for c in _json("customers", "customers.json") if c.get("email") == email), None)
+        return _json("customers").first("email", email)
     return None
@@ -0,0 +1,173 @@
+"""Compact, lazily parsed job card rows for list and export reads.
+
+A ``JobCardRecord`` keeps the cursor row itself (a tuple, or a pyodbc Row)
+and a ``Columns`` layout shared by every row of the result set, so building
+one allocates a single two-slot object and parses nothing.  ``to_api()``
+renders the snake_case shape the job card routes return straight from the
+row — one dict per job card instead of the column dict, the ``_map_job`` dict
+and the route's copy of it.
+
+Records are also read-only Mappings with the camelCase keys of
+``db_service._map_job`` (deferred fields only when their columns were
+selected), parsed on access, so code written against mapped dicts keeps
+working.  They cannot be updated in place: select the deferred column groups
+up front instead of calling ``load_deferred_columns``.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from app.application.raw_json import lazy_json
+
+# ─── Column parsers (shared with db_service._map_job) ────────────────────────
+
+
+def split_csv(v) -> list:
+    """Turn a comma-separated string or list into a list."""
+    if not v:
+        return []
+    if isinstance(v, list):
+        return v
+    return [x.strip() for x in str(v).split(",") if x.strip()]
+
+
+def split_tasks(v) -> list[str]:
+    """``tasks`` is stored one task per line."""
+    return [t.strip() for t in str(v or "").splitlines() if t and t.strip()]
+
+
+def parse_payload(v) -> Any:
+    """``intake_payload_json`` text → lazily parsed ``RawJSON``; reads as None when empty or not valid JSON."""
+    return lazy_json(v)
+
+
+def _status(v) -> Any:
+    return v.strip().lower() if isinstance(v, str) else v
+
+
+# ─── Layout ───────────────────────────────────────────────────────────────────
+
+# Route (snake_case) keys in response order; those not listed in _API_PARSED
+# are copied from the column of the same name.
+_API_KEYS = (
+    "id", "created_at", "status", "customer_id", "customer_name", "vehicle_id", "vehicle_make",
+    "vehicle_model", "vehicle_year", "vin", "mileage", "complaint", "service_type", "risk_indicators",
+    "obd_fault_codes", "obd_document_id", "obd_report_text", "obd_report_summary", "tasks",
+    "intake_payload_json",
+)
+_API_PARSED = ("created_at", "status", "risk_indicators", "obd_fault_codes", "tasks", "intake_payload_json")
+_API_DEFAULTS = {"created_at": "", "status": "draft"}
+
+# _map_job (camelCase) keys → (column, parser, default when the column is absent)
+_SUMMARY_FIELDS: tuple[tuple[str, str, Optional[Callable[[Any], Any]], Any], ...] = (
+    ("id",             "id",              None,      ""),
+    ("createdAt",      "created_at",      str,       ""),
+    ("status",         "status",          _status,   "draft"),
+    ("customerName",   "customer_name",   None,      None),
+    ("customerId",     "customer_id",     None,      None),
+    ("vehicleMake",    "vehicle_make",    None,      None),
+    ("vehicleModel",   "vehicle_model",   None,      None),
+    ("vehicleYear",    "vehicle_year",    None,      None),
+    ("vin",            "vin",             None,      None),
+    ("mileage",        "mileage",         None,      None),
+    ("complaint",      "complaint",       None,      None),
+    ("serviceType",    "service_type",    None,      None),
+    ("riskIndicators", "risk_indicators", split_csv, []),
+    ("obdFaultCodes",  "obd_fault_codes", split_csv, []),
+    ("obdDocumentId",  "obd_document_id", None,      None),
+    ("vehicleId",      "vehicle_id",      None,      None),
+    ("advisorId",      "advisor_id",      None,      None),
+)
+_DEFERRED_FIELDS: tuple[tuple[str, str, Optional[Callable[[Any], Any]]], ...] = (
+    ("obdReportText",     "obd_report_text",     None),
+    ("obdReportSummary",  "obd_report_summary",  None),
+    ("tasks",             "tasks",               split_tasks),
+    ("intakePayloadJson", "intake_payload_json", parse_payload),
+)
+
+
+def _getter(pos: Optional[int], parse: Optional[Callable[[Any], Any]], default: Any) -> Callable[[Sequence], Any]:
+    if pos is None:
+        return lambda row: list(default) if isinstance(default, list) else default
+    if parse is None:
+        return itemgetter(pos)
+    return lambda row: parse(row[pos])
+
+
+class Columns:
+    """Positions of one result set's columns, computed once and shared by its records."""
+
+    __slots__ = ("index", "_template", "_copy_keys", "_copy", "_parsed", "_fields")
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self.index = {name: i for i, name in enumerate(names)}
+        pos = self.index.get
+        copied = [k for k in _API_KEYS if k not in _API_PARSED and k in self.index]
+        self._template = {k: _API_DEFAULTS.get(k) for k in _API_KEYS}
+        self._copy_keys = tuple(copied)
+        getter = itemgetter(*(self.index[k] for k in copied)) if copied else None
+        self._copy = (lambda row: (getter(row),)) if len(copied) == 1 else getter
+        self._parsed = tuple(pos(k) for k in _API_PARSED)
+        fields = {key: _getter(pos(col), parse, default) for key, col, parse, default in _SUMMARY_FIELDS}
+        if "obd_report_text" in self.index or "obd_report_summary" in self.index:
+            fields["obdReportText"] = _getter(pos("obd_report_text"), None, None)
+            fields["obdReportSummary"] = _getter(pos("obd_report_summary"), None, None)
+        for key, col, parse in _DEFERRED_FIELDS[2:]:
+            if col in self.index:
+                fields[key] = _getter(pos(col), parse, None)
+        self._fields = fields
+
+
+class JobCardRecord(Mapping):
+    __slots__ = ("_row", "_cols")
+
+    def __init__(self, row: Sequence, cols: Columns) -> None:
+        self._row = row
+        self._cols = cols
+
+    def raw(self, column: str) -> Any:
+        """Unparsed column value (e.g. the driver's datetime for keyset cursors)."""
+        return self._row[self._cols.index[column]]
+
+    def cursor_key(self) -> tuple:
+        return self.raw("created_at"), self.raw("id")
+
+    def to_api(self) -> dict:
+        """The job card in the route response shape (``job_card_routes._map``)."""
+        row, cols = self._row, self._cols
+        out = dict(cols._template)
+        if cols._copy is not None:
+            out.update(zip(cols._copy_keys, cols._copy(row)))
+        created_at, status, risk, obd, tasks, intake = cols._parsed
+        if created_at is not None:
+            out["created_at"] = str(row[created_at])
+        if status is not None:
+            out["status"] = _status(row[status])
+        out["risk_indicators"] = split_csv(row[risk]) if risk is not None else []
+        out["obd_fault_codes"] = split_csv(row[obd]) if obd is not None else []
+        if tasks is not None:
+            out["tasks"] = split_tasks(row[tasks])
+        if intake is not None:
+            out["intake_payload_json"] = parse_payload(row[intake])
+        return out
+
+    # ── Mapping (``_map_job`` keys) ──────────────────────────────────────────
+
+    def __getitem__(self, key: str) -> Any:
+        return self._cols._fields[key](self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cols._fields)
+
+    def __len__(self) -> int:
+        return len(self._cols._fields)
+
+    def __repr__(self) -> str:
+        return f"JobCardRecord({self.raw('id')!r})"
+
+
+def records(names: Sequence[str], rows: Sequence[Sequence]) -> list[JobCardRecord]:
+    cols = Columns(names)
+    return [JobCardRecord(row, cols) for row in rows]
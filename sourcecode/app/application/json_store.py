@@ -0,0 +1,131 @@
+"""Indexed in-memory tables for USE_JSON_FALLBACK mode.
+
+Each fixture list is wrapped in an ``IndexedTable`` with hash indexes on the
+columns db_service looks rows up by, plus an optional sorted (created_at, id)
+index, so lookups no longer scan the whole list.  Rows stay plain dicts and are
+returned by reference, as the fixture lists were; changes to indexed fields must
+go through ``update()`` so the indexes follow.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any, Callable, Iterator, Optional
+
+KeyFn = Callable[[dict], Any]
+
+
+def field(*names: str) -> KeyFn:
+    """Key function reading the first non-empty of several spellings (camelCase / snake_case)."""
+    def key(row: dict) -> Any:
+        for name in names:
+            value = row.get(name)
+            if value is not None and value != "":
+                return value
+        return None
+    return key
+
+
+class IndexedTable:
+    def __init__(
+        self,
+        rows: list[dict],
+        indexes: dict[str, KeyFn],
+        created_at: Optional[KeyFn] = None,
+    ) -> None:
+        self._rows = rows
+        self._key_fns = indexes
+        self._created_at = created_at
+        self._hash: dict[str, dict[Any, dict[int, dict]]] = {name: {} for name in indexes}
+        self._sorted: list[tuple[str, str, int]] = []
+        self._objs: dict[int, dict] = {}
+        self._lock = threading.RLock()
+        for row in rows:
+            self._index(row)
+
+    # ── index maintenance ────────────────────────────────────────────────────
+
+    def _sort_key(self, row: dict) -> tuple[str, str, int]:
+        return str(self._created_at(row) or ""), str(row.get("id") or ""), id(row)
+
+    def _index(self, row: dict) -> None:
+        self._objs[id(row)] = row
+        for name, key_fn in self._key_fns.items():
+            value = key_fn(row)
+            if value is not None:
+                self._hash[name].setdefault(value, {})[id(row)] = row
+        if self._created_at is not None:
+            bisect.insort(self._sorted, self._sort_key(row))
+
+    def _unindex(self, row: dict) -> None:
+        for name, key_fn in self._key_fns.items():
+            bucket = self._hash[name].get(key_fn(row))
+            if bucket is not None:
+                bucket.pop(id(row), None)
+                if not bucket:
+                    del self._hash[name][key_fn(row)]
+        if self._created_at is not None:
+            key = self._sort_key(row)
+            pos = bisect.bisect_left(self._sorted, key)
+            if pos < len(self._sorted) and self._sorted[pos] == key:
+                self._sorted.pop(pos)
+
+    def insert(self, row: dict) -> dict:
+        with self._lock:
+            self._rows.append(row)
+            self._index(row)
+        return row
+
+    def update(self, row: dict, changes: dict) -> dict:
+        """Apply ``changes`` to a stored row and re-index it."""
+        with self._lock:
+            self._unindex(row)
+            row.update(changes)
+            self._index(row)
+        return row
+
+    def delete(self, row: dict) -> None:
+        with self._lock:
+            if self._objs.pop(id(row), None) is None:
+                return
+            self._unindex(row)
+            self._rows[:] = [r for r in self._rows if r is not row]
+
+    # ── lookups ──────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(list(self._rows))
+
+    def find(self, index: str, value: Any) -> list[dict]:
+        with self._lock:
+            return list(self._hash[index].get(value, {}).values())
+
+    def first(self, index: str, value: Any) -> Optional[dict]:
+        with self._lock:
+            bucket = self._hash[index].get(value)
+            return next(iter(bucket.values())) if bucket else None
+
+    def get(self, row_id: Any) -> Optional[dict]:
+        return self.first("id", row_id)
+
+    def where(self, **criteria: Any) -> list[dict]:
+        """Rows matching every ``index=value`` pair, probing the smallest bucket first."""
+        if not criteria:
+            return list(self._rows)
+        with self._lock:
+            buckets = [self._hash[name].get(value, {}) for name, value in criteria.items()]
+            smallest = min(buckets, key=len)
+            return [
+                row for oid, row in smallest.items()
+                if all(oid in bucket for bucket in buckets if bucket is not smallest)
+            ]
+
+    def newest_first(self, rows: Optional[list[dict]] = None) -> list[dict]:
+        """``rows`` (default: all rows) ordered by (created_at, id) descending."""
+        with self._lock:
+            if rows is None:
+                return [self._objs[oid] for _, _, oid in reversed(self._sorted)]
+        return sorted(rows, key=self._sort_key, reverse=True)
@@ -0,0 +1,79 @@
+"""Keyset pagination helpers — opaque cursors over (created_at, id), newest first."""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Callable, Optional
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursor(ValueError):
+    """The cursor was not produced by ``encode_cursor`` (or has been tampered with)."""
+
+
+def encode_cursor(created_at, row_id) -> str:
+    raw = json.dumps([str(created_at or ""), str(row_id or "")], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise InvalidCursor("Malformed pagination cursor") from exc
+    if not isinstance(created_at, str) or not isinstance(row_id, str):
+        raise InvalidCursor("Malformed pagination cursor")
+    return created_at, row_id
+
+
+def sql_cursor_value(created_at: str) -> Optional[datetime]:
+    """Cursor timestamp as a datetime parameter for the keyset predicate (None when blank)."""
+    if not created_at:
+        return None
+    try:
+        return datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise InvalidCursor("Malformed pagination cursor") from exc
+
+
+def keyset_clause(created_at: Optional[datetime], row_id: str) -> tuple[str, tuple]:
+    """SQL predicate for rows strictly after the cursor in ``created_at DESC, id DESC`` order."""
+    if created_at is None:
+        return "(created_at IS NULL AND id < ?)", (row_id,)
+    return (
+        "(created_at < ? OR (created_at = ? AND id < ?) OR created_at IS NULL)",
+        (created_at, created_at, row_id),
+    )
+
+
+def paginate_rows(
+    rows: list[dict],
+    limit: int,
+    cursor: Optional[str],
+    created_at_key: str = "createdAt",
+) -> tuple[list[dict], Optional[str]]:
+    """Keyset-paginate in-memory rows (JSON fallback) with the same ordering as SQL."""
+    def key(r: dict) -> tuple[str, str]:
+        return str(r.get(created_at_key) or ""), str(r.get("id") or "")
+
+    ordered = sorted(rows, key=key, reverse=True)
+    if cursor:
+        after = decode_cursor(cursor)
+        ordered = [r for r in ordered if key(r) < after]
+    return page_from(ordered[: limit + 1], limit, key)
+
+
+def page_from(
+    rows: list,
+    limit: int,
+    cursor_key: Callable[[dict], tuple],
+) -> tuple[list, Optional[str]]:
+    """Trim a ``limit + 1`` fetch to ``limit`` rows and derive the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*cursor_key(page[-1]))
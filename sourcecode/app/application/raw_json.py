@@ -0,0 +1,111 @@
+"""Lazily parsed JSON column values.
+
+``estimation_json`` and ``intake_payload_json`` hold JSON text that the
+routes usually hand straight back to the client.  ``RawJSON`` keeps the text
+as read: ``value`` parses it on first use, ``api.responses.dumps`` splices
+the bytes into the response body unparsed, and pydantic (routes with a
+``response_model``) serializes the parsed value.
+
+Text is only spliced once it is known to parse.  The first time a given
+value is serialized it is validated and its digest remembered, so a corrupt
+row still falls back to what the eager mapping returned instead of breaking
+the response body.  Repeat reads of the same row cost a hash, not a parse.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from pydantic_core import SchemaSerializer, core_schema
+
+_UNSET = object()
+_VERIFIED_MAX = 4096
+
+
+class _Verified:
+    """Digests of JSON texts that have parsed, most recently used last."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._digests: OrderedDict[bytes, None] = OrderedDict()
+
+    def __contains__(self, digest: bytes) -> bool:
+        with self._lock:
+            if digest not in self._digests:
+                return False
+            self._digests.move_to_end(digest)
+            return True
+
+    def add(self, digest: bytes) -> None:
+        with self._lock:
+            self._digests[digest] = None
+            while len(self._digests) > self._max_entries:
+                self._digests.popitem(last=False)
+
+
+_verified = _Verified(_VERIFIED_MAX)
+
+
+class RawJSON:
+    __slots__ = ("text", "_keep_invalid", "_value")
+
+    def __init__(self, text: str, keep_invalid: bool = False) -> None:
+        """``keep_invalid``: text that is not JSON reads as the string itself rather than None."""
+        self.text = text
+        self._keep_invalid = keep_invalid
+        self._value: Any = _UNSET
+
+    @property
+    def value(self) -> Any:
+        if self._value is _UNSET:
+            try:
+                self._value = json.loads(self.text)
+            except ValueError:
+                self._value = self.text if self._keep_invalid else None
+        return self._value
+
+    def json_bytes(self) -> Optional[bytes]:
+        """UTF-8 text to splice into a JSON document, or None if it is not valid JSON."""
+        data = self.text.encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest in _verified:
+            return data
+        try:
+            self._value = json.loads(data)
+        except ValueError:
+            return None
+        _verified.add(digest)
+        return data
+
+    def is_object(self) -> bool:
+        """True if the text is a JSON object, without parsing it when it has been seen before."""
+        return self.text.lstrip().startswith("{") and self.json_bytes() is not None
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.text[:40]!r}{'...' if len(self.text) > 40 else ''})"
+
+
+# pydantic-core serializes any object that carries a __pydantic_serializer__.
+RawJSON.__pydantic_serializer__ = SchemaSerializer(core_schema.any_schema(
+    serialization=core_schema.plain_serializer_function_ser_schema(lambda v: v.value),
+))
+
+
+def lazy_json(raw: Any, keep_invalid: bool = False) -> Any:
+    """Wrap JSON text from a column; values the driver already decoded pass through, empty → None."""
+    if not raw:
+        return None
+    if isinstance(raw, str):
+        return RawJSON(raw, keep_invalid)
+    return raw
+
+
+def json_object(value: Any) -> Optional[Any]:
+    """``value`` if it is (or holds) a JSON object, else None."""
+    if isinstance(value, RawJSON):
+        return value if value.is_object() else None
+    return value if isinstance(value, dict) else None
@@ -0,0 +1,116 @@
+"""ETag cache for conditional GETs on frequently polled resources.
+
+Routes remember the ETag (a hash of the response body) they last served for a
+resource; a request whose If-None-Match carries that ETag is answered 304
+without a database read or serialization.  db_service write functions
+``bump()`` a resource when they change it.
+
+Each cached ETag is stored with the resource's version from the version
+store (app/infrastructure/version_store.py) and is served only while that
+version is unchanged, so with the SQLite store a write made by any worker
+invalidates it everywhere.  A reader takes a ``token()`` — the version —
+before it loads, and ``remember()`` ignores the result if the resource was
+bumped after that, so a read racing a write cannot cache the pre-write ETag.
+Entries also expire after ``ttl`` seconds.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.infrastructure.version_store import ALL, MemoryVersionStore, SqliteVersionStore, Version
+
+
+def _norm(key: object) -> str:
+    # SQL Server ids compare case-insensitively, so "j001" and "J001" are one resource.
+    return str(key).strip().lower()
+
+
+class ResourceVersions:
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 10000,
+        store: MemoryVersionStore | SqliteVersionStore | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._store = store or MemoryVersionStore(max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (kind, key) -> {variant (query string): (etag, version, stored_at)}
+        self._etags: OrderedDict[tuple[str, str], dict[str, tuple[str, Version, float]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._bumps = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    # ── writes ───────────────────────────────────────────────────────────────
+
+    def bump(self, kind: str, key: Optional[str] = None) -> None:
+        """Invalidate one resource, or every resource of ``kind`` when ``key`` is None."""
+        if not self.enabled:
+            return
+        target = ALL if key is None else _norm(key)
+        self._store.bump(kind, target)
+        with self._lock:
+            if target != ALL:
+                self._etags.pop((kind, target), None)
+            else:
+                for cached in [k for k in self._etags if k[0] == kind]:
+                    del self._etags[cached]
+            self._bumps += 1
+
+    # ── reads ────────────────────────────────────────────────────────────────
+
+    def token(self, kind: str, key: str) -> Optional[Version]:
+        """The resource's version to pass to ``remember()`` — take it before loading."""
+        if not self.enabled:
+            return None
+        return self._store.current(kind, _norm(key))
+
+    def get(self, kind: str, key: str, variant: str = "") -> Optional[str]:
+        if not self.enabled:
+            return None
+        key = _norm(key)
+        with self._lock:
+            entry = self._etags.get((kind, key), {}).get(variant)
+        if entry is None or self._clock() - entry[2] >= self._ttl or entry[1] != self._store.current(kind, key):
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            if (kind, key) in self._etags:
+                self._etags.move_to_end((kind, key))
+            self._hits += 1
+        return entry[0]
+
+    def remember(self, kind: str, key: str, etag: str, token: Optional[Version], variant: str = "") -> None:
+        if not self.enabled or token is None:
+            return
+        key = _norm(key)
+        if self._store.current(kind, key) != token:
+            return  # changed while it was being loaded
+        with self._lock:
+            self._etags.setdefault((kind, key), {})[variant] = (etag, token, self._clock())
+            self._etags.move_to_end((kind, key))
+            while len(self._etags) > self._max_entries:
+                self._etags.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            local = {
+                "enabled": self.enabled,
+                "ttl_seconds": self._ttl,
+                "resources": len(self._etags),
+                "hits": self._hits,
+                "misses": self._misses,
+                "bumps": self._bumps,
+            }
+        return {**local, "store": self._store.stats()}
@@ -0,0 +1,189 @@
+"""In-memory trigram index for vehicle lookup by VIN / registration number.
+
+VINs and registration numbers are normalised (upper case, letters and digits
+only) and every 3-character slice is posted to the vehicles containing it.  A
+partial query intersects the posting sets of its own trigrams, smallest first,
+and only the surviving candidates are checked with a substring test, so a
+keystroke costs a few set intersections instead of a LIKE '%q%' scan.
+
+The index is bulk-loaded from the database, kept current by db_service on
+``add_vehicle`` / ``update_vehicle`` and rebuilt every ``ttl`` seconds to pick
+up writes made elsewhere.  Until then a search with no hits falls back to a
+LIKE scan in db_service, so a vehicle added on another worker is still found.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]")
+
+# Rank of a match, best first: exact beats prefix beats substring; the
+# registration number beats the VIN at the same level.
+_EXACT, _PREFIX, _SUBSTRING = 0, 2, 4
+
+
+def normalize(value: Any) -> str:
+    return _NON_ALNUM.sub("", str(value or "").upper())
+
+
+def trigrams(value: str) -> set[str]:
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def _rank(query: str, field: str, offset: int) -> Optional[int]:
+    if not field or query not in field:
+        return None
+    if field == query:
+        return _EXACT + offset
+    if field.startswith(query):
+        return _PREFIX + offset
+    return _SUBSTRING + offset
+
+
+class VehicleSearchIndex:
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[dict[str, Any]]],
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._loader = loader
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[str, str, dict[str, Any]]] = {}  # id -> (reg, vin, row)
+        self._postings: dict[str, set[str]] = {}
+        self._loaded_at: float | None = None
+        self._loads = 0
+        self._load_errors = 0
+        self._searches = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    # ── loading ──────────────────────────────────────────────────────────────
+
+    def reload(self) -> bool:
+        """Rebuild from the loader; keeps the previous index if the load fails."""
+        if not self.enabled:
+            return False
+        try:
+            rows = list(self._loader())
+        except Exception as exc:
+            with self._lock:
+                self._load_errors += 1
+            logger.warning(f"  Vehicle search index load failed: {exc}")
+            return False
+        entries: dict[str, tuple[str, str, dict[str, Any]]] = {}
+        postings: dict[str, set[str]] = {}
+        for row in rows:
+            self._post(entries, postings, row)
+        with self._lock:
+            self._entries, self._postings = entries, postings
+            self._loaded_at = self._clock()
+            self._loads += 1
+        logger.info(f" Vehicle search index loaded: {len(entries)} vehicles, {len(postings)} trigrams")
+        return True
+
+    def _ensure_fresh(self) -> bool:
+        if not self.enabled:
+            return False
+        loaded_at = self._loaded_at
+        if loaded_at is not None and self._clock() - loaded_at < self._ttl:
+            return True
+        return self.reload()
+
+    @staticmethod
+    def _post(entries: dict, postings: dict, row: dict[str, Any]) -> None:
+        vehicle_id = str(row.get("id") or "")
+        if not vehicle_id:
+            return
+        reg, vin = normalize(row.get("registration_number")), normalize(row.get("vin"))
+        entries[vehicle_id] = (reg, vin, dict(row))
+        for gram in trigrams(reg) | trigrams(vin):
+            postings.setdefault(gram, set()).add(vehicle_id)
+
+    @staticmethod
+    def _unpost(entries: dict, postings: dict, vehicle_id: str) -> None:
+        old = entries.pop(vehicle_id, None)
+        if old is None:
+            return
+        for gram in trigrams(old[0]) | trigrams(old[1]):
+            bucket = postings.get(gram)
+            if bucket is not None:
+                bucket.discard(vehicle_id)
+                if not bucket:
+                    del postings[gram]
+
+    # ── writes ───────────────────────────────────────────────────────────────
+
+    def upsert(self, row: dict[str, Any]) -> None:
+        """Index a new or changed vehicle (no-op until the first load)."""
+        if not self.enabled or self._loaded_at is None:
+            return
+        with self._lock:
+            self._unpost(self._entries, self._postings, str(row.get("id") or ""))
+            self._post(self._entries, self._postings, row)
+
+    def invalidate(self) -> None:
+        """Rebuild on the next search (after bulk writes that skipped ``upsert``)."""
+        with self._lock:
+            self._loaded_at = None
+
+    def remove(self, vehicle_id: str) -> None:
+        with self._lock:
+            self._unpost(self._entries, self._postings, str(vehicle_id))
+
+    # ── reads ────────────────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 10) -> Optional[list[dict[str, Any]]]:
+        """Ranked rows whose registration number or VIN contains ``query``.
+
+        Returns None when the index is disabled or could not be loaded, so the
+        caller can fall back to the database.
+        """
+        if not self._ensure_fresh():
+            return None
+        q = normalize(query)
+        if not q:
+            return []
+        with self._lock:
+            self._searches += 1
+            if len(q) >= 3:
+                buckets = sorted((self._postings.get(g, set()) for g in trigrams(q)), key=len)
+                candidates = set(buckets[0]).intersection(*buckets[1:]) if buckets[0] else set()
+            else:
+                candidates = set(self._entries)
+            ranked = []
+            for vehicle_id in candidates:
+                reg, vin, row = self._entries[vehicle_id]
+                ranks = [r for r in (_rank(q, reg, 0), _rank(q, vin, 1)) if r is not None]
+                if ranks:
+                    ranked.append((min(ranks), len(reg or vin), vehicle_id, row))
+        ranked.sort(key=lambda item: item[:3])
+        return [dict(row) for *_, row in ranked[:limit]]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            age = None if self._loaded_at is None else round(self._clock() - self._loaded_at, 1)
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self._ttl,
+                "age_seconds": age,
+                "vehicles": len(self._entries),
+                "trigrams": len(self._postings),
+                "loads": self._loads,
+                "load_errors": self._load_errors,
+                "searches": self._searches,
+            }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,6 +16,20 @@ def _get_required_env(name: str) -> str:
 	return value
 
 
+def _get_float(name: str, default: float) -> float:
+	try:
+		return float(os.getenv(name, default))
+	except ValueError:
+		return default
+
+
+def _get_int(name: str, default: int) -> int:
+	try:
+		return int(os.getenv(name, default))
+	except ValueError:
+		return default
+
+
 def get_openai_endpoint() -> str:
 	return _get_required_env("AZURE_OPENAI_ENDPOINT")
 
@@ -40,3 +55,174 @@ def get_sql_connection_string() -> str:
 		os.getenv("AZURE_SQL_CONNECTION_STRING")
 	)
 
+
+def get_reference_cache_ttl() -> float:
+	"""Seconds a Parts/Labor/Fault snapshot is served before reloading (0 disables)."""
+	try:
+		return float(os.getenv("REFERENCE_CACHE_TTL", "900"))
+	except ValueError:
+		return 900.0
+
+
+def get_slow_query_ms() -> float:
+	"""Queries slower than this many milliseconds are logged (0 disables the slow-query log)."""
+	try:
+		return float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+	except ValueError:
+		return 500.0
+
+
+def get_response_compression_min_bytes() -> int:
+	"""Responses smaller than this are sent uncompressed even when the client accepts gzip/br."""
+	try:
+		return int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+	except ValueError:
+		return 1024
+
+
+def get_db_backend() -> str:
+	"""``azure_sql`` (default) or ``sqlite`` for the local load-test database."""
+	return os.getenv("DB_BACKEND", "azure_sql").strip().lower()
+
+
+def get_sqlite_path() -> str:
+	return os.getenv("SQLITE_PATH") or str(Path(__file__).resolve().parents[2] / "local.sqlite3")
+
+
+def get_sqlite_seed() -> str:
+	"""How a new SQLite database is seeded: ``sql`` (sample data script), ``json`` or ``none``."""
+	return os.getenv("SQLITE_SEED", "sql").strip().lower()
+
+
+def get_session_backend() -> str:
+	"""``memory`` (default, one worker) or ``sqlite`` (shared by every worker on the host)."""
+	return os.getenv("SESSION_BACKEND", "memory").strip().lower()
+
+
+def get_session_sqlite_path() -> str:
+	return os.getenv("SESSION_SQLITE_PATH") or str(Path(__file__).resolve().parents[2] / "sessions.sqlite3")
+
+
+def get_session_ttl() -> float:
+	"""Seconds a login session stays valid after its last use."""
+	try:
+		return float(os.getenv("SESSION_TTL_SECONDS", "28800"))
+	except ValueError:
+		return 28800.0
+
+
+def get_session_max_entries() -> int:
+	try:
+		return int(os.getenv("SESSION_MAX_ENTRIES", "10000"))
+	except ValueError:
+		return 10000
+
+
+def use_json_fallback() -> bool:
+	"""Serve reads and writes from the per-process JSON fixtures instead of SQL."""
+	return os.getenv("USE_JSON_FALLBACK", "false").strip().lower() == "true"
+
+
+def get_db_connect_timeout() -> int:
+	return _get_int("DB_CONNECT_TIMEOUT", 10)
+
+
+def get_db_pool_size() -> int:
+	return _get_int("DB_POOL_SIZE", 5)
+
+
+def get_db_pool_max_overflow() -> int:
+	return _get_int("DB_POOL_MAX_OVERFLOW", 10)
+
+
+def get_db_pool_timeout() -> float:
+	"""Seconds a request waits for a free pooled connection before failing."""
+	return _get_float("DB_POOL_TIMEOUT", 30.0)
+
+
+def get_db_pool_pre_ping_idle() -> float:
+	"""A pooled connection idle longer than this many seconds is pinged before it is handed out."""
+	return _get_float("DB_POOL_PRE_PING_IDLE", 30.0)
+
+
+def get_db_breaker_failures() -> int:
+	"""Consecutive connection failures that open the circuit breaker."""
+	return _get_int("DB_BREAKER_FAILURES", 3)
+
+
+def get_db_breaker_backoff() -> float:
+	return _get_float("DB_BREAKER_BACKOFF", 1.0)
+
+
+def get_db_breaker_max_backoff() -> float:
+	return _get_float("DB_BREAKER_MAX_BACKOFF", 60.0)
+
+
+def get_etag_cache_ttl() -> float:
+	"""Seconds a computed ETag is reused without reloading the resource (0 disables)."""
+	return _get_float("ETAG_CACHE_TTL", 30.0)
+
+
+def get_etag_version_backend() -> str:
+	"""``memory`` (default, one worker) or ``sqlite`` (ETag versions shared by every worker on the host)."""
+	return os.getenv("ETAG_VERSION_BACKEND", "memory").strip().lower()
+
+
+def get_etag_version_sqlite_path() -> str:
+	return os.getenv("ETAG_VERSION_SQLITE_PATH") or str(Path(__file__).resolve().parents[2] / "versions.sqlite3")
+
+
+def get_vehicle_index_ttl() -> float:
+	"""Seconds the in-memory vehicle search index is served before it is rebuilt."""
+	return _get_float("VEHICLE_INDEX_TTL", 300.0)
+
+
+def get_dashboard_reconcile_seconds() -> float:
+	"""Seconds between full recounts of the dashboard KPI counters (0 disables the counters)."""
+	return _get_float("DASHBOARD_RECONCILE_SECONDS", 300.0)
+
+
+def get_web_concurrency() -> int | None:
+	"""Worker processes ``app.server`` runs; ``None`` when WEB_CONCURRENCY is not set."""
+	return _get_int("WEB_CONCURRENCY", 0) or None
+
+
+def get_server_host() -> str:
+	return os.getenv("SERVER_HOST", "0.0.0.0")
+
+
+def get_server_port() -> int:
+	return _get_int("SERVER_PORT", 8000)
+
+
+def get_server_loop() -> str:
+	return os.getenv("SERVER_LOOP", "auto").strip().lower()
+
+
+def get_server_http() -> str:
+	return os.getenv("SERVER_HTTP", "auto").strip().lower()
+
+
+def get_server_keepalive_seconds() -> int:
+	return _get_int("SERVER_KEEPALIVE_SECONDS", 5)
+
+
+def get_server_backlog() -> int:
+	return _get_int("SERVER_BACKLOG", 2048)
+
+
+def get_server_limit_concurrency() -> int | None:
+	"""Per-worker cap on open connections before 503s; ``None`` (no cap) when 0 or unset."""
+	return _get_int("SERVER_LIMIT_CONCURRENCY", 0) or None
+
+
+def get_server_graceful_timeout() -> int:
+	return _get_int("SERVER_GRACEFUL_TIMEOUT", 30)
+
+
+def get_server_access_log() -> bool:
+	return os.getenv("SERVER_ACCESS_LOG", "true").strip().lower() != "false"
+
+
+def is_sql_configured() -> bool:
+	return get_db_backend() == "sqlite" or bool(get_sql_connection_string())
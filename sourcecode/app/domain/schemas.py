@@ -1,6 +1,7 @@
 """Pydantic schemas for all request/response models."""
 from __future__ import annotations
 from pydantic import BaseModel, Field
+from datetime import datetime
 from typing import Literal, Optional, List
 
 
@@ -162,6 +163,30 @@ class DashboardManagerResponse(BaseModel):
     jobs_with_eta: List[dict]
 
 
+# ─── Bulk import ──────────────────────────────────────────────────────────────
+
+class CustomerImport(BaseModel):
+    id: Optional[str] = None
+    name: str
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    preferred_contact: str = "chatbot"
+
+class VehicleImport(VehicleCreate):
+    id: Optional[str] = None
+    customer_id: str
+    fuel_type: Optional[str] = None
+    transmission: Optional[str] = None
+    registration_number: Optional[str] = None
+
+class JobCardImport(JobCardCreate):
+    id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    status: str = "closed"   # historical job cards default to closed
+
+
 # ─── Agent / AI ──────────────────────────────────────────────────────────────
 
 class MasterAgentRequest(BaseModel):
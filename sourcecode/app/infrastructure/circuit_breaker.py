@@ -0,0 +1,114 @@
+"""Circuit breaker with exponential backoff and half-open probing."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of attempting a call while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Trip after ``failure_threshold`` consecutive failures.
+
+    While open, calls fail fast.  Once the backoff elapses a single caller is
+    let through as a half-open probe: success closes the breaker, failure
+    re-opens it with the backoff doubled (capped at ``max_backoff``).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._state = CLOSED
+        self._failures = 0
+        self._trips = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+        self._last_error: str | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def would_allow(self) -> bool:
+        """What ``allow`` would answer now, without claiming the half-open probe or counting a rejection."""
+        with self._lock:
+            if self._state == OPEN:
+                return self._clock() >= self._open_until
+            return self._state == CLOSED or not self._probe_in_flight
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self._clock() >= self._open_until:
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trips = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: BaseException | str | None = None) -> None:
+        with self._lock:
+            self._failures += 1
+            if error is not None:
+                self._last_error = str(error)
+            if self._state == HALF_OPEN or self._failures >= self._failure_threshold:
+                backoff = min(self._max_backoff, self._base_backoff * (2 ** self._trips))
+                self._trips += 1
+                self._state = OPEN
+                self._open_until = self._clock() + backoff
+                self._probe_in_flight = False
+
+    def call(self, fn: Callable[[], object]) -> object:
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        try:
+            result = fn()
+        except Exception as exc:
+            self.record_failure(exc)
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = max(0.0, self._open_until - self._clock()) if self._state == OPEN else 0.0
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "trips": self._trips,
+                "retry_in_seconds": round(retry_in, 3),
+                "rejected_calls": self._rejected,
+                "last_error": self._last_error,
+            }
@@ -0,0 +1,164 @@
+"""Bounded, thread-safe DB-API connection pool used by db_service."""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+
+class PoolTimeout(RuntimeError):
+    """Raised when no connection could be checked out within the pool timeout."""
+
+
+class ConnectionPool:
+    """LIFO pool of DB-API connections with overflow and idle pre-ping.
+
+    - ``size`` connections are kept open once created; up to ``max_overflow``
+      extra connections are opened under load and closed on checkin.
+    - A connection is pinged on checkout only when it sat idle longer than
+      ``pre_ping_idle`` seconds, so hot connections cost no extra round trip.
+    """
+
+    def __init__(
+        self,
+        creator: Callable[[], Any],
+        size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        pre_ping_idle: float = 30.0,
+        ping: Optional[Callable[[Any], None]] = None,
+        is_disconnect: Optional[Callable[[BaseException], bool]] = None,
+    ) -> None:
+        self._creator = creator
+        self._size = max(1, size)
+        self._max_overflow = max(0, max_overflow)
+        self._timeout = timeout
+        self._pre_ping_idle = pre_ping_idle
+        self._ping = ping or (lambda conn: conn.execute("SELECT 1"))
+        self._is_disconnect = is_disconnect or (lambda exc: False)
+
+        self._idle: list[tuple[Any, float]] = []   # (connection, last_used)
+        self._open = 0
+        self._checked_out = 0
+        self._cond = threading.Condition()
+
+        self._stats = {
+            "checkouts": 0,
+            "connects": 0,
+            "pings": 0,
+            "invalidated": 0,
+            "waits": 0,
+            "timeouts": 0,
+        }
+
+    # ── checkout / checkin ───────────────────────────────────────────────────
+
+    def checkout(self) -> Any:
+        deadline = time.monotonic() + self._timeout
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    self._checked_out += 1
+                    self._stats["checkouts"] += 1
+                    break
+                if self._open < self._size + self._max_overflow:
+                    self._open += 1
+                    self._checked_out += 1
+                    self._stats["checkouts"] += 1
+                    conn, last_used = None, 0.0
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"No DB connection available within {self._timeout:.1f}s "
+                        f"(size={self._size}, max_overflow={self._max_overflow})"
+                    )
+                self._stats["waits"] += 1
+                self._cond.wait(remaining)
+
+        # Connect / ping outside the lock so slow I/O never blocks other threads.
+        try:
+            if conn is None:
+                return self._connect()
+            if time.monotonic() - last_used > self._pre_ping_idle:
+                with self._cond:
+                    self._stats["pings"] += 1
+                try:
+                    self._ping(conn)
+                except Exception:
+                    self._close_quietly(conn)
+                    with self._cond:
+                        self._stats["invalidated"] += 1
+                    return self._connect()
+            return conn
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._checked_out -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, conn: Any, invalidate: bool = False) -> None:
+        with self._cond:
+            self._checked_out -= 1
+            if invalidate or len(self._idle) >= self._size:
+                self._open -= 1
+                if invalidate:
+                    self._stats["invalidated"] += 1
+                close = True
+            else:
+                self._idle.append((conn, time.monotonic()))
+                close = False
+            self._cond.notify()
+        if close:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self.checkout()
+        invalidate = False
+        try:
+            yield conn
+        except BaseException as exc:
+            invalidate = self._is_disconnect(exc)
+            raise
+        finally:
+            self.checkin(conn, invalidate=invalidate)
+
+    # ── housekeeping ─────────────────────────────────────────────────────────
+
+    def dispose(self) -> None:
+        """Close every idle connection; checked-out ones close on checkin."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "max_overflow": self._max_overflow,
+                "open": self._open,
+                "idle": len(self._idle),
+                "checked_out": self._checked_out,
+                "overflow": max(0, self._open - self._size),
+                **self._stats,
+            }
+
+    def _connect(self) -> Any:
+        conn = self._creator()
+        with self._cond:
+            self._stats["connects"] += 1
+        return conn
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
@@ -0,0 +1,247 @@
+"""In-process SQL query metrics, rendered in Prometheus text format.
+
+db_service and SqlRepository time every statement they send through
+``QUERY_METRICS.track()``.  Statements are grouped by fingerprint: literals,
+numbers and ``IN (...)`` lists collapse to placeholders, so the same query with
+different arguments lands in one series.  Each series keeps a call count, a
+latency histogram, rows and approximate bytes fetched, and errors; repository
+lookups also count which schema variant (v2/v1/v0) served them and how often
+an earlier variant failed first.
+
+Queries slower than DB_SLOW_QUERY_MS are logged and kept in a short ring for
+``/api/health/queries``.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional
+
+from app.config.settings import get_slow_query_ms
+
+logger = logging.getLogger("uvicorn.error")
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_FINGERPRINTS = 500   # further distinct statements are folded into one "other" series
+_OTHER = "other"
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"N?'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND = re.compile(r"\?|:\w+|__\[POSTCOMPILE_\w+\]")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_VALUES_LIST = re.compile(r"\bVALUES\s*(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+", re.I)
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql: str) -> str:
+    """Normalised statement text: arguments and list lengths removed, whitespace collapsed."""
+    text = _COMMENT.sub(" ", sql)
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _BIND.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    text = _VALUES_LIST.sub(r"VALUES \1", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+def _query_id(fp: str) -> str:
+    return hashlib.sha1(fp.encode("utf-8")).hexdigest()[:12]
+
+
+def _value_bytes(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    return 8
+
+
+def result_bytes(rows: Iterable[Any]) -> int:
+    """Approximate payload size of fetched rows (string lengths, 8 bytes per scalar)."""
+    total = 0
+    for row in rows:
+        values = row.values() if isinstance(row, dict) else row
+        for value in values:
+            total += _value_bytes(value)
+    return total
+
+
+@dataclass
+class _Series:
+    source: str
+    query: str
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    slow: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+
+
+class Observation:
+    """Handle yielded by ``track()``; ``fetched()`` adds each result set read."""
+
+    __slots__ = ("rows", "bytes")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.bytes = 0
+
+    def fetched(self, rows: list) -> list:
+        self.rows += len(rows)
+        self.bytes += result_bytes(rows)
+        return rows
+
+
+class QueryMetrics:
+    def __init__(self, slow_ms: Optional[float] = None, slow_log_size: int = 50) -> None:
+        self._slow_ms = get_slow_query_ms() if slow_ms is None else slow_ms
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._variants: dict[tuple[str, str, str], int] = {}
+        self._slow_log: deque[dict] = deque(maxlen=slow_log_size)
+
+    # ── recording ────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def track(self, sql: Any, source: str) -> Iterator[Observation]:
+        obs = Observation()
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield obs
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.observe(str(sql), source, time.perf_counter() - start, obs.rows, obs.bytes, failed)
+
+    def observe(
+        self, sql: str, source: str, seconds: float, rows: int = 0, nbytes: int = 0, error: bool = False
+    ) -> None:
+        fp = fingerprint(sql)
+        qid = _query_id(fp)
+        slow = self._slow_ms > 0 and seconds * 1000 >= self._slow_ms
+        with self._lock:
+            series = self._series.get((source, qid))
+            if series is None:
+                if len(self._series) >= MAX_FINGERPRINTS:
+                    qid = _OTHER
+                    series = self._series.setdefault((source, qid), _Series(source, _OTHER))
+                else:
+                    series = self._series[(source, qid)] = _Series(source, fp)
+            series.calls += 1
+            series.seconds += seconds
+            series.rows += rows
+            series.bytes += nbytes
+            if error:
+                series.errors += 1
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    series.buckets[i] += 1
+                    break
+            if slow:
+                series.slow += 1
+                self._slow_log.append({
+                    "source": source, "query_id": qid, "query": fp, "ms": round(seconds * 1000, 1),
+                    "rows": rows, "error": error, "at": time.time(),
+                })
+        if slow:
+            logger.warning(f"  Slow query [{source}] {seconds * 1000:.0f} ms, {rows} rows: {fp[:300]}")
+
+    def variant(self, entity: str, variant: str, outcome: str) -> None:
+        """Count a repository lookup by the schema variant tried and its outcome (``ok``/``error``)."""
+        key = (entity, variant, outcome)
+        with self._lock:
+            self._variants[key] = self._variants.get(key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._variants.clear()
+            self._slow_log.clear()
+
+    # ── reporting ────────────────────────────────────────────────────────────
+
+    def snapshot(self, top: int = 20) -> dict:
+        """Heaviest statements by total time, variant counts and recent slow queries."""
+        with self._lock:
+            series = sorted(self._series.items(), key=lambda kv: kv[1].seconds, reverse=True)[:top]
+            return {
+                "slow_query_ms": self._slow_ms,
+                "queries": [
+                    {
+                        "source": s.source, "query_id": qid, "query": s.query, "calls": s.calls,
+                        "errors": s.errors, "rows": s.rows, "bytes": s.bytes, "slow": s.slow,
+                        "total_ms": round(s.seconds * 1000, 1),
+                        "mean_ms": round(s.seconds * 1000 / s.calls, 3) if s.calls else 0.0,
+                    }
+                    for (_, qid), s in series
+                ],
+                "variants": [
+                    {"entity": e, "variant": v, "outcome": o, "count": n}
+                    for (e, v, o), n in sorted(self._variants.items())
+                ],
+                "slow_log": list(self._slow_log),
+            }
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            items = sorted(self._series.items())
+            variants = sorted(self._variants.items())
+            lines: list[str] = []
+
+            def family(name: str, kind: str, help_text: str) -> None:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+            def labels(source: str, qid: str, series: _Series, **extra: str) -> str:
+                pairs = {"source": source, "query_id": qid, "query": series.query[:200], **extra}
+                return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items()) + "}"
+
+            family("sql_query_duration_seconds", "histogram", "SQL statement latency by fingerprint.")
+            for (source, qid), s in items:
+                cumulative = 0
+                for bound, n in zip(BUCKETS, s.buckets):
+                    cumulative += n
+                    lines.append(f"sql_query_duration_seconds_bucket{labels(source, qid, s, le=_num(bound))} {cumulative}")
+                lines.append(f"sql_query_duration_seconds_bucket{labels(source, qid, s, le='+Inf')} {s.calls}")
+                lines.append(f"sql_query_duration_seconds_sum{labels(source, qid, s)} {s.seconds:.6f}")
+                lines.append(f"sql_query_duration_seconds_count{labels(source, qid, s)} {s.calls}")
+            for name, attr, help_text in (
+                ("sql_query_rows_total", "rows", "Rows fetched by SQL statements."),
+                ("sql_query_bytes_total", "bytes", "Approximate bytes fetched by SQL statements."),
+                ("sql_query_errors_total", "errors", "SQL statements that raised."),
+                ("sql_slow_queries_total", "slow", "SQL statements slower than DB_SLOW_QUERY_MS."),
+            ):
+                family(name, "counter", help_text)
+                for (source, qid), s in items:
+                    lines.append(f"{name}{labels(source, qid, s)} {getattr(s, attr)}")
+            family("sql_repository_variant_total", "counter", "Repository lookups by schema variant and outcome.")
+            for (entity, variant, outcome), n in variants:
+                lines.append(
+                    f'sql_repository_variant_total{{entity="{_escape(entity)}",variant="{_escape(variant)}",'
+                    f'outcome="{outcome}"}} {n}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    return repr(float(value))
+
+
+QUERY_METRICS = QueryMetrics()
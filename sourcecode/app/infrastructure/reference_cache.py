@@ -0,0 +1,195 @@
+"""In-process read-through cache for the slowly-changing catalog tables.
+
+Parts, Labor_Operations and Fault_Code_Mappings are loaded in bulk and kept
+as dictionaries keyed by part id/code, fault code and labor id.  Keys missing
+from the snapshot are reported back to the caller so it can read them from the
+database and ``store()`` the result; keys the database does not know either
+are remembered until the next reload so unknown codes do not hit SQL again.
+
+Keys are matched trimmed and upper-cased, as the database's case-insensitive
+collation matches them.  A failed load is retried with exponential backoff
+(``RELOAD_BACKOFF`` doubling up to ``RELOAD_BACKOFF_MAX`` seconds); until
+then lookups go straight to the database.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger("uvicorn.error")
+
+TABLES = ("parts", "faults", "labor")
+RELOAD_BACKOFF = 5.0
+RELOAD_BACKOFF_MAX = 300.0
+
+# Row field(s) each table is indexed by.
+_KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    "parts": ("part_id", "part_code"),
+    "faults": ("fault_code",),
+    "labor": ("labor_id",),
+}
+
+
+def _norm(key: Any) -> str:
+    return str(key).strip().upper()
+
+
+class ReferenceCache:
+    def __init__(
+        self,
+        loader: Callable[[], dict[str, list[dict[str, Any]]]],
+        ttl: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._loader = loader
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: dict[str, dict[str, dict[str, Any]]] = {t: {} for t in TABLES}
+        self._unknown: dict[str, set[str]] = {t: set() for t in TABLES}
+        self._loaded_at: float | None = None
+        self._counters: dict[str, dict[str, int]] = {
+            t: {"hits": 0, "misses": 0} for t in TABLES
+        }
+        self._loads = 0
+        self._load_errors = 0
+        self._retry_at: float | None = None   # earliest automatic reload after a failure
+        self._backoff = RELOAD_BACKOFF
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    # ── loading ──────────────────────────────────────────────────────────────
+
+    def reload(self) -> bool:
+        """Bulk-load every table; keeps the previous snapshot if the load fails."""
+        if not self.enabled:
+            return False
+        try:
+            data = self._loader()
+        except Exception as exc:
+            with self._lock:
+                self._load_errors += 1
+                backoff = self._backoff
+                self._retry_at = self._clock() + backoff
+                self._backoff = min(backoff * 2, RELOAD_BACKOFF_MAX)
+            logger.warning(f"  Reference cache load failed: {exc} — retrying in {backoff:.0f}s")
+            return False
+        index = {t: self._build_index(t, data.get(t) or []) for t in TABLES}
+        with self._lock:
+            self._index = index
+            self._unknown = {t: set() for t in TABLES}
+            self._loaded_at = self._clock()
+            self._loads += 1
+            self._retry_at = None
+            self._backoff = RELOAD_BACKOFF
+        logger.info(
+            " Reference cache loaded: "
+            + ", ".join(f"{t}={len(data.get(t) or [])}" for t in TABLES)
+        )
+        return True
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next lookup reloads it."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_fresh(self) -> bool:
+        if not self.enabled:
+            return False
+        loaded_at = self._loaded_at
+        now = self._clock()
+        if loaded_at is not None and now - loaded_at < self._ttl:
+            return True
+        retry_at = self._retry_at
+        if retry_at is not None and now < retry_at:
+            return False
+        return self.reload()
+
+    @staticmethod
+    def _build_index(table: str, rows: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        index: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            row = dict(row)
+            for key_field in _KEY_FIELDS[table]:
+                key = row.get(key_field)
+                if key is not None and _norm(key) not in index:
+                    index[_norm(key)] = row
+        return index
+
+    # ── lookups ──────────────────────────────────────────────────────────────
+
+    def lookup(self, table: str, keys: Iterable[str]) -> tuple[list[dict[str, Any]], list[str]]:
+        """Return (rows found, keys that must be read from the database)."""
+        keys = [str(k) for k in keys]
+        if not self._ensure_fresh():
+            return [], keys
+        rows: list[dict[str, Any]] = []
+        missing: list[str] = []
+        missing_norm: set[str] = set()
+        seen: set[int] = set()
+        with self._lock:
+            index = self._index[table]
+            unknown = self._unknown[table]
+            counters = self._counters[table]
+            for key in keys:
+                norm = _norm(key)
+                row = index.get(norm)
+                if row is not None:
+                    counters["hits"] += 1
+                    if id(row) not in seen:
+                        seen.add(id(row))
+                        rows.append(dict(row))
+                elif norm in unknown:
+                    counters["hits"] += 1
+                else:
+                    counters["misses"] += 1
+                    if norm not in missing_norm:
+                        missing_norm.add(norm)
+                        missing.append(key)
+        return rows, missing
+
+    def store(self, table: str, rows: Iterable[dict[str, Any]], requested: Iterable[str] = ()) -> None:
+        """Merge rows read from the database after a miss.
+
+        Requested keys the database returned nothing for are remembered as
+        unknown — unless a returned row is keyed under a spelling none of the
+        requested keys normalise to, since the database may have matched it
+        to one of them by collation rules this cache does not reproduce.
+        """
+        if not self.enabled or self._loaded_at is None:
+            return
+        fetched = self._build_index(table, rows)
+        requested = {_norm(k) for k in requested}
+        answered_elsewhere = any(
+            not requested.intersection(_norm(row[f]) for f in _KEY_FIELDS[table] if row.get(f) is not None)
+            for row in {id(r): r for r in fetched.values()}.values()
+        )
+        with self._lock:
+            index = self._index[table]
+            index.update((k, v) for k, v in fetched.items() if k not in index)
+            if not answered_elsewhere:
+                self._unknown[table].update(k for k in requested if k not in index)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            age = None if self._loaded_at is None else round(self._clock() - self._loaded_at, 1)
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self._ttl,
+                "age_seconds": age,
+                "loads": self._loads,
+                "load_errors": self._load_errors,
+                "retry_in_seconds": None if self._retry_at is None else max(0.0, round(self._retry_at - self._clock(), 1)),
+                "tables": {
+                    t: {
+                        "entries": len({id(r) for r in self._index[t].values()}),
+                        "unknown_keys": len(self._unknown[t]),
+                        **self._counters[t],
+                    }
+                    for t in TABLES
+                },
+            }
@@ -0,0 +1,178 @@
+"""Login session stores — O(1) token lookup with TTL expiry and an LRU bound.
+
+``MemorySessionStore`` keeps sessions in the process; it is the default and
+is enough for a single uvicorn worker.  ``SqliteSessionStore`` keeps them in
+a SQLite file in WAL mode that every worker on the host opens, so a token
+issued by one worker is valid on all of them.
+
+Expiry slides: each lookup extends a session to ``ttl`` seconds from now.
+The SQLite store writes that extension back at most once per ``touch_every``
+seconds per session, so authenticated reads rarely take the write lock.
+When a store holds more than ``max_entries`` sessions the least recently
+used are dropped (the SQLite store prunes every ``prune_every`` writes).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class MemorySessionStore:
+    def __init__(
+        self,
+        ttl: float = 8 * 3600,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[str, tuple[dict, float]] = OrderedDict()  # token -> (session, expires_at)
+        self._evicted = 0
+        self._expired = 0
+
+    def put(self, token: str, session: dict) -> None:
+        with self._lock:
+            self._sessions[token] = (session, self._clock() + self._ttl)
+            self._sessions.move_to_end(token)
+            while len(self._sessions) > self._max_entries:
+                self._sessions.popitem(last=False)
+                self._evicted += 1
+
+    def get(self, token: str) -> Optional[dict]:
+        now = self._clock()
+        with self._lock:
+            entry = self._sessions.get(token)
+            if entry is None:
+                return None
+            session, expires_at = entry
+            if expires_at <= now:
+                del self._sessions[token]
+                self._expired += 1
+                return None
+            self._sessions[token] = (session, now + self._ttl)
+            self._sessions.move_to_end(token)
+            return session
+
+    def delete(self, token: str) -> None:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "sessions": len(self._sessions),
+                "ttl_seconds": self._ttl,
+                "max_entries": self._max_entries,
+                "evicted": self._evicted,
+                "expired": self._expired,
+            }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    token      TEXT PRIMARY KEY,
+    data       TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used  REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_sessions_last_used ON sessions (last_used);
+"""
+
+
+class SqliteSessionStore:
+    """Sessions shared by every worker that opens the same file (wall-clock expiry)."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 8 * 3600,
+        max_entries: int = 10000,
+        touch_every: float = 60.0,
+        prune_every: int = 100,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._touch_every = touch_every
+        self._prune_every = prune_every
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets readers in every worker proceed during a write."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, token: str, session: dict) -> None:
+        now = self._clock()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO sessions (token, data, expires_at, last_used) VALUES (?, ?, ?, ?)",
+            (token, json.dumps(session), now + self._ttl, now),
+        )
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self._prune_every == 0
+        if prune:
+            self.prune()
+
+    def get(self, token: str) -> Optional[dict]:
+        now = self._clock()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT data, expires_at, last_used FROM sessions WHERE token = ?", (token,)
+        ).fetchone()
+        if row is None:
+            return None
+        data, expires_at, last_used = row
+        if expires_at <= now:
+            conn.execute("DELETE FROM sessions WHERE token = ? AND expires_at <= ?", (token, now))
+            return None
+        if now - last_used >= self._touch_every:
+            conn.execute(
+                "UPDATE sessions SET expires_at = ?, last_used = ? WHERE token = ?", (now + self._ttl, now, token)
+            )
+        return json.loads(data)
+
+    def delete(self, token: str) -> None:
+        self._conn().execute("DELETE FROM sessions WHERE token = ?", (token,))
+
+    def prune(self) -> int:
+        """Drop expired sessions, then the least recently used beyond ``max_entries``."""
+        conn = self._conn()
+        removed = conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (self._clock(),)).rowcount
+        removed += conn.execute(
+            "DELETE FROM sessions WHERE token IN "
+            "(SELECT token FROM sessions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        ).rowcount
+        return removed
+
+    def stats(self) -> dict:
+        (count,) = self._conn().execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "sessions": count,
+            "ttl_seconds": self._ttl,
+            "max_entries": self._max_entries,
+        }
@@ -1,22 +1,53 @@
 """SQL repository for knowledge lookups."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Iterable
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
 from urllib.parse import quote_plus
 
-from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 
-from app.config.settings import get_sql_connection_string
+from app.config.settings import (
+    get_db_backend,
+    get_reference_cache_ttl,
+    get_sql_connection_string,
+    get_sqlite_path,
+    get_sqlite_seed,
+)
+from app.infrastructure.query_metrics import QUERY_METRICS
+from app.infrastructure.reference_cache import ReferenceCache
+from app.infrastructure.sql_schema import QueryRegistry, get_registry, refresh_registry
+
+# Catalog entities served through the reference cache -> their key parameter.
+_CACHED_LOOKUPS = {"parts": "part_codes", "faults": "fault_codes", "labor": "labor_ids"}
+
+_write_listeners: list[Callable[[str, dict[str, Any]], None]] = []
+
+
+def on_write(listener: Callable[[str, dict[str, Any]], None]) -> None:
+    """Call ``listener(entity, params)`` after every write a repository commits."""
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
 
 
 @dataclass
 class SqlRepository:
     engine: Engine
+    reference_cache: ReferenceCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.reference_cache = ReferenceCache(
+            self._load_reference_data, ttl=get_reference_cache_ttl()
+        )
 
     @classmethod
     def from_env(cls) -> "SqlRepository":
+        if get_db_backend() == "sqlite":
+            from app.infrastructure import sqlite_engine
+            return cls(engine=sqlite_engine.create_engine(get_sqlite_path(), seed=get_sqlite_seed()))
         connection_string = get_sql_connection_string()
         if connection_string:
             connection_string = connection_string.strip().strip("\"").strip("'")
@@ -46,380 +77,229 @@ class SqlRepository:
         engine = create_engine(url, pool_pre_ping=True)
         return cls(engine=engine)
 
-    def fetch_one(self, query: str, params: dict[str, Any]) -> dict[str, Any] | None:
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query), params).mappings().first()
-            return dict(result) if result else None
+    @property
+    def queries(self) -> QueryRegistry:
+        """Per-process statement registry, probed from INFORMATION_SCHEMA on first use."""
+        return get_registry(self.engine)
 
-    def fetch_all(self, query: str, params: dict[str, Any]) -> list[dict[str, Any]]:
-        with self.engine.connect() as conn:
-            rows = conn.execute(text(query), params).mappings().all()
-            return [dict(row) for row in rows]
+    @property
+    def schema_dialect(self) -> dict[str, str]:
+        """Schema variant chosen for each entity (``v2``/``v1``/``v0`` or ``unresolved``)."""
+        return dict(self.queries.dialects)
 
-    def get_vehicle_details(self, vehicle_id: str) -> dict[str, Any] | None:
-        query_v2 = """
-        SELECT TOP 1
-            id AS vehicle_id,
-            customer_id,
-            make,
-            model,
-            year,
-            vin
-        FROM Vehicles
-        WHERE id = :vehicle_id
-        """
-        query_v1 = """
-        SELECT TOP 1
-            id AS vehicle_id,
-            customerId AS customer_id,
-            make,
-            model,
-            year,
-            vin
-        FROM Vehicles
-        WHERE id = :vehicle_id
-        """
+    def refresh_schema(self) -> QueryRegistry:
+        """Re-probe the schema after a migration and swap in the new statements."""
+        return refresh_registry(self.engine)
+
+    def _load_reference_data(self) -> dict[str, list[dict[str, Any]]]:
+        return {entity: self._query_all(f"{entity}_all", {}) for entity in _CACHED_LOOKUPS}
+
+    def _cached_lookup(self, entity: str, keys: Iterable[str]) -> list[dict[str, Any]]:
+        rows, missing = self.reference_cache.lookup(entity, keys)
+        if missing:
+            fetched = self._query_all(entity, {_CACHED_LOOKUPS[entity]: missing})
+            self.reference_cache.store(entity, fetched, requested=missing)
+            rows.extend(fetched)
+        return rows
+
+    def fetch_one(self, query: str | TextClause, params: dict[str, Any]) -> dict[str, Any] | None:
+        with QUERY_METRICS.track(query, "repository") as q, self.engine.connect() as conn:
+            stmt = text(query) if isinstance(query, str) else query
+            result = conn.execute(stmt, params).mappings().first()
+            return q.fetched([dict(result)])[0] if result else None
+
+    def fetch_all(self, query: str | TextClause, params: dict[str, Any]) -> list[dict[str, Any]]:
+        with QUERY_METRICS.track(query, "repository") as q, self.engine.connect() as conn:
+            stmt = text(query) if isinstance(query, str) else query
+            rows = conn.execute(stmt, params).mappings().all()
+            return q.fetched([dict(row) for row in rows])
+
+    def _exec(self, stmt: TextClause, params: dict[str, Any]) -> None:
+        with QUERY_METRICS.track(stmt, "repository"), self.engine.begin() as conn:
+            conn.execute(stmt, params)
+
+    def _with_fallbacks(self, entity: str, run):
+        """Try each schema variant of ``entity`` in order; the last one's error propagates."""
+        names = self.queries.variant_names(entity)
+        *fallbacks, last = zip(self.queries.candidates(entity), names)
+        for stmt, name in fallbacks:
+            try:
+                result = run(stmt)
+            except Exception:
+                QUERY_METRICS.variant(entity, name, "error")
+                continue
+            QUERY_METRICS.variant(entity, name, "ok")
+            return result
+        stmt, name = last
         try:
-            return self.fetch_one(query_v2, {"vehicle_id": vehicle_id})
+            result = run(stmt)
         except Exception:
-            return self.fetch_one(query_v1, {"vehicle_id": vehicle_id})
+            QUERY_METRICS.variant(entity, name, "error")
+            raise
+        QUERY_METRICS.variant(entity, name, "ok")
+        return result
+
+    def _query_one(self, entity: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        return self._with_fallbacks(entity, lambda stmt: self.fetch_one(stmt, params))
+
+    def _query_all(self, entity: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return self._with_fallbacks(entity, lambda stmt: self.fetch_all(stmt, params))
+
+    def _execute(self, entity: str, params: dict[str, Any]) -> None:
+        self._with_fallbacks(entity, lambda stmt: self._exec(stmt, params))
+        for listener in _write_listeners:
+            listener(entity, params)
+
+    def get_vehicle_details(self, vehicle_id: str) -> dict[str, Any] | None:
+        return self._query_one("vehicle", {"vehicle_id": vehicle_id})
 
     def get_customer_details(self, customer_id: str) -> dict[str, Any] | None:
-        query_v2 = """
-        SELECT TOP 1
-            id AS customer_id,
-            name,
-            phone,
-            email,
-            preferredContact AS preferred_contact
-        FROM Customers
-        WHERE id = :customer_id
-        """
-        query_v1 = """
-        SELECT TOP 1
-            id AS customer_id,
-            name,
-            phone,
-            email,
-            preferred_contact
-        FROM Customers
-        WHERE id = :customer_id
-        """
-        try:
-            return self.fetch_one(query_v2, {"customer_id": customer_id})
-        except Exception:
-            return self.fetch_one(query_v1, {"customer_id": customer_id})
+        return self._query_one("customer", {"customer_id": customer_id})
 
     def get_parts_details(self, part_codes: Iterable[str]) -> list[dict[str, Any]]:
         if not part_codes:
             return []
-        query_v2 = text(
-            """
-            SELECT
-                id AS part_id,
-                code AS part_code,
-                description,
-                unitPrice AS unit_price,
-                category
-            FROM Parts
-            WHERE code IN :part_codes OR id IN :part_codes
-            """
-        ).bindparams(bindparam("part_codes", expanding=True))
-        query_v1 = text(
-            """
-            SELECT
-                id AS part_id,
-                part_code,
-                part_description AS description,
-                unit_price,
-                category
-            FROM Parts
-            WHERE part_code IN :part_codes OR id IN :part_codes
-            """
-        ).bindparams(bindparam("part_codes", expanding=True))
-        query_v0 = text(
-            """
-            SELECT
-                id AS part_id,
-                NULL AS part_code,
-                NULL AS description,
-                NULL AS unit_price,
-                NULL AS category
-            FROM Parts
-            WHERE id IN :part_codes
-            """
-        ).bindparams(bindparam("part_codes", expanding=True))
-        with self.engine.connect() as conn:
-            try:
-                rows = conn.execute(query_v2, {"part_codes": list(part_codes)}).mappings().all()
-            except Exception:
-                try:
-                    rows = conn.execute(query_v1, {"part_codes": list(part_codes)}).mappings().all()
-                except Exception:
-                    rows = conn.execute(query_v0, {"part_codes": list(part_codes)}).mappings().all()
-            return [dict(row) for row in rows]
-    
+        return self._cached_lookup("parts", part_codes)
+
     def get_fault_code_details(self, fault_codes: Iterable[str]) -> list[dict[str, Any]]:
         if not fault_codes:
             return []
+        return self._cached_lookup("faults", fault_codes)
 
-        query_v2 = text(
-            """
-            SELECT
-                fault_code AS fault_code,
-                description,
-                labor_operation_id AS labor_operation_id,
-                warranty_eligible AS warranty_eligible
-            FROM Fault_Code_Mappings
-            WHERE fault_code IN :fault_codes
-            """
-        ).bindparams(bindparam("fault_codes", expanding=True))
-
-        query_v1 = text(
-            """
-            SELECT
-                faultCode AS fault_code,
-                description,
-                laborOperationId AS labor_operation_id,
-                warrantyEligible AS warranty_eligible
-            FROM FaultCodes
-            WHERE faultCode IN :fault_codes
-            """
-        ).bindparams(bindparam("fault_codes", expanding=True))
-
-        query_v0 = text(
-            """
-            SELECT
-                fault_code AS fault_code,
-                description,
-                laborOperationId AS labor_operation_id,
-                warrantyEligible AS warranty_eligible
-            FROM Fault_Codes
-            WHERE fault_code IN :fault_codes
-            """
-        ).bindparams(bindparam("fault_codes", expanding=True))
-
-        with self.engine.connect() as conn:
-            try:
-                rows = conn.execute(query_v2, {"fault_codes": list(fault_codes)}).mappings().all()
-            except Exception:
-                try:
-                    rows = conn.execute(query_v1, {"fault_codes": list(fault_codes)}).mappings().all()
-                except Exception:
-                    rows = conn.execute(query_v0, {"fault_codes": list(fault_codes)}).mappings().all()
-            return [dict(row) for row in rows]
-        
     def get_vehicle_by_registration(self, registration_number: str) -> dict[str, Any] | None:
-        query_v2 = """
-        SELECT TOP 1
-            id AS vehicle_id,
-            customer_id,
-            make,
-            model,
-            year,
-            vin
-        FROM Vehicles
-        WHERE registration_number = :registration_number
-        """
-        query_v1 = """
-        SELECT TOP 1
-            id AS vehicle_id,
-            customerId AS customer_id,
-            make,
-            model,
-            year,
-            vin
-        FROM Vehicles
-        WHERE registration_number = :registration_number
-        """
-        try:
-            return self.fetch_one(query_v2, {"registration_number": registration_number})
-        except Exception:
-            return self.fetch_one(query_v1, {"registration_number": registration_number})
-    
+        return self._query_one("vehicle_by_registration", {"registration_number": registration_number})
+
     def get_labor_operations(self, labor_ids: Iterable[str]) -> list[dict[str, Any]]:
         if not labor_ids:
             return []
-
-        query_v2 = text(
-            """
-            SELECT
-                id AS labor_id,
-                name,
-                hourlyRate AS hourly_rate,
-                estimatedHours AS estimated_hours
-            FROM LaborOperations
-            WHERE id IN :labor_ids
-            """
-        ).bindparams(bindparam("labor_ids", expanding=True))
-
-        query_v1 = text(
-            """
-            SELECT
-                id AS labor_id,
-                name,
-                hourly_rate,
-                estimated_hours
-            FROM Labor_Operations
-            WHERE id IN :labor_ids
-            """
-        ).bindparams(bindparam("labor_ids", expanding=True))
-
-        with self.engine.connect() as conn:
-            try:
-                rows = conn.execute(query_v2, {"labor_ids": list(labor_ids)}).mappings().all()
-            except Exception:
-                rows = conn.execute(query_v1, {"labor_ids": list(labor_ids)}).mappings().all()
-            return [dict(row) for row in rows]
+        return self._cached_lookup("labor", labor_ids)
 
     def get_job_card_details(self, job_card_id: str) -> dict[str, Any] | None:
-        query_v2 = """
-        SELECT TOP 1
-            id AS job_card_id,
-            customer_id,
-            vehicle_id,
-            status,
-            created_at,
-            complaint,
-            service_type,
-            mileage,
-            risk_indicators,
-            advisor_id,
-            intake_payload_json
-        FROM Job_Cards
-        WHERE id = :job_card_id
-        """
-        query_v1 = """
-        SELECT TOP 1
-            id AS job_card_id,
-            customerId AS customer_id,
-            vehicleId AS vehicle_id,
-            status,
-            createdAt AS created_at,
-            complaint,
-            serviceType AS service_type,
-            mileage,
-            riskIndicators AS risk_indicators,
-            advisorId AS advisor_id,
-            intakePayloadJson AS intake_payload_json
-        FROM Job_Cards
-        WHERE id = :job_card_id
-        """
-        query_v0 = """
-        SELECT TOP 1
-            id AS job_card_id,
-            customer_id,
-            vehicle_id,
-            status,
-            created_at,
-            complaint,
-            service_type,
-            mileage,
-            risk_indicators,
-            advisor_id,
-            intake_payload_json
-        FROM Job_Cards
-        WHERE id = :job_card_id
-        """
-        try:
-            return self.fetch_one(query_v2, {"job_card_id": job_card_id})
-        except Exception:
-            try:
-                return self.fetch_one(query_v1, {"job_card_id": job_card_id})
-            except Exception:
-                return self.fetch_one(query_v0, {"job_card_id": job_card_id})
+        return self._query_one("job_card", {"job_card_id": job_card_id})
 
     def update_job_card_status(self, job_card_id: str, status: str) -> None:
-        query_v2 = """
-        UPDATE Job_Cards
-        SET status = :status
-        WHERE id = :job_card_id
-        """
-        query_v1 = """
-        UPDATE Job_Cards
-        SET status = :status
-        WHERE id = :job_card_id
-        """
-        query_v0 = """
-        UPDATE JobCards
-        SET status = :status
-        WHERE id = :job_card_id
-        """
-        params = {"job_card_id": job_card_id, "status": status}
-        with self.engine.begin() as conn:
-            try:
-                conn.execute(text(query_v2), params)
-            except Exception:
-                try:
-                    conn.execute(text(query_v1), params)
-                except Exception:
-                    conn.execute(text(query_v0), params)
+        self._execute("update_job_card_status", {"job_card_id": job_card_id, "status": status})
 
     def get_estimate_by_job_card(self, job_card_id: str) -> dict[str, Any] | None:
-        query_v2 = """
-        SELECT TOP 1
-            id AS estimate_id,
-            job_card_id,
-            created_at,
-            status,
-            parts_total,
-            labor_total,
-            tax,
-            grand_total AS total_amount
-        FROM Estimates
-        WHERE job_card_id = :job_card_id
-        ORDER BY created_at DESC
-        """
-        query_v1 = """
-        SELECT TOP 1
-            id AS estimate_id,
-            jobCardId AS job_card_id,
-            createdAt AS created_at,
-            status,
-            subtotal,
-            customerPayableAmount AS customer_payable_amount,
-            insurancePayableAmount AS insurance_payable_amount,
-            totalAmount AS total_amount
-        FROM Estimates
-        WHERE jobCardId = :job_card_id
-        ORDER BY createdAt DESC
-        """
-        try:
-            return self.fetch_one(query_v2, {"job_card_id": job_card_id})
-        except Exception:
-            return self.fetch_one(query_v1, {"job_card_id": job_card_id})
+        return self._query_one("estimate_by_job_card", {"job_card_id": job_card_id})
 
     def get_estimate_line_items(self, estimate_id: str) -> list[dict[str, Any]]:
         if not estimate_id:
             return []
-        query_v2 = """
-        SELECT
-            id AS line_item_id,
-            estimate_id,
-            type,
-            reference_id,
-            quantity,
-            unit_price,
-            total
-        FROM Estimate_Line_Items
-        WHERE estimate_id = :estimate_id
-        """
-        query_v1 = """
-        SELECT
-            id AS line_item_id,
-            estimateId AS estimate_id,
-            description,
-            quantity,
-            unitPrice AS unit_price,
-            hours,
-            ratePerHour AS rate_per_hour,
-            total
-        FROM Estimate_Line_Items
-        WHERE estimateId = :estimate_id
+        return self._query_all("estimate_line_items", {"estimate_id": estimate_id})
+
+    def get_lookup_bundle(
+        self,
+        vehicle_id: str | None,
+        customer_id: str | None,
+        part_codes: Iterable[str] | None,
+        fault_codes: Iterable[str] | None,
+    ) -> dict[str, Any]:
+        """Vehicle, customer, parts, faults and labor for one agent lookup.
+
+        Parts, faults and labor come from the reference cache; only the keys it
+        does not hold are queried.  On SQL Server the remaining SELECTs go out
+        as a single batch and are read back with ``nextset()``; labor for
+        uncached faults is resolved inside the batch, so nothing waits on an
+        earlier result.
         """
-        try:
-            return self.fetch_all(query_v2, {"estimate_id": estimate_id})
-        except Exception:
-            return self.fetch_all(query_v1, {"estimate_id": estimate_id})
+        cache = self.reference_cache
+        bundle: dict[str, Any] = {
+            "vehicle": None,
+            "customer": None,
+            "parts": [],
+            "faults": [],
+            "labor": [],
+        }
+        lookups: list[tuple[str, str, dict[str, Any]]] = []
+        if vehicle_id:
+            lookups.append(("vehicle", "vehicle", {"vehicle_id": vehicle_id}))
+        if customer_id:
+            lookups.append(("customer", "customer", {"customer_id": customer_id}))
+        if part_codes:
+            bundle["parts"], missing = cache.lookup("parts", part_codes)
+            if missing:
+                lookups.append(("parts", "parts", {"part_codes": missing}))
+        if fault_codes:
+            bundle["faults"], missing = cache.lookup("faults", fault_codes)
+            if missing:
+                lookups.append(("faults", "faults", {"fault_codes": missing}))
+                lookups.append(("labor", "labor_by_faults", {"fault_codes": missing}))
+            labor_ids = [f["labor_operation_id"] for f in bundle["faults"] if f.get("labor_operation_id")]
+            if labor_ids:
+                bundle["labor"], missing = cache.lookup("labor", dict.fromkeys(labor_ids))
+                if missing:
+                    lookups.append(("labor", "labor", {"labor_ids": missing}))
+        if not lookups:
+            return bundle
+
+        registry = self.queries
+        if any(len(registry.candidates(entity)) != 1 for _, entity, _ in lookups):
+            # Schema not fully resolved: keep per-entity variant fallbacks.
+            result_sets = [self._query_all(entity, params) for _, entity, params in lookups]
+        else:
+            statements = [(key, registry.candidates(entity)[0], params) for key, entity, params in lookups]
+            if self.engine.dialect.name == "mssql":
+                result_sets = self._execute_batch(statements)
+            else:
+                result_sets = []
+                with self.engine.connect() as conn:
+                    for _, stmt, params in statements:
+                        with QUERY_METRICS.track(stmt, "repository") as q:
+                            rows = conn.execute(stmt, params).mappings().all()
+                            result_sets.append(q.fetched([dict(row) for row in rows]))
+            for _, entity, _ in lookups:
+                QUERY_METRICS.variant(entity, registry.variant_names(entity)[0], "ok")
+
+        for (key, entity, params), rows in zip(lookups, result_sets):
+            if key in ("vehicle", "customer"):
+                bundle[key] = rows[0] if rows else None
+                continue
+            bundle[key].extend(rows)
+            cache.store(key, rows, requested=params.get(_CACHED_LOOKUPS.get(entity, ""), ()))
+        if len(bundle["labor"]) > 1:
+            bundle["labor"] = list({row.get("labor_id"): row for row in bundle["labor"]}.values())
+        return bundle
+
+    def _execute_batch(
+        self, statements: list[tuple[str, TextClause, dict[str, Any]]]
+    ) -> list[list[dict[str, Any]]]:
+        sql_parts: list[str] = []
+        args: list[Any] = []
+        for _, stmt, params in statements:
+            compiled = stmt.bindparams(**params).compile(
+                dialect=self.engine.dialect,
+                compile_kwargs={"render_postcompile": True},
+            )
+            sql_parts.append(str(compiled).strip())
+            args.extend(compiled.params[name] for name in compiled.positiontup or ())
+
+        batch = "SET NOCOUNT ON;\n" + ";\n".join(sql_parts) + ";"
+        with QUERY_METRICS.track(batch, "repository") as q, self.engine.connect() as conn:
+            cursor = conn.connection.cursor()
+            try:
+                cursor.execute(batch, args)
+                result_sets: list[list[dict[str, Any]]] = []
+                while True:
+                    if cursor.description is not None:
+                        cols = [d[0] for d in cursor.description]
+                        result_sets.append(q.fetched([dict(zip(cols, row)) for row in cursor.fetchall()]))
+                    if not cursor.nextset():
+                        break
+                return result_sets
+            finally:
+                cursor.close()
+
+
+_shared_repo: SqlRepository | None = None
+_shared_lock = threading.Lock()
 
 
+def get_repository() -> SqlRepository:
+    """Process-wide repository so every agent tool shares one engine and registry."""
+    global _shared_repo
+    if _shared_repo is None:
+        with _shared_lock:
+            if _shared_repo is None:
+                _shared_repo = SqlRepository.from_env()
+    return _shared_repo
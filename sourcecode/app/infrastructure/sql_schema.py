@@ -0,0 +1,554 @@
+"""Schema introspection and per-process query registry for SqlRepository.
+
+The knowledge tables exist in a few historical shapes (v2 snake_case, v1
+camelCase, v0 legacy table names).  Instead of firing every variant until one
+succeeds, the registry probes INFORMATION_SCHEMA (the SQLAlchemy inspector on
+SQLite) once, picks the variant whose table/columns actually exist for each
+entity and pre-compiles that statement.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field, replace
+
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger("uvicorn.error")
+
+UNRESOLVED = "unresolved"
+
+
+@dataclass(frozen=True)
+class QueryVariant:
+    """One schema flavour of a repository query."""
+
+    dialect: str
+    requires: tuple[tuple[str, tuple[str, ...]], ...]
+    sql: str
+    expanding: tuple[str, ...] = ()
+
+    def matches(self, columns: dict[str, set[str]]) -> bool:
+        for table, cols in self.requires:
+            existing = columns.get(table.lower())
+            if existing is None:
+                return False
+            if any(col.lower() not in existing for col in cols):
+                return False
+        return True
+
+    def compile(self) -> TextClause:
+        stmt = text(self.sql)
+        if self.expanding:
+            stmt = stmt.bindparams(*(bindparam(name, expanding=True) for name in self.expanding))
+        return stmt
+
+
+def _variant(
+    dialect: str,
+    table: str,
+    columns: tuple[str, ...],
+    sql: str,
+    expanding: tuple[str, ...] = (),
+) -> QueryVariant:
+    return QueryVariant(dialect=dialect, requires=((table, columns),), sql=sql, expanding=expanding)
+
+
+# ─── Query variants (preference order: first match wins) ─────────────────────
+
+QUERY_VARIANTS: dict[str, tuple[QueryVariant, ...]] = {
+    "vehicle": (
+        _variant(
+            "v2", "Vehicles", ("id", "customer_id", "make", "model", "year", "vin"),
+            """
+            SELECT TOP 1
+                id AS vehicle_id,
+                customer_id,
+                make,
+                model,
+                year,
+                vin
+            FROM Vehicles
+            WHERE id = :vehicle_id
+            """,
+        ),
+        _variant(
+            "v1", "Vehicles", ("id", "customerId", "make", "model", "year", "vin"),
+            """
+            SELECT TOP 1
+                id AS vehicle_id,
+                customerId AS customer_id,
+                make,
+                model,
+                year,
+                vin
+            FROM Vehicles
+            WHERE id = :vehicle_id
+            """,
+        ),
+    ),
+    "vehicle_by_registration": (
+        _variant(
+            "v2", "Vehicles",
+            ("id", "customer_id", "make", "model", "year", "vin", "registration_number"),
+            """
+            SELECT TOP 1
+                id AS vehicle_id,
+                customer_id,
+                make,
+                model,
+                year,
+                vin
+            FROM Vehicles
+            WHERE registration_number = :registration_number
+            """,
+        ),
+        _variant(
+            "v1", "Vehicles",
+            ("id", "customerId", "make", "model", "year", "vin", "registration_number"),
+            """
+            SELECT TOP 1
+                id AS vehicle_id,
+                customerId AS customer_id,
+                make,
+                model,
+                year,
+                vin
+            FROM Vehicles
+            WHERE registration_number = :registration_number
+            """,
+        ),
+    ),
+    "customer": (
+        _variant(
+            "v2", "Customers", ("id", "name", "phone", "email", "preferredContact"),
+            """
+            SELECT TOP 1
+                id AS customer_id,
+                name,
+                phone,
+                email,
+                preferredContact AS preferred_contact
+            FROM Customers
+            WHERE id = :customer_id
+            """,
+        ),
+        _variant(
+            "v1", "Customers", ("id", "name", "phone", "email", "preferred_contact"),
+            """
+            SELECT TOP 1
+                id AS customer_id,
+                name,
+                phone,
+                email,
+                preferred_contact
+            FROM Customers
+            WHERE id = :customer_id
+            """,
+        ),
+    ),
+    "parts": (
+        _variant(
+            "v2", "Parts", ("id", "code", "description", "unitPrice", "category"),
+            """
+            SELECT
+                id AS part_id,
+                code AS part_code,
+                description,
+                unitPrice AS unit_price,
+                category
+            FROM Parts
+            WHERE code IN :part_codes OR id IN :part_codes
+            """,
+            expanding=("part_codes",),
+        ),
+        _variant(
+            "v1", "Parts", ("id", "part_code", "part_description", "unit_price", "category"),
+            """
+            SELECT
+                id AS part_id,
+                part_code,
+                part_description AS description,
+                unit_price,
+                category
+            FROM Parts
+            WHERE part_code IN :part_codes OR id IN :part_codes
+            """,
+            expanding=("part_codes",),
+        ),
+        _variant(
+            "v0", "Parts", ("id",),
+            """
+            SELECT
+                id AS part_id,
+                NULL AS part_code,
+                NULL AS description,
+                NULL AS unit_price,
+                NULL AS category
+            FROM Parts
+            WHERE id IN :part_codes
+            """,
+            expanding=("part_codes",),
+        ),
+    ),
+    "faults": (
+        _variant(
+            "v2", "Fault_Code_Mappings",
+            ("fault_code", "description", "labor_operation_id", "warranty_eligible"),
+            """
+            SELECT
+                fault_code AS fault_code,
+                description,
+                labor_operation_id AS labor_operation_id,
+                warranty_eligible AS warranty_eligible
+            FROM Fault_Code_Mappings
+            WHERE fault_code IN :fault_codes
+            """,
+            expanding=("fault_codes",),
+        ),
+        _variant(
+            "v1", "FaultCodes",
+            ("faultCode", "description", "laborOperationId", "warrantyEligible"),
+            """
+            SELECT
+                faultCode AS fault_code,
+                description,
+                laborOperationId AS labor_operation_id,
+                warrantyEligible AS warranty_eligible
+            FROM FaultCodes
+            WHERE faultCode IN :fault_codes
+            """,
+            expanding=("fault_codes",),
+        ),
+        _variant(
+            "v0", "Fault_Codes",
+            ("fault_code", "description", "laborOperationId", "warrantyEligible"),
+            """
+            SELECT
+                fault_code AS fault_code,
+                description,
+                laborOperationId AS labor_operation_id,
+                warrantyEligible AS warranty_eligible
+            FROM Fault_Codes
+            WHERE fault_code IN :fault_codes
+            """,
+            expanding=("fault_codes",),
+        ),
+    ),
+    "labor": (
+        _variant(
+            "v2", "LaborOperations", ("id", "name", "hourlyRate", "estimatedHours"),
+            """
+            SELECT
+                id AS labor_id,
+                name,
+                hourlyRate AS hourly_rate,
+                estimatedHours AS estimated_hours
+            FROM LaborOperations
+            WHERE id IN :labor_ids
+            """,
+            expanding=("labor_ids",),
+        ),
+        _variant(
+            "v1", "Labor_Operations", ("id", "name", "hourly_rate", "estimated_hours"),
+            """
+            SELECT
+                id AS labor_id,
+                name,
+                hourly_rate,
+                estimated_hours
+            FROM Labor_Operations
+            WHERE id IN :labor_ids
+            """,
+            expanding=("labor_ids",),
+        ),
+    ),
+    "job_card": (
+        _variant(
+            "v2", "Job_Cards",
+            ("id", "customer_id", "vehicle_id", "status", "created_at", "complaint",
+             "service_type", "mileage", "risk_indicators", "advisor_id", "intake_payload_json"),
+            """
+            SELECT TOP 1
+                id AS job_card_id,
+                customer_id,
+                vehicle_id,
+                status,
+                created_at,
+                complaint,
+                service_type,
+                mileage,
+                risk_indicators,
+                advisor_id,
+                intake_payload_json
+            FROM Job_Cards
+            WHERE id = :job_card_id
+            """,
+        ),
+        _variant(
+            "v1", "Job_Cards",
+            ("id", "customerId", "vehicleId", "status", "createdAt", "complaint",
+             "serviceType", "mileage", "riskIndicators", "advisorId", "intakePayloadJson"),
+            """
+            SELECT TOP 1
+                id AS job_card_id,
+                customerId AS customer_id,
+                vehicleId AS vehicle_id,
+                status,
+                createdAt AS created_at,
+                complaint,
+                serviceType AS service_type,
+                mileage,
+                riskIndicators AS risk_indicators,
+                advisorId AS advisor_id,
+                intakePayloadJson AS intake_payload_json
+            FROM Job_Cards
+            WHERE id = :job_card_id
+            """,
+        ),
+    ),
+    "update_job_card_status": (
+        _variant(
+            "v2", "Job_Cards", ("id", "status"),
+            """
+            UPDATE Job_Cards
+            SET status = :status
+            WHERE id = :job_card_id
+            """,
+        ),
+        _variant(
+            "v0", "JobCards", ("id", "status"),
+            """
+            UPDATE JobCards
+            SET status = :status
+            WHERE id = :job_card_id
+            """,
+        ),
+    ),
+    "estimate_by_job_card": (
+        _variant(
+            "v2", "Estimates",
+            ("id", "job_card_id", "created_at", "status", "parts_total", "labor_total",
+             "tax", "grand_total"),
+            """
+            SELECT TOP 1
+                id AS estimate_id,
+                job_card_id,
+                created_at,
+                status,
+                parts_total,
+                labor_total,
+                tax,
+                grand_total AS total_amount
+            FROM Estimates
+            WHERE job_card_id = :job_card_id
+            ORDER BY created_at DESC
+            """,
+        ),
+        _variant(
+            "v1", "Estimates",
+            ("id", "jobCardId", "createdAt", "status", "subtotal", "customerPayableAmount",
+             "insurancePayableAmount", "totalAmount"),
+            """
+            SELECT TOP 1
+                id AS estimate_id,
+                jobCardId AS job_card_id,
+                createdAt AS created_at,
+                status,
+                subtotal,
+                customerPayableAmount AS customer_payable_amount,
+                insurancePayableAmount AS insurance_payable_amount,
+                totalAmount AS total_amount
+            FROM Estimates
+            WHERE jobCardId = :job_card_id
+            ORDER BY createdAt DESC
+            """,
+        ),
+    ),
+    "estimate_line_items": (
+        _variant(
+            "v2", "Estimate_Line_Items",
+            ("id", "estimate_id", "type", "reference_id", "quantity", "unit_price", "total"),
+            """
+            SELECT
+                id AS line_item_id,
+                estimate_id,
+                type,
+                reference_id,
+                quantity,
+                unit_price,
+                total
+            FROM Estimate_Line_Items
+            WHERE estimate_id = :estimate_id
+            """,
+        ),
+        _variant(
+            "v1", "Estimate_Line_Items",
+            ("id", "estimateId", "description", "quantity", "unitPrice", "hours",
+             "ratePerHour", "total"),
+            """
+            SELECT
+                id AS line_item_id,
+                estimateId AS estimate_id,
+                description,
+                quantity,
+                unitPrice AS unit_price,
+                hours,
+                ratePerHour AS rate_per_hour,
+                total
+            FROM Estimate_Line_Items
+            WHERE estimateId = :estimate_id
+            """,
+        ),
+    ),
+}
+
+
+# Labor for a set of fault codes in one statement, so the labor lookup no longer
+# waits on the fault-code result.  Built from every fault/labor table pairing.
+_FAULT_LABOR_LINKS = (
+    ("v2", "Fault_Code_Mappings", "fault_code", "labor_operation_id"),
+    ("v1", "FaultCodes", "faultCode", "laborOperationId"),
+    ("v0", "Fault_Codes", "fault_code", "laborOperationId"),
+)
+_LABOR_TABLES = (
+    ("v2", "LaborOperations", ("id", "name", "hourlyRate", "estimatedHours"),
+     "id AS labor_id, name, hourlyRate AS hourly_rate, estimatedHours AS estimated_hours"),
+    ("v1", "Labor_Operations", ("id", "name", "hourly_rate", "estimated_hours"),
+     "id AS labor_id, name, hourly_rate, estimated_hours"),
+)
+
+QUERY_VARIANTS["labor_by_faults"] = tuple(
+    QueryVariant(
+        dialect=f"{fault_dialect}+{labor_dialect}",
+        requires=((fault_table, (code_col, labor_col)), (labor_table, labor_cols)),
+        sql=f"""
+            SELECT {projection}
+            FROM {labor_table}
+            WHERE id IN (
+                SELECT {labor_col} FROM {fault_table} WHERE {code_col} IN :fault_codes
+            )
+            """,
+        expanding=("fault_codes",),
+    )
+    for fault_dialect, fault_table, code_col, labor_col in _FAULT_LABOR_LINKS
+    for labor_dialect, labor_table, labor_cols, projection in _LABOR_TABLES
+)
+
+
+# Whole-table reads of the catalog entities, used to bulk-load the reference
+# cache: the lookup statement without its WHERE clause.
+for _entity in ("parts", "faults", "labor"):
+    QUERY_VARIANTS[f"{_entity}_all"] = tuple(
+        replace(variant, sql=variant.sql.rsplit("WHERE", 1)[0], expanding=())
+        for variant in QUERY_VARIANTS[_entity]
+    )
+
+
+# ─── Registry ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class QueryRegistry:
+    """Compiled statements per entity, chosen once from the live schema.
+
+    A resolved entity holds exactly one statement.  Entities that could not be
+    matched (or a registry whose probe failed) keep every variant in
+    preference order so callers degrade to the old try-each behaviour.
+    """
+
+    statements: dict[str, tuple[TextClause, ...]] = field(default_factory=dict)
+    dialects: dict[str, str] = field(default_factory=dict)
+    variants: dict[str, tuple[str, ...]] = field(default_factory=dict)  # dialect of each candidate
+
+    @property
+    def dialect(self) -> str:
+        chosen = set(self.dialects.values())
+        if not chosen:
+            return UNRESOLVED
+        if len(chosen) == 1:
+            return chosen.pop()
+        return "mixed"
+
+    def candidates(self, entity: str) -> tuple[TextClause, ...]:
+        return self.statements[entity]
+
+    def variant_names(self, entity: str) -> tuple[str, ...]:
+        return self.variants.get(entity) or tuple(UNRESOLVED for _ in self.statements[entity])
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, set[str]] | None) -> "QueryRegistry":
+        registry = cls()
+        for entity, variants in QUERY_VARIANTS.items():
+            match = None
+            if columns is not None:
+                match = next((v for v in variants if v.matches(columns)), None)
+            if match is None:
+                registry.statements[entity] = tuple(v.compile() for v in variants)
+                registry.dialects[entity] = UNRESOLVED
+                registry.variants[entity] = tuple(v.dialect for v in variants)
+            else:
+                registry.statements[entity] = (match.compile(),)
+                registry.dialects[entity] = match.dialect
+                registry.variants[entity] = (match.dialect,)
+        return registry
+
+
+def probe_columns(engine: Engine) -> dict[str, set[str]]:
+    """Return {lower(table): {lower(column), ...}} for every visible table."""
+    if engine.dialect.name == "sqlite":
+        inspector = inspect(engine)
+        return {
+            table.lower(): {col["name"].lower() for col in inspector.get_columns(table)}
+            for table in inspector.get_table_names()
+        }
+    query = text("SELECT TABLE_NAME, COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS")
+    columns: dict[str, set[str]] = {}
+    with engine.connect() as conn:
+        for table_name, column_name in conn.execute(query):
+            columns.setdefault(str(table_name).lower(), set()).add(str(column_name).lower())
+    return columns
+
+
+def build_registry(engine: Engine) -> QueryRegistry:
+    try:
+        columns: dict[str, set[str]] | None = probe_columns(engine)
+    except Exception as exc:
+        logger.warning(f"  Schema probe failed, falling back to per-call variants: {exc}")
+        columns = None
+    registry = QueryRegistry.from_columns(columns)
+    logger.info(f" SQL schema dialect: {registry.dialect} {registry.dialects}")
+    return registry
+
+
+# Per-process registry cache, keyed by engine URL so every repository pointing
+# at the same database shares one probe.
+_registries: dict[str, QueryRegistry] = {}
+_registry_lock = threading.Lock()
+
+
+def _engine_key(engine: Engine) -> str:
+    return engine.url.render_as_string(hide_password=False)
+
+
+def get_registry(engine: Engine) -> QueryRegistry:
+    key = _engine_key(engine)
+    registry = _registries.get(key)
+    if registry is not None:
+        return registry
+    with _registry_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = build_registry(engine)
+            _registries[key] = registry
+        return registry
+
+
+def refresh_registry(engine: Engine) -> QueryRegistry:
+    """Re-probe the schema (e.g. after a migration) and replace the cached registry."""
+    registry = build_registry(engine)
+    with _registry_lock:
+        _registries[_engine_key(engine)] = registry
+    return registry
+
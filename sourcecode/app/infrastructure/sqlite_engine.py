@@ -0,0 +1,716 @@
+"""Local SQLite backend (DB_BACKEND=sqlite) for load tests and benchmarks.
+
+The database is created from ``create_mvp_tables_v2.sql`` plus the ``alter_*.sql``
+scripts in docs/backend/data and seeded from ``insert_mvp_sample_data_v2.sql``
+(or the JSON fixtures), so db_service and SqlRepository run their real query
+paths without Azure SQL.  Statements are written for SQL Server; ``translate``
+rewrites the few T-SQL constructs they use (``TOP n``, ``GETDATE()``,
+``NVARCHAR(MAX)``, ``N'...'``, ``dbo.``, ``SET NOCOUNT``, ``OUTPUT INSERTED`` /
+``DELETED``).  ``UPPER(col) LIKE ?`` needs no rewrite — SQLite supports both as
+written.
+
+``connect()`` returns a pyodbc-shaped connection for the db_service pool: its
+cursors split a multi-statement batch and replay the statements one at a time
+through ``nextset()``.  ``create_engine()`` gives SqlRepository a SQLAlchemy
+engine that translates every statement before it reaches the driver.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+SCRIPTS_DIR = Path(__file__).parent.parent.parent.parent / "docs" / "backend" / "data"
+SEED_MODES = ("sql", "json", "none")
+
+# Timestamps are stored as ISO-8601 text in one shape — UTC, millisecond
+# precision, no offset — so text order is time order and a datetime bound as a
+# keyset cursor compares equal to the row it was read from.  SQLite's %f is SS.SSS.
+_NOW_SQL = "(strftime('%Y-%m-%dT%H:%M:%f', 'now'))"
+_ISO_TIMESTAMP = re.compile(r"\d{4}-\d\d-\d\d[T ]\d\d:\d\d(?::\d\d(?:\.\d+)?)?(?:Z|[+-]\d\d:?\d\d)?")
+
+
+def timestamp_text(value: datetime) -> str:
+    """``value`` in the stored timestamp shape (the same text GETDATE() writes).
+
+    Aware values are converted to UTC first; naive values are taken as UTC already.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}"
+
+
+def _bind(value: Any) -> Any:
+    """ISO timestamp strings (e.g. ``db_service._now()``) are stored in the same shape as datetimes."""
+    if isinstance(value, str) and 16 <= len(value) <= 35 and _ISO_TIMESTAMP.fullmatch(value):
+        try:
+            return timestamp_text(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            return value
+    return value
+
+
+def _bind_params(params: Any) -> Any:
+    if isinstance(params, dict):
+        return {k: _bind(v) for k, v in params.items()}
+    return tuple(_bind(v) for v in params)
+
+
+sqlite3.register_adapter(datetime, timestamp_text)
+sqlite3.register_adapter(Decimal, float)
+
+
+# ─── T-SQL → SQLite translation ───────────────────────────────────────────────
+
+_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+_TOP = re.compile(r"\bSELECT(\s+DISTINCT)?\s+TOP\s*(?:\(\s*(\d+)\s*\)|(\d+))\s+", re.I)
+_REWRITES = (
+    (re.compile(r"\bSET\s+NOCOUNT\s+(ON|OFF)\s*;?", re.I), ""),
+    (re.compile(r"\bNVARCHAR\s*\(\s*MAX\s*\)", re.I), "TEXT"),
+    (re.compile(r"\b(GETDATE|GETUTCDATE|SYSDATETIME|SYSUTCDATETIME)\s*\(\s*\)", re.I), _NOW_SQL),
+    (re.compile(r"\bdbo\.", re.I), ""),
+    (re.compile(r"\bISNULL\s*\(", re.I), "IFNULL("),
+    (re.compile(r"\bLEN\s*\(", re.I), "LENGTH("),
+    (re.compile(r"\bWITH\s*\(\s*(?:NOLOCK|HOLDLOCK|UPDLOCK|ROWLOCK|SERIALIZABLE)(?:\s*,\s*\w+)*\s*\)", re.I), ""),
+    (re.compile(r"\s+INCLUDE\s*\([^)]*\)", re.I), ""),
+)
+
+
+def _mask(sql: str) -> tuple[str, list[str]]:
+    """Replace string literals with placeholders and drop comments."""
+    out: list[str] = []
+    literals: list[str] = []
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch == "'":
+            j = i + 1
+            while j < n:
+                if sql[j] == "'":
+                    if j + 1 < n and sql[j + 1] == "'":
+                        j += 2
+                        continue
+                    break
+                j += 1
+            if out and out[-1] in "Nn" and (len(out) < 2 or not (out[-2].isalnum() or out[-2] == "_")):
+                out.pop()  # N'...' unicode literal
+            out.append(f"\x00{len(literals)}\x00")
+            literals.append(sql[i:j + 1])
+            i = j + 1
+        elif sql.startswith("--", i):
+            j = sql.find("\n", i)
+            i = n if j < 0 else j
+        elif sql.startswith("/*", i):
+            j = sql.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out), literals
+
+
+def _unmask(sql: str, literals: list[str]) -> str:
+    return _PLACEHOLDER.sub(lambda m: literals[int(m.group(1))], sql)
+
+
+def _statement_end(sql: str, start: int) -> int:
+    """Index where the (sub)query starting at ``start`` ends: its closing paren, ``;`` or EOF."""
+    depth = 0
+    for i in range(start, len(sql)):
+        ch = sql[i]
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            if depth == 0:
+                return i
+            depth -= 1
+        elif ch == ";" and depth == 0:
+            return i
+    return len(sql)
+
+
+def _top_to_limit(sql: str) -> str:
+    """``SELECT TOP n ...`` → ``SELECT ... LIMIT n``, subqueries included."""
+    while True:
+        match = _TOP.search(sql)
+        if match is None:
+            return sql
+        end = _statement_end(sql, match.end())
+        body = sql[match.end():end].rstrip()
+        limit = match.group(2) or match.group(3)
+        sql = f"{sql[:match.start()]}SELECT{match.group(1) or ''} {body} LIMIT {limit}{sql[end:]}"
+
+
+def _translate_masked(sql: str) -> tuple[str, list[str]]:
+    masked, literals = _mask(sql)
+    for pattern, replacement in _REWRITES:
+        masked = pattern.sub(replacement, masked)
+    return _top_to_limit(masked), literals
+
+
+# ─── OUTPUT INSERTED / DELETED → RETURNING ────────────────────────────────────
+
+_OUTPUT_INSERT = re.compile(
+    r"^(INSERT\s+INTO\s+\w+\s*(?:\([^)]*\))?)\s*OUTPUT\s+(.+?)\s+((?:VALUES|SELECT|DEFAULT\s+VALUES)\b.*)$",
+    re.I | re.S,
+)
+_OUTPUT_UPDATE = re.compile(r"^(UPDATE\s+(\w+)\s+SET\s+.+?)\s+OUTPUT\s+(.+?)(\s+WHERE\s+.+)?$", re.I | re.S)
+_OUTPUT_DELETE = re.compile(r"^(DELETE\s+FROM\s+\w+)\s+OUTPUT\s+(.+?)(\s+WHERE\s+.+)?$", re.I | re.S)
+_OUTPUT_ITEM = re.compile(r"^(INSERTED|DELETED)\.(\*|\w+)(?:\s+AS\s+(\w+))?$", re.I)
+
+
+class _Merge(NamedTuple):
+    update_sql: str
+    update_params: tuple[int, ...]   # indexes into the MERGE statement's parameters
+    insert_sql: str
+    insert_params: tuple[int, ...]
+
+
+class _Statement(NamedTuple):
+    sql: str
+    params: int                      # number of ``?`` the statement takes
+    pre_image: Optional[str] = None  # SELECT of the DELETED columns, run first
+    pre_params: int = 0              # trailing parameters (the WHERE clause) it takes
+    merge: Optional[_Merge] = None   # MERGE emulated as UPDATE, then INSERT if nothing matched
+
+
+def _output_items(clause: str) -> list[tuple[str, str]]:
+    """``INSERTED.a, DELETED.b AS old_b`` → [("INSERTED", "a"), ("DELETED", "b AS old_b")]."""
+    items = []
+    for part in clause.split(","):
+        match = _OUTPUT_ITEM.match(part.strip())
+        if match is None:
+            raise sqlite3.ProgrammingError(f"Unsupported OUTPUT item: {part.strip()}")
+        source, column, alias = match.groups()
+        items.append((source.upper(), f"{column} AS {alias}" if alias else column))
+    return items
+
+
+_MERGE = re.compile(
+    r"^MERGE\s+(?:INTO\s+)?(\w+)\s+(?:AS\s+)?(\w+)\s+"
+    r"USING\s*\(\s*SELECT\s+(.+?)\s*\)\s*(?:AS\s+)?(\w+)\s+"
+    r"ON\s+(.+?)\s+"
+    r"WHEN\s+MATCHED\s+THEN\s+UPDATE\s+SET\s+(.+?)\s+"
+    r"WHEN\s+NOT\s+MATCHED(?:\s+BY\s+TARGET)?\s+THEN\s+INSERT\s*\(([^)]*)\)\s*VALUES\s*\((.+?)\)"
+    r"(?:\s+OUTPUT\s+(.+?))?$",
+    re.I | re.S,
+)
+_SOURCE_ITEM = re.compile(r"^(.+?)\s+AS\s+(\w+)$", re.I | re.S)
+
+
+def _plan_merge(match: re.Match) -> _Statement:
+    """``MERGE t USING (SELECT ? AS k, ...) AS source ON ... WHEN MATCHED ... WHEN NOT MATCHED ...``.
+
+    Only the single-row upsert form is supported.  ``source.k`` references are
+    bound to the parameter of that source column, so the UPDATE and INSERT
+    halves each get their own parameter list.
+    """
+    table, target, select, source, on, sets, columns, values, output = match.groups()
+    pos = 0
+    source_exprs: dict[str, str | int] = {}
+    for item in select.split(","):
+        item_match = _SOURCE_ITEM.match(item.strip())
+        if item_match is None:
+            raise sqlite3.ProgrammingError(f"Unsupported MERGE source column: {item.strip()}")
+        expr, name = item_match.groups()
+        if expr.strip() == "?":
+            source_exprs[name.lower()] = pos
+            pos += 1
+        else:
+            source_exprs[name.lower()] = pos if "?" in expr else expr.strip()
+            pos += expr.count("?")
+    ref = re.compile(rf"\?|\b{re.escape(source)}\.(\w+)\b|\b{re.escape(target)}\.", re.I)
+
+    def bind(fragment: str) -> tuple[str, list[int]]:
+        nonlocal pos
+        bound: list[int] = []
+
+        def sub(m: re.Match) -> str:
+            nonlocal pos
+            if m.group(0) == "?":
+                bound.append(pos)
+                pos += 1
+                return "?"
+            if m.group(1) is None:
+                return ""  # target alias
+            expr = source_exprs[m.group(1).lower()]
+            if isinstance(expr, int):
+                bound.append(expr)
+                return "?"
+            return expr
+        return ref.sub(sub, fragment), bound
+
+    where, on_params = bind(on)
+    set_sql, set_params = bind(sets)
+    values_sql, insert_params = bind(values)
+    returning = ""
+    if output:
+        returning = " RETURNING " + ", ".join(col for _, col in _output_items(output))
+    return _Statement(
+        f"MERGE {table}",
+        pos,
+        merge=_Merge(
+            f"UPDATE {table} SET {set_sql} WHERE {where}{returning}",
+            tuple(set_params + on_params),
+            f"INSERT INTO {table} ({columns}) VALUES ({values_sql}){returning}",
+            tuple(insert_params),
+        ),
+    )
+
+
+def _plan(statement: str) -> _Statement:
+    """Rewrite ``OUTPUT`` as ``RETURNING``.
+
+    RETURNING only sees the new row, so ``UPDATE ... OUTPUT DELETED.x`` gets a
+    pre-image SELECT of the same rows (matched back by rowid); DELETED columns
+    come first in the combined result.
+    """
+    n = statement.count("?")
+    match = _MERGE.match(statement)
+    if match:
+        return _plan_merge(match)
+    match = _OUTPUT_INSERT.match(statement)
+    if match:
+        cols = ", ".join(col for _, col in _output_items(match.group(2)))
+        return _Statement(f"{match.group(1)} {match.group(3)} RETURNING {cols}", n)
+    match = _OUTPUT_DELETE.match(statement)
+    if match:
+        cols = ", ".join(col for _, col in _output_items(match.group(2)))
+        return _Statement(f"{match.group(1)}{match.group(3) or ''} RETURNING {cols}", n)
+    match = _OUTPUT_UPDATE.match(statement)
+    if match:
+        head, table, clause, where = match.group(1), match.group(2), match.group(3), match.group(4) or ""
+        items = _output_items(clause)
+        inserted = [col for source, col in items if source == "INSERTED"]
+        deleted = [col for source, col in items if source == "DELETED"]
+        if not deleted:
+            return _Statement(f"{head}{where} RETURNING {', '.join(inserted)}", n)
+        return _Statement(
+            f"{head}{where} RETURNING {', '.join(['rowid AS __rowid__', *inserted])}",
+            n,
+            pre_image=f"SELECT {', '.join(['rowid AS __rowid__', *deleted])} FROM {table}{where}",
+            pre_params=where.count("?"),
+        )
+    return _Statement(statement, n)
+
+
+@lru_cache(maxsize=1024)
+def _split(sql: str) -> tuple[_Statement, ...]:
+    """Translated statements of a batch, each with its parameter count."""
+    masked, literals = _translate_masked(sql)
+    statements = []
+    for part in masked.split(";"):
+        if part.strip():
+            plan = _plan(part.strip())
+            merge = plan.merge
+            if merge is not None:
+                merge = merge._replace(
+                    update_sql=_unmask(merge.update_sql, literals),
+                    insert_sql=_unmask(merge.insert_sql, literals),
+                )
+            statements.append(plan._replace(
+                sql=_unmask(plan.sql, literals),
+                pre_image=_unmask(plan.pre_image, literals) if plan.pre_image else None,
+                merge=merge,
+            ))
+    return tuple(statements)
+
+
+@lru_cache(maxsize=1024)
+def translate(sql: str) -> str:
+    """Rewrite a single SQL Server statement for SQLite."""
+    statements = _split(sql)
+    if len(statements) != 1 or statements[0].pre_image or statements[0].merge:
+        raise sqlite3.ProgrammingError("translate() takes one statement without OUTPUT DELETED or MERGE")
+    return statements[0].sql
+
+
+def split_statements(sql: str, params: Iterable[Any] = ()) -> list[tuple[_Statement, tuple]]:
+    """Split a batch into translated single statements, handing each its own parameters."""
+    params = tuple(params)
+    out, pos = [], 0
+    for statement in _split(sql):
+        out.append((statement, params[pos:pos + statement.params]))
+        pos += statement.params
+    return out
+
+
+# ─── Connections (pyodbc-shaped, for the db_service pool) ────────────────────
+
+def _description(columns: list[str]) -> tuple:
+    return tuple((name, None, None, None, None, None, None) for name in columns)
+
+
+class SqliteCursor:
+    """Cursor that translates T-SQL and serves a multi-statement batch through ``nextset()``."""
+
+    def __init__(self, raw: sqlite3.Connection) -> None:
+        self._raw = raw
+        self._cur = raw.cursor()
+        self._pending: list[tuple[_Statement, tuple]] = []
+        self._result: Optional[tuple[tuple, list]] = None  # (description, rows) of an emulated OUTPUT
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> "SqliteCursor":
+        statements = split_statements(sql, params)
+        if not statements:
+            raise sqlite3.ProgrammingError("Empty SQL statement")
+        self._pending = statements[1:]
+        self._run(*statements[0])
+        return self
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> "SqliteCursor":
+        self._pending, self._result = [], None
+        self._cur.executemany(translate(sql), (_bind_params(p) for p in seq_of_params))
+        return self
+
+    def nextset(self) -> bool:
+        if not self._pending:
+            return False
+        self._run(*self._pending.pop(0))
+        return True
+
+    def _run(self, statement: _Statement, params: tuple) -> None:
+        self._result = None
+        params = _bind_params(params)
+        if self._raw.isolation_level is not None and not self._raw.in_transaction:
+            # Like pyodbc with autocommit off, the first statement (reads too)
+            # opens the transaction, so a locked read holds until commit.
+            self._cur.execute("BEGIN IMMEDIATE")
+        if statement.pre_image is None and statement.merge is None:
+            self._cur.execute(statement.sql, params)
+            return
+        # Emulated statements run several SQLite statements; hold the write lock
+        # across them.  Under autocommit they are their own transaction.
+        own_tx = False
+        if not self._raw.in_transaction:
+            self._cur.execute("BEGIN IMMEDIATE")
+            own_tx = self._raw.isolation_level is None
+        try:
+            if statement.merge is not None:
+                cols, rows = self._merge(statement.merge, params)
+            else:
+                cols, rows = self._update_with_pre_image(statement, params)
+            if own_tx:
+                self._cur.execute("COMMIT")
+        except BaseException:
+            if own_tx and self._raw.in_transaction:
+                self._raw.execute("ROLLBACK")
+            raise
+        if cols:
+            self._result = (_description(cols), rows)
+
+    def _update_with_pre_image(self, statement: _Statement, params: tuple) -> tuple[list[str], list]:
+        self._cur.execute(statement.pre_image, params[len(params) - statement.pre_params:])
+        old_cols = [d[0] for d in self._cur.description][1:]
+        old_rows = {row[0]: row[1:] for row in self._cur.fetchall()}
+        self._cur.execute(statement.sql, params)
+        new_cols = [d[0] for d in self._cur.description][1:]
+        rows = [
+            tuple(old_rows.get(row[0], (None,) * len(old_cols))) + tuple(row[1:])
+            for row in self._cur.fetchall()
+        ]
+        return old_cols + new_cols, rows
+
+    def _merge(self, merge: _Merge, params: tuple) -> tuple[list[str], list]:
+        self._cur.execute(merge.update_sql, tuple(params[i] for i in merge.update_params))
+        rows = self._cur.fetchall()
+        if not rows and not self._cur.rowcount > 0:
+            self._cur.execute(merge.insert_sql, tuple(params[i] for i in merge.insert_params))
+            rows = self._cur.fetchall()
+        cols = [d[0] for d in self._cur.description] if self._cur.description else []
+        return cols, rows
+
+    @property
+    def description(self) -> Any:
+        return self._result[0] if self._result is not None else self._cur.description
+
+    @property
+    def rowcount(self) -> int:
+        return len(self._result[1]) if self._result is not None else self._cur.rowcount
+
+    def fetchall(self) -> list:
+        if self._result is None:
+            return self._cur.fetchall()
+        rows, self._result = self._result[1], (self._result[0], [])
+        return rows
+
+    def fetchmany(self, size: int = 1) -> list:
+        if self._result is None:
+            return self._cur.fetchmany(size)
+        rows, rest = self._result[1][:size], self._result[1][size:]
+        self._result = (self._result[0], rest)
+        return rows
+
+    def fetchone(self) -> Any:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def __getattr__(self, name: str) -> Any:
+        # close, lastrowid, arraysize, ...
+        return getattr(self._cur, name)
+
+
+class SqliteConnection:
+    """Autocommit connection with the subset of the pyodbc API db_service uses."""
+
+    def __init__(self, raw: sqlite3.Connection) -> None:
+        self.raw = raw
+
+    def cursor(self) -> SqliteCursor:
+        return SqliteCursor(self.raw)
+
+    @property
+    def autocommit(self) -> bool:
+        return self.raw.isolation_level is None
+
+    @autocommit.setter
+    def autocommit(self, value: bool) -> None:
+        """Like pyodbc: switching autocommit back on commits the open transaction."""
+        if value and self.raw.in_transaction:
+            self.raw.commit()
+        self.raw.isolation_level = None if value else "IMMEDIATE"
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> SqliteCursor:
+        cur = self.cursor()
+        try:
+            cur.execute(sql, params)
+            while cur.nextset():
+                pass
+        except BaseException:
+            cur.close()
+            raise
+        return cur
+
+    def commit(self) -> None:
+        self.raw.commit()
+
+    def rollback(self) -> None:
+        self.raw.rollback()
+
+    def close(self) -> None:
+        self.raw.close()
+
+
+def _open(path: str) -> sqlite3.Connection:
+    raw = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+    raw.execute("PRAGMA journal_mode=WAL")
+    raw.execute("PRAGMA synchronous=NORMAL")
+    return raw
+
+
+_bootstrapped: set[str] = set()
+_bootstrap_lock = threading.Lock()
+
+
+def connect(path: str, seed: str = "sql") -> SqliteConnection:
+    """Open a connection, creating and seeding the database on the first call for ``path``."""
+    ensure_database(path, seed)
+    return SqliteConnection(_open(path))
+
+
+# ─── Schema bootstrap ─────────────────────────────────────────────────────────
+
+_GO = re.compile(r"^\s*GO\s*$", re.I | re.M)
+_DROP_IF_EXISTS = re.compile(
+    r"IF\s+OBJECT_ID\(\s*'(?:dbo\.)?(\w+)'\s*,\s*'U'\s*\)\s+IS\s+NOT\s+NULL\s+DROP\s+TABLE\s+(?:dbo\.)?\w+\s*;?",
+    re.I,
+)
+_CREATE_INDEX_IF_MISSING = re.compile(
+    r"IF\s+NOT\s+EXISTS\s*\(\s*SELECT\s+1\s+FROM\s+sys\.indexes\s+WHERE\s+name\s*=\s*'\w+'\s*\)\s*"
+    r"BEGIN\s+CREATE\s+(UNIQUE\s+)?(?:NONCLUSTERED\s+)?INDEX\s+(.*?)\s*END",
+    re.I | re.S,
+)
+_ADD_COLUMN_IF_MISSING = re.compile(
+    r"IF\s+COL_LENGTH\(\s*'(?:dbo\.)?(\w+)'\s*,\s*'(\w+)'\s*\)\s+IS\s+NULL\s*BEGIN\s+(.*?)\s*END",
+    re.I | re.S,
+)
+
+
+def _columns(raw: sqlite3.Connection, table: str) -> list[str]:
+    return [row[1] for row in raw.execute(f"PRAGMA table_info({table})")]
+
+
+def run_script(raw: sqlite3.Connection, script: str) -> None:
+    """Run a T-SQL script written for Azure SQL (``GO`` batches, idempotent ``IF`` guards)."""
+    for batch in _GO.split(script):
+        batch = _DROP_IF_EXISTS.sub(r"DROP TABLE IF EXISTS \1;", batch)
+        batch = _CREATE_INDEX_IF_MISSING.sub(
+            lambda m: f"CREATE {m.group(1) or ''}INDEX IF NOT EXISTS {m.group(2)}", batch
+        )
+        batch = _ADD_COLUMN_IF_MISSING.sub(
+            lambda m: "" if m.group(2).lower() in {c.lower() for c in _columns(raw, m.group(1))} else m.group(3),
+            batch,
+        )
+        for statement, _ in split_statements(batch):
+            raw.execute(statement.sql)
+
+
+def normalise_timestamps(raw: sqlite3.Connection) -> None:
+    """Rewrite date/time column values not yet in the stored shape (seed literals, older files)."""
+    raw.create_function("ts_text", 1, _bind, deterministic=True)
+    tables = [r[0] for r in raw.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    for table in tables:
+        for _, column, decl, *_ in raw.execute(f"PRAGMA table_info({table})").fetchall():
+            if "DATE" in (decl or "").upper() or "TIME" in (decl or "").upper():
+                raw.execute(
+                    f"UPDATE {table} SET {column} = ts_text({column}) "
+                    f"WHERE typeof({column}) = 'text' AND {column} <> ts_text({column})"
+                )
+
+
+def _table_exists(raw: sqlite3.Connection, table: str) -> bool:
+    row = raw.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? COLLATE NOCASE", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def ensure_database(path: str, seed: str = "sql") -> None:
+    """Create the v2 schema (and seed it) if ``path`` has none; re-apply the alter scripts."""
+    if path in _bootstrapped:
+        return
+    with _bootstrap_lock:
+        if path in _bootstrapped:
+            return
+        if seed not in SEED_MODES:
+            raise ValueError(f"SQLITE_SEED must be one of {', '.join(SEED_MODES)}")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        raw = _open(path)
+        try:
+            # The write lock serialises bootstrap across processes (e.g. several
+            # server workers starting on a new file); DDL is transactional.
+            raw.execute("BEGIN IMMEDIATE")
+            if not _table_exists(raw, "Job_Cards"):
+                logger.info(f" Creating SQLite database at {path} (seed: {seed})")
+                run_script(raw, (SCRIPTS_DIR / "create_mvp_tables_v2.sql").read_text(encoding="utf-8"))
+                fresh = True
+            else:
+                fresh = False
+            for script in sorted(SCRIPTS_DIR.glob("alter_*.sql")):
+                run_script(raw, script.read_text(encoding="utf-8"))
+            if fresh and seed == "sql":
+                run_script(raw, (SCRIPTS_DIR / "insert_mvp_sample_data_v2.sql").read_text(encoding="utf-8"))
+            elif fresh and seed == "json":
+                seed_from_json(raw)
+            normalise_timestamps(raw)
+            raw.execute("COMMIT")
+        except BaseException:
+            if raw.in_transaction:
+                raw.execute("ROLLBACK")
+            raise
+        finally:
+            raw.close()
+        _bootstrapped.add(path)
+
+
+# ─── JSON fixture seeding ─────────────────────────────────────────────────────
+
+# table → fixture file (keys are the column names, or their camelCase spelling)
+_JSON_FIXTURES = (
+    ("Employee", "employee.json"),
+    ("Customers", "customers.json"),
+    ("Vehicles", "vehicles.json"),
+    ("Parts", "parts.json"),
+    ("Labor_Operations", "labor_operations.json"),
+    ("Fault_Code_Mappings", "fault_code_mapping.json"),
+    ("Job_Cards", "job_cards.json"),
+    ("Estimates", "estimates.json"),
+    ("Estimate_Line_Items", "estimate_line_item.json"),
+)
+
+
+def _camel(column: str) -> str:
+    head, *rest = column.split("_")
+    return head + "".join(word.title() for word in rest)
+
+
+def _column_value(column: str, value: Any) -> Any:
+    if isinstance(value, list):
+        return ("\n" if column == "tasks" else ",").join(str(v) for v in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return int(value)
+    if column == "created_at" and isinstance(value, str) and value.endswith("Z"):
+        return value[:-1] + "+00:00"
+    return value
+
+
+def _load_fixture(filename: str) -> list[dict]:
+    path = SCRIPTS_DIR / filename
+    try:
+        content = path.read_text(encoding="utf-8").strip()
+        return json.loads(content) if content else []
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning(f"  Could not load {filename}: {exc} — skipped")
+        return []
+
+
+def seed_from_json(raw: sqlite3.Connection) -> None:
+    """Seed every table from the JSON fixtures used by USE_JSON_FALLBACK."""
+    own_tx = not raw.in_transaction
+    if own_tx:
+        raw.execute("BEGIN")
+    try:
+        for table, filename in _JSON_FIXTURES:
+            columns = _columns(raw, table)
+            rows = _load_fixture(filename)
+            for row in rows:
+                present = {}
+                for column in columns:
+                    value = row.get(column, row.get(_camel(column)))
+                    if value is not None:
+                        present[column] = _column_value(column, value)
+                if not present:
+                    continue
+                raw.execute(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(present)}) "
+                    f"VALUES ({', '.join('?' * len(present))})",
+                    tuple(present.values()),
+                )
+            if table == "Fault_Code_Mappings":
+                raw.executemany(
+                    "INSERT OR IGNORE INTO FaultCode_Parts (fault_code, part_id) VALUES (?, ?)",
+                    [(row.get("faultCode"), part) for row in rows for part in row.get("partIds") or []],
+                )
+        if own_tx:
+            raw.execute("COMMIT")
+    except BaseException:
+        if own_tx:
+            raw.execute("ROLLBACK")
+        raise
+
+
+# ─── SQLAlchemy engine (SqlRepository) ────────────────────────────────────────
+
+def create_engine(path: str, seed: str = "sql"):
+    """SQLAlchemy engine on the same database file; statements are translated on the way out."""
+    from sqlalchemy import create_engine as sa_create_engine, event
+
+    ensure_database(path, seed)
+    engine = sa_create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30.0},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn, _record) -> None:
+        dbapi_conn.execute("PRAGMA journal_mode=WAL")
+        dbapi_conn.execute("PRAGMA synchronous=NORMAL")
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _translate(conn, cursor, statement, parameters, context, executemany):
+        if executemany:
+            return translate(statement), [_bind_params(p) for p in parameters]
+        return translate(statement), _bind_params(parameters)
+
+    return engine
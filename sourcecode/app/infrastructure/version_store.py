@@ -0,0 +1,108 @@
+"""Resource version stores behind the ETag cache (app/application/resource_versions.py).
+
+A store answers one question: has ``(kind, key)`` — or every resource of
+``kind`` — been written since a given version was read?  ``current()``
+returns a version pair ``(key version, kind-wide version)`` and ``bump()``
+advances one of them.
+
+``MemoryVersionStore`` is per process and is enough for a single uvicorn
+worker.  ``SqliteVersionStore`` keeps the versions in a SQLite file in WAL
+mode that every worker on the host opens, so a write served by one worker
+invalidates the ETags cached by all of them on their next request.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+ALL = "*"
+
+Version = tuple[int, int]
+
+
+class MemoryVersionStore:
+    def __init__(self, max_entries: int = 10000) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self._bumped: OrderedDict[tuple[str, str], int] = OrderedDict()  # (kind, key | "*") -> seq
+        self._floor = 0  # versions of keys trimmed from the history read as this
+
+    def bump(self, kind: str, key: str) -> None:
+        with self._lock:
+            self._bumped[(kind, key)] = next(self._seq)
+            self._bumped.move_to_end((kind, key))
+            while len(self._bumped) > self._max_entries:
+                _, evicted = self._bumped.popitem(last=False)
+                self._floor = max(self._floor, evicted)
+
+    def current(self, kind: str, key: str) -> Optional[Version]:
+        with self._lock:
+            return self._bumped.get((kind, key), self._floor), self._bumped.get((kind, ALL), self._floor)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "versions": len(self._bumped)}
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resource_versions (
+    kind    TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+
+class SqliteVersionStore:
+    """Versions shared by every worker that opens the same file.
+
+    One row per resource ever written; a failed read or write is logged and
+    treated as "changed", so the cache misses rather than serving stale ETags.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def bump(self, kind: str, key: str) -> None:
+        try:
+            self._conn().execute(
+                "INSERT INTO resource_versions (kind, key, version) VALUES (?, ?, 1) "
+                "ON CONFLICT (kind, key) DO UPDATE SET version = version + 1",
+                (kind, key),
+            )
+        except sqlite3.Error as exc:
+            logger.warning(f"  Version store bump failed for {kind}/{key}: {exc}")
+
+    def current(self, kind: str, key: str) -> Optional[Version]:
+        try:
+            rows = dict(self._conn().execute(
+                "SELECT key, version FROM resource_versions WHERE kind = ? AND key IN (?, ?)", (kind, key, ALL)
+            ).fetchall())
+        except sqlite3.Error as exc:
+            logger.warning(f"  Version store read failed for {kind}/{key}: {exc}")
+            return None
+        return rows.get(key, 0), rows.get(ALL, 0)
+
+    def stats(self) -> dict:
+        (count,) = self._conn().execute("SELECT COUNT(*) FROM resource_versions").fetchone()
+        return {"backend": "sqlite", "path": self._path, "versions": count}
@@ -1,4 +1,10 @@
 """Application entrypoint."""
+import time
+_IMPORT_STARTED = time.perf_counter()
+
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -6,6 +12,8 @@ from fastapi.responses import FileResponse, JSONResponse
 from pathlib import Path
 from dotenv import load_dotenv
 import logging
+from app.api.responses import CompressionMiddleware, FastJSONResponse
+from app.config.settings import get_response_compression_min_bytes
 
 load_dotenv()
 logger = logging.getLogger("uvicorn.error")
@@ -16,17 +24,24 @@ from app.api.job_card_routes import router as job_card_router
 from app.api.estimate_routes import router as estimate_router
 from app.api.customer_routes import router as customer_router
 from app.api.dashboard_routes import router as dashboard_router
+from app.api.health_routes    import router as health_router
+from app.api.reference_routes import router as reference_router
+from app.api.import_routes    import router as import_router
+from app.api.metrics_routes   import router as metrics_router
+from app.api.export_routes    import router as export_router
 
 # ─── Optional routers (require Azure services) ───────────────────────────────
 agent_router = None
 speech_router = None
 
-try:
+from app.agents.registry import agents_available
+if agents_available():
+    # Agents and agent_framework load on the first /api/agents request.
     from app.api.agent_routes import router as _agent_router
     agent_router = _agent_router
-    logger.info(" Agent routes loaded")
-except Exception as e:
-    logger.warning(f"  Agent routes unavailable (Azure AI not configured): {e}")
+    logger.info(" Agent routes loaded (agents are built on first use)")
+else:
+    logger.warning("  Agent routes unavailable (agent_framework not installed or Azure AI not configured)")
 
 try:
     from app.api.speech_routes import router as _speech_router
@@ -35,8 +50,66 @@ try:
 except Exception as e:
     logger.warning(f"  Speech routes unavailable (Azure Speech not configured): {e}")
 
+# ─── Startup ──────────────────────────────────────────────────────────────────
+def _warm_sql_repository() -> None:
+    """Probe the SQL schema, bulk-load the reference cache and hook repository writes into db_service."""
+    from app.config.settings import is_sql_configured
+    if not is_sql_configured():
+        return
+    try:
+        from app.application import db_service as db
+        from app.infrastructure.sql_repository import get_repository, on_write
+        on_write(db.repository_write)   # agent-tool writes invalidate the API's caches too
+        repo = get_repository()
+        logger.info(f" SQL query registry ready (dialect: {repo.queries.dialect})")
+        repo.reference_cache.reload()
+    except Exception as e:
+        logger.warning(f"  SQL schema probe skipped: {e}")
+
+
+def _warm_db_pool() -> None:
+    """Open the first pooled connection (and seed a new SQLite file) now rather than on a request."""
+    from app.application import db_service as db
+    db.warm_pool()
+
+
+def _warm_sessions() -> None:
+    from app.application import auth_service
+    auth_service.get_session_stats()
+
+
+def _warm_worker() -> None:
+    """Runs in each worker before it accepts connections; logs where startup time went."""
+    started = time.perf_counter()
+    steps = []
+    for name, warm in (("db pool", _warm_db_pool), ("sql repository", _warm_sql_repository),
+                       ("sessions", _warm_sessions)):
+        t = time.perf_counter()
+        try:
+            warm()
+        except Exception as e:
+            logger.warning(f"  Warm-up step {name} failed: {e}")
+        steps.append(f"{name} {(time.perf_counter() - t) * 1000:.0f} ms")
+    ready = time.perf_counter()
+    logger.info(
+        f" Worker {os.getpid()} ready in {(ready - _IMPORT_STARTED) * 1000:.0f} ms "
+        f"(import {(started - _IMPORT_STARTED) * 1000:.0f} ms, {', '.join(steps)})"
+    )
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    _warm_worker()
+    yield
+
+
 # ─── App ──────────────────────────────────────────────────────────────────────
-app = FastAPI(title="Service Intelligence API", version="1.0.0")
+app = FastAPI(
+    title="Service Intelligence API",
+    version="1.0.0",
+    lifespan=_lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 # ─── CORS (allow Vite dev at :5173) ──────────────────────────────────────────
 app.add_middleware(
@@ -45,8 +118,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Content-Disposition"],
 )
 
+# ─── Compression (gzip, or br when the brotli package is installed) ─────────
+app.add_middleware(CompressionMiddleware, minimum_size=get_response_compression_min_bytes())
+
 # ─── Static files ─────────────────────────────────────────────────────────────
 APP_DIR   = Path(__file__).parent
 STATIC_DIR = APP_DIR / "static"
@@ -59,6 +136,11 @@ app.include_router(job_card_router,  prefix="/api")
 app.include_router(estimate_router,  prefix="/api")
 app.include_router(customer_router,  prefix="/api")
 app.include_router(dashboard_router, prefix="/api")
+app.include_router(health_router,    prefix="/api")
+app.include_router(reference_router, prefix="/api")
+app.include_router(import_router,    prefix="/api")
+app.include_router(export_router,    prefix="/api")
+app.include_router(metrics_router)   # /metrics, where Prometheus scrapes by default
 
 # ─── Optional Routers ─────────────────────────────────────────────────────────
 if agent_router:
@@ -96,6 +178,7 @@ async def serve_spa(full_path: str):
 
 
 def main() -> None:
+    """Development server (single process, auto-reload); production: ``python -m app.server``."""
     import uvicorn
     uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=True)
 
@@ -0,0 +1,137 @@
+"""Production server — uvicorn with one worker process per core.
+
+    python -m app.server                      # WEB_CONCURRENCY workers (default: CPU count)
+    python -m app.server --workers 4 --port 8080
+
+Every option falls back to an environment variable (see .env.example).
+The parent process binds the socket and supervises the workers, restarting
+any that die; each worker runs the app's startup warm-up (SQL pool, schema
+probe, reference cache, session store) before it accepts connections and
+logs how long that took.  ``app.main.main()`` remains the single-process
+development server with auto-reload.
+
+With more than one worker, logins and ETag versions must be visible to
+every worker: SESSION_BACKEND and ETAG_VERSION_BACKEND default to sqlite
+(an explicit ``memory`` is refused), and USE_JSON_FALLBACK, whose data lives
+in the process, runs a single worker.  The worker count is exported as
+WEB_CONCURRENCY; with more than one worker the dashboard KPIs are counted
+per request (GROUP BY) instead of from per-process counters.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+
+from app.config import settings
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_loop(choice: str) -> str:
+    """``auto`` → uvloop when installed (not available on Windows), else asyncio."""
+    if choice == "auto":
+        return "uvloop" if _installed("uvloop") else "asyncio"
+    if choice == "uvloop" and not _installed("uvloop"):
+        logger.warning("  uvloop is not installed — using the asyncio event loop")
+        return "asyncio"
+    return choice
+
+
+def resolve_http(choice: str) -> str:
+    """``auto`` → httptools when installed, else h11."""
+    if choice == "auto":
+        return "httptools" if _installed("httptools") else "h11"
+    if choice == "httptools" and not _installed("httptools"):
+        logger.warning("  httptools is not installed — using the h11 HTTP parser")
+        return "h11"
+    return choice
+
+
+# Per-process state that must move to a shared store before a second worker starts.
+_SHARED_BACKENDS = (
+    ("SESSION_BACKEND", settings.get_session_backend, "logins"),
+    ("ETAG_VERSION_BACKEND", settings.get_etag_version_backend, "ETag versions"),
+)
+
+
+def prepare_workers(requested: int) -> int:
+    """Settle the worker count and the backends it needs, and export both for the workers.
+
+    The JSON fallback keeps all data in the process, so it runs one worker.
+    With more than one, unset session / ETag version backends default to
+    sqlite; an explicit ``memory`` is refused.
+    """
+    workers = max(1, requested)
+    if workers > 1 and settings.use_json_fallback():
+        logger.warning(f"  USE_JSON_FALLBACK keeps data in the process — running 1 worker instead of {workers}")
+        workers = 1
+    if workers > 1:
+        for name, backend, what in _SHARED_BACKENDS:
+            if name not in os.environ:
+                os.environ[name] = "sqlite"
+                logger.info(f" {name}=sqlite — {what} shared by {workers} workers")
+            elif backend() == "memory":
+                raise SystemExit(f"{name}=memory keeps {what} per worker — set {name}=sqlite or run --workers 1")
+    # Workers read it to count dashboard KPIs per request instead of keeping per-process counters.
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    return workers
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Service Intelligence API with multiple workers.")
+    parser.add_argument("--host", default=settings.get_server_host())
+    parser.add_argument("--port", type=int, default=settings.get_server_port())
+    parser.add_argument("--workers", type=int, default=settings.get_web_concurrency() or os.cpu_count() or 1)
+    parser.add_argument("--loop", choices=("auto", "uvloop", "asyncio"), default=settings.get_server_loop())
+    parser.add_argument("--http", choices=("auto", "httptools", "h11"), default=settings.get_server_http())
+    parser.add_argument("--keep-alive", type=int, default=settings.get_server_keepalive_seconds(),
+                        help="Seconds an idle keep-alive connection is held open")
+    parser.add_argument("--backlog", type=int, default=settings.get_server_backlog(),
+                        help="Pending connections the listening socket queues")
+    parser.add_argument("--limit-concurrency", type=int, default=settings.get_server_limit_concurrency(),
+                        help="Per-worker cap on open connections/tasks before 503s (default: no cap)")
+    parser.add_argument("--graceful-timeout", type=int, default=settings.get_server_graceful_timeout(),
+                        help="Seconds a worker waits for in-flight requests on shutdown")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false",
+                        default=settings.get_server_access_log())
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    import logging.config
+    import uvicorn
+    from uvicorn.config import LOGGING_CONFIG
+
+    logging.config.dictConfig(LOGGING_CONFIG)   # uvicorn.run applies the same config; log before it does
+    args = parse_args(argv)
+    workers = prepare_workers(args.workers)
+    loop, http = resolve_loop(args.loop), resolve_http(args.http)
+    logger.info(
+        f" Serving on {args.host}:{args.port} — {workers} worker(s), loop={loop}, http={http}, "
+        f"keep-alive={args.keep_alive}s, backlog={args.backlog}"
+    )
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=args.keep_alive,
+        backlog=args.backlog,
+        limit_concurrency=args.limit_concurrency,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=args.access_log,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Benchmark: dashboard KPIs from a full Job_Cards scan vs the SQL aggregate path.
+
+Runs against the database configured in .env (AZURE_SQL_CONNECTION_STRING, or
+DB_BACKEND=sqlite for the local SQLite engine).
+``--seed`` inserts synthetic job cards (ids prefixed ``BN``) up to ``--rows``;
+``--cleanup`` removes them afterwards.
+
+    python benchmarks/bench_dashboard.py --seed --rows 100000 --iterations 10 --cleanup
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+from app.application import db_service as db
+
+_PREFIX = "BN"
+_STATUSES = ["draft", "pending_approval", "in_progress", "completed", "closed"]
+_RISKS = ["", "medium", "high engine temperature", "high brake risk", "low,medium"]
+
+
+def legacy_advisor_dashboard(advisor_id=None) -> dict:
+    """The pre-aggregation path: map every row, count in Python."""
+    jobs = db.list_job_cards(advisor_id=advisor_id)
+    today = datetime.utcnow().date().isoformat()
+    return {
+        "open_jobs":        sum(1 for j in jobs if j.get("status") not in ("completed", "closed")),
+        "pending_approval": sum(1 for j in jobs if j.get("status") == "pending_approval"),
+        "in_progress":      sum(1 for j in jobs if j.get("status") == "in_progress"),
+        "completed_today":  sum(1 for j in jobs if j.get("status") == "completed"
+                               and j.get("createdAt", "").startswith(today)),
+        "recent_jobs": jobs[:10],
+    }
+
+
+def legacy_manager_dashboard() -> dict:
+    jobs = db.list_job_cards()
+    today = datetime.utcnow().date().isoformat()
+    jobs_with_eta = [{**j, "eta": "2026-03-01", "riskLevel": db._risk_level(j.get("riskIndicators"))} for j in jobs]
+    return {
+        "in_progress":      sum(1 for j in jobs if j.get("status") == "in_progress"),
+        "at_risk":          sum(1 for j in jobs if db._risk_level(j.get("riskIndicators")) == "high"),
+        "pending_approval": sum(1 for j in jobs if j.get("status") == "pending_approval"),
+        "completed_today":  sum(1 for j in jobs if j.get("status") == "completed"
+                               and j.get("createdAt", "").startswith(today)),
+        "jobs_with_eta": jobs_with_eta[:20],
+    }
+
+
+def seed(rows: int, batch: int = 1000) -> None:
+    existing = db._sql_rows(f"SELECT COUNT(*) AS n FROM Job_Cards WHERE id LIKE '{_PREFIX}%'")
+    start = int(existing[0]["n"]) if existing else 0
+    if start >= rows:
+        print(f"{start} synthetic job cards already present")
+        return
+    pool = db._get_pool()
+    now = datetime.utcnow()
+    payload = json.dumps({"agent": "bench", "job_card": {"tasks": ["Inspect"] * 5}})
+    print(f"Seeding {rows - start} job cards ...")
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        cur.fast_executemany = True
+        for lo in range(start, rows, batch):
+            cur.executemany(
+                """INSERT INTO Job_Cards
+                   (id, created_at, status, customer_name, vehicle_make, vehicle_model, vehicle_year,
+                    complaint, service_type, risk_indicators, tasks, intake_payload_json)
+                   VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
+                [
+                    (f"{_PREFIX}{i:08d}", now - timedelta(minutes=i), random.choice(_STATUSES),
+                     f"Customer {i % 5000}", "Make", "Model", 2015 + i % 10,
+                     "Synthetic complaint " * 5, "Maintenance", random.choice(_RISKS),
+                     "Inspect\nReplace\nTest", payload)
+                    for i in range(lo, min(rows, lo + batch))
+                ],
+            )
+        cur.close()
+
+
+def cleanup() -> None:
+    db._sql_exec(f"DELETE FROM Job_Cards WHERE id LIKE '{_PREFIX}%'")
+    print("Synthetic job cards removed")
+
+
+def run(label, fn, iterations) -> None:
+    fn()  # warm-up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{label:<18} mean {statistics.mean(timings):9.2f} ms   p50 {statistics.median(timings):9.2f} ms   "
+        f"p95 {p95:9.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--seed", action="store_true")
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    if not db.warm_pool():
+        sys.exit("SQL is not reachable — check AZURE_SQL_CONNECTION_STRING or DB_BACKEND")
+    if args.seed:
+        seed(args.rows)
+    total = db._sql_rows("SELECT COUNT(*) AS n FROM Job_Cards")
+    print(f"Job_Cards rows: {total[0]['n'] if total else '?'}\n")
+
+    for old, new in ((legacy_advisor_dashboard(), db.get_advisor_dashboard()),
+                     (legacy_manager_dashboard(), db.get_manager_dashboard())):
+        for key in old:
+            if not isinstance(old[key], list) and old[key] != new[key]:
+                print(f"WARNING: '{key}' differs: {old[key]} vs {new[key]}")
+
+    run("advisor legacy", legacy_advisor_dashboard, args.iterations)
+    run("advisor aggregate", db.get_advisor_dashboard, args.iterations)
+    run("manager legacy", legacy_manager_dashboard, args.iterations)
+    run("manager aggregate", db.get_manager_dashboard, args.iterations)
+
+    if args.cleanup:
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
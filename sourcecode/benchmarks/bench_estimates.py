@@ -0,0 +1,73 @@
+"""Benchmark: estimate listing with per-estimate line item queries (N+1) vs the batched loader.
+
+Runs against the database configured in .env (AZURE_SQL_CONNECTION_STRING, or
+DB_BACKEND=sqlite for the local SQLite engine).
+
+    python benchmarks/bench_estimates.py --iterations 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+from app.application import db_service as db
+
+
+def n_plus_one() -> list[dict]:
+    """The pre-loader path: one query for estimates, one more per estimate for its line items."""
+    ests = [db._map_est(r) for r in db._sql_rows("SELECT * FROM Estimates", ())]
+    for est in ests:
+        est["lineItems"] = db._sql_rows(
+            "SELECT * FROM Estimate_Line_Items WHERE estimate_id = ?", (est["id"],)
+        )
+    return [e for e in ests if e.get("job_card_id")]
+
+
+def batched() -> list[dict]:
+    return db.get_all_estimates_with_job(include_line_items=True)
+
+
+def run(label, fn, iterations) -> None:
+    fn()  # warm-up
+    before = db.get_pool_stats()["checkouts"]
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    checkouts = (db.get_pool_stats()["checkouts"] - before) / iterations
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{label:<12} mean {statistics.mean(timings):8.2f} ms   p50 {statistics.median(timings):8.2f} ms   "
+        f"p95 {p95:8.2f} ms   round trips/list {checkouts:6.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    if not db.warm_pool():
+        sys.exit("SQL is not reachable — check AZURE_SQL_CONNECTION_STRING or DB_BACKEND")
+
+    legacy, loaded = n_plus_one(), batched()
+    items = sum(len(e["lineItems"]) for e in loaded)
+    print(f"Estimates: {len(loaded)}   line items: {items}\n")
+    legacy_items = {e["id"]: sorted(li["id"] for li in e["lineItems"]) for e in legacy}
+    if legacy_items != {e["id"]: sorted(li["id"] for li in e["lineItems"]) for e in loaded}:
+        print("WARNING: line items differ between paths")
+
+    run("n+1", n_plus_one, args.iterations)
+    run("batched", batched, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
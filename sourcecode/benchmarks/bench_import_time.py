@@ -0,0 +1,84 @@
+"""Benchmark: cold-start import time of the API — what a CRUD-only worker pays before serving.
+
+Imports ``app.main`` in a fresh interpreter ``--iterations`` times and reports
+wall time, then one ``python -X importtime`` run broken down by the heaviest
+packages.  Agents are built on first use, so the app import must not
+load ``agent_framework``; the report says whether it did, and times importing
+the agent stack on its own (what every worker paid at startup when the agent
+modules created their clients and agents at import).
+
+    python benchmarks/bench_import_time.py --iterations 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = (
+    "import sys, time; t = time.perf_counter(); import {module}; "
+    "print((time.perf_counter() - t) * 1000, 'agent_framework' in sys.modules)"
+)
+
+
+def cold_import(module: str) -> tuple[float, bool]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(out[-2]), out[-1] == "True"
+
+
+def run(label: str, module: str, iterations: int) -> None:
+    timings, loaded = [], False
+    for _ in range(iterations):
+        ms, loaded = cold_import(module)
+        timings.append(ms)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"{label:<22} mean {statistics.mean(timings):7.1f} ms   p50 {statistics.median(timings):7.1f} ms   "
+        f"p95 {p95:7.1f} ms   agent_framework loaded: {'yes' if loaded else 'no'}"
+    )
+
+
+def breakdown(module: str, top: int) -> None:
+    """Import time per top-level package (own time of its modules) from ``-X importtime``."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    ).stderr
+    totals: dict[str, int] = defaultdict(int)
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            # Each module's own time, summed per top-level package: nothing is counted twice.
+            totals[name.strip().split(".")[0]] += int(own)
+    print(f"heaviest packages imported by {module}:")
+    for name, us in sorted(totals.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {name:<28} {us / 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    run("app.main", "app.main", args.iterations)
+    run("agent modules", "app.agents.master_agent", args.iterations)
+    try:
+        run("agent_framework.azure", "agent_framework.azure", args.iterations)
+    except subprocess.CalledProcessError:
+        print("agent_framework.azure  not installed — install requirements.txt to measure the agent stack")
+    print()
+    breakdown("app.main", args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: job card row mapping — column dict → _map_job → route _map vs JobCardRecord.to_api().
+
+Maps synthetic cursor rows (no database needed) both ways and reports time
+per row, peak memory while mapping a list of ``--rows`` job cards, and the
+part of that peak spent on intermediate copies (peak minus the response rows
+themselves), with and without the deferred column groups.
+
+    python benchmarks/bench_job_card_record.py --rows 10000 --iterations 20
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+from app.api.job_card_routes import _map
+from app.application import db_service as db
+from app.application.job_card_record import records
+
+_MAKES = [("Toyota", "Corolla"), ("Honda", "Civic"), ("Ford", "F-150"), ("Hyundai", "Creta"), ("Tata", "Nexon")]
+
+
+def cursor_rows(n: int, columns: list[str]) -> list[tuple]:
+    """Rows shaped like the driver's: one tuple per row, values in ``columns`` order."""
+    rng = random.Random(42)
+    rows = []
+    for i in range(n):
+        make, model = rng.choice(_MAKES)
+        values = {
+            "id": f"J{i:06d}", "created_at": f"2025-03-{1 + i % 28:02d}T10:{i % 60:02d}:00",
+            "status": rng.choice(["Draft", "in_progress", "completed"]), "customer_name": f"Customer {i}",
+            "customer_id": f"C{rng.randrange(2000):04d}", "vehicle_id": f"V{rng.randrange(3000):04d}",
+            "vehicle_make": make, "vehicle_model": model, "vehicle_year": rng.randrange(2012, 2025),
+            "vin": f"MA3{i:014d}", "mileage": rng.randrange(1000, 150000),
+            "complaint": "Grinding noise when braking at low speed", "service_type": "repair",
+            "risk_indicators": "brake_wear,battery", "obd_fault_codes": "P0300,P0420",
+            "obd_document_id": None, "advisor_id": "E002",
+            "obd_report_text": "Misfire detected on cylinder 3. " * 4, "obd_report_summary": "Cylinder 3 misfire",
+            "tasks": "Inspect brake pads\nReplace rotors\nRoad test",
+            "intake_payload_json": json.dumps({"source": "chat", "odometer": 42000}),
+        }
+        rows.append(tuple(values[c] for c in columns))
+    return rows
+
+
+def legacy(columns: list[str], rows: list[tuple]) -> list[dict]:
+    """The previous path: _sql_rows' column dict, then _map_job, then the route's _map."""
+    mapped = [db._map_job(dict(zip(columns, row))) for row in rows]
+    return [_map(j) for j in mapped]
+
+
+def compact(columns: list[str], rows: list[tuple]) -> list[dict]:
+    return [r.to_api() for r in records(columns, rows)]
+
+
+def run(label, fn, columns, rows, iterations) -> None:
+    fn(columns, rows)  # warm-up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(columns, rows)
+        timings.append((time.perf_counter() - start) * 1e6 / len(rows))
+    gc.collect()
+    tracemalloc.start()
+    out = fn(columns, rows)
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del out
+    print(
+        f"{label:<8} mean {statistics.mean(timings):6.2f} µs/row   p50 {statistics.median(timings):6.2f} µs/row   "
+        f"peak {peak / 1e6:6.1f} MB   intermediates {(peak - kept) / len(rows):6.0f} B/row"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    for label, groups in (("summary", ()), ("deferred", db.JC_DEFERRED_GROUPS)):
+        columns = [c.strip() for c in db._jc_columns(groups).split(",")]
+        rows = cursor_rows(args.rows, columns)
+        if legacy(columns, rows) != compact(columns, rows):
+            print("WARNING: outputs differ between paths")
+        print(f"{label} columns ({len(columns)}), {args.rows} rows")
+        run("legacy", legacy, columns, rows, args.iterations)
+        run("record", compact, columns, rows, args.iterations)
+        print()
+
+
+if __name__ == "__main__":
+    main()
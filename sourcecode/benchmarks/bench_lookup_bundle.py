@@ -0,0 +1,85 @@
+"""Benchmark: sequential sql_lookup_tool lookups vs SqlRepository.get_lookup_bundle.
+
+Runs against the database configured in .env (AZURE_SQL_CONNECTION_STRING, or
+DB_BACKEND=sqlite for the local SQLite engine).
+
+    python benchmarks/bench_lookup_bundle.py --vehicle V001 --customer C001 \
+        --faults P0301 P0128 --parts P001 --iterations 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+from sqlalchemy import event
+
+from app.infrastructure.sql_repository import get_repository
+
+
+def sequential_lookup(repo, vehicle_id, customer_id, part_codes, fault_codes) -> dict:
+    """The pre-bundle path: five dependent round trips."""
+    vehicle = repo.get_vehicle_details(vehicle_id) if vehicle_id else None
+    customer = repo.get_customer_details(customer_id) if customer_id else None
+    parts = repo.get_parts_details(part_codes)
+    faults = repo.get_fault_code_details(fault_codes)
+    labor_ids = [f["labor_operation_id"] for f in faults if f.get("labor_operation_id")]
+    labor = repo.get_labor_operations(labor_ids)
+    return {"vehicle": vehicle, "customer": customer, "parts": parts, "faults": faults, "labor": labor}
+
+
+def bundle_lookup(repo, vehicle_id, customer_id, part_codes, fault_codes) -> dict:
+    return repo.get_lookup_bundle(vehicle_id, customer_id, part_codes, fault_codes)
+
+
+def run(label, fn, repo, args, counter) -> None:
+    fn(repo, args.vehicle, args.customer, args.parts, args.faults)  # warm-up
+    timings = []
+    counter["checkouts"] = 0
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        fn(repo, args.vehicle, args.customer, args.parts, args.faults)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{label:<12} mean {statistics.mean(timings):8.2f} ms   p50 {statistics.median(timings):8.2f} ms   "
+        f"p95 {p95:8.2f} ms   connections/lookup {counter['checkouts'] / args.iterations:4.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicle", default="V001")
+    parser.add_argument("--customer", default="C001")
+    parser.add_argument("--parts", nargs="*", default=["P001", "P002"])
+    parser.add_argument("--faults", nargs="*", default=["P0301", "P0128"])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    repo = get_repository()
+    print(f"Schema dialect: {repo.queries.dialect}  ({repo.engine.dialect.name})\n")
+
+    counter = {"checkouts": 0}
+
+    @event.listens_for(repo.engine, "checkout")
+    def _count_checkout(*_):
+        counter["checkouts"] += 1
+
+    seq = sequential_lookup(repo, args.vehicle, args.customer, args.parts, args.faults)
+    bun = bundle_lookup(repo, args.vehicle, args.customer, args.parts, args.faults)
+    for key in seq:
+        if seq[key] != bun[key] and not (isinstance(seq[key], list) and sorted(map(repr, seq[key])) == sorted(map(repr, bun[key]))):
+            print(f"WARNING: '{key}' differs between paths")
+
+    run("sequential", sequential_lookup, repo, args, counter)
+    run("bundle", bundle_lookup, repo, args, counter)
+
+
+if __name__ == "__main__":
+    main()
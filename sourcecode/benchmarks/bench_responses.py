@@ -0,0 +1,114 @@
+"""Benchmark: large job card listing — response_model + JSONResponse vs FastJSONResponse, with gzip/br.
+
+Serves the same synthetic job card rows (no database needed) through two
+routes: the previous list endpoint shape (``response_model=list[dict]``,
+default JSONResponse) and the current one (``json_rows`` → FastJSONResponse),
+then fetches each with every Accept-Encoding the CompressionMiddleware
+negotiates and reports latency and bytes on the wire.
+
+    python benchmarks/bench_responses.py --rows 10000 --iterations 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import responses
+from app.api.job_card_routes import _map
+from app.config.settings import get_response_compression_min_bytes
+
+_MAKES = [("Toyota", "Corolla"), ("Honda", "Civic"), ("Ford", "F-150"), ("Hyundai", "Creta"), ("Tata", "Nexon")]
+_STATUSES = ["draft", "in_progress", "awaiting_approval", "completed", "closed"]
+
+
+def synthetic_job_cards(n: int) -> list[dict]:
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    rows = []
+    for i in range(n):
+        make, model = rng.choice(_MAKES)
+        rows.append({
+            "id": f"J{i:06d}",
+            "createdAt": (start + timedelta(minutes=17 * i)).isoformat(),
+            "status": rng.choice(_STATUSES),
+            "customerId": f"C{rng.randrange(2000):04d}",
+            "customerName": f"Customer {rng.randrange(2000)}",
+            "vehicleId": f"V{rng.randrange(3000):04d}",
+            "vehicleMake": make,
+            "vehicleModel": model,
+            "vehicleYear": rng.randrange(2012, 2025),
+            "vin": f"MA3{rng.randrange(10**13):014d}",
+            "mileage": rng.randrange(1000, 150000),
+            "complaint": "Grinding noise when braking at low speed; check pads and rotors.",
+            "serviceType": rng.choice(["repair", "maintenance", "inspection"]),
+            "riskIndicators": rng.sample(["brake_wear", "overheating", "battery", "oil_leak"], 2),
+            "obdFaultCodes": rng.sample(["P0300", "P0420", "P0171", "C1201"], 1),
+        })
+    return rows
+
+
+def build_app(rows: list[dict]) -> FastAPI:
+    app = FastAPI(default_response_class=responses.FastJSONResponse)
+
+    @app.get("/legacy", response_model=list[dict], response_class=responses.JSONResponse)
+    def legacy():
+        return [_map(j) for j in rows]
+
+    @app.get("/fast", response_model=list[dict], response_class=responses.FastJSONResponse)
+    def fast():
+        return responses.json_rows([_map(j) for j in rows])
+
+    app.add_middleware(responses.CompressionMiddleware, minimum_size=get_response_compression_min_bytes())
+    return app
+
+
+def run(client, label, path, encoding, iterations) -> None:
+    headers = {"Accept-Encoding": encoding}
+    client.get(path, headers=headers)  # warm-up
+    timings, wire = [], 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        resp = client.get(path, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        wire = resp.num_bytes_downloaded
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{label:<8} {encoding:<9} mean {statistics.mean(timings):8.2f} ms   p50 {statistics.median(timings):8.2f} ms   "
+        f"p95 {p95:8.2f} ms   wire {wire / 1024:9.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    client = TestClient(build_app(synthetic_job_cards(args.rows)))
+    encodings = ["identity", "gzip"] + (["br"] if responses.brotli is not None else [])
+    print(
+        f"Rows: {args.rows}   encoder: {'orjson' if responses.orjson is not None else 'json'}   "
+        f"brotli: {'yes' if responses.brotli is not None else 'not installed'}\n"
+    )
+    if client.get("/legacy").json() != client.get("/fast").json():
+        print("WARNING: bodies differ between routes")
+
+    for encoding in encodings:
+        run(client, "legacy", "/legacy", encoding, args.iterations)
+        run(client, "fast", "/fast", encoding, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
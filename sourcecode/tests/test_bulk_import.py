@@ -0,0 +1,128 @@
+"""Bulk import: row-by-row retry of a failed batch, whole-batch rejects, partial reports on abort.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application import db_service as db
+from app.infrastructure import sqlite_engine
+from app.infrastructure.connection_pool import ConnectionPool
+
+COLUMNS = ("id", "name", "phone", "email", "city", "state", "preferred_contact")
+
+
+def customer(id: str) -> tuple:
+    return (id, f"Customer {id}", None, None, None, None, "chatbot")
+
+
+@pytest.fixture
+def sqlite_pool(tmp_path, monkeypatch):
+    path = str(tmp_path / "import.sqlite3")
+    pool = ConnectionPool(lambda: sqlite_engine.connect(path, seed="none"), size=1)
+    monkeypatch.setattr(db, "_db_available", lambda: True)
+    monkeypatch.setattr(db, "_get_pool", lambda: pool)
+    return pool
+
+
+def customer_ids(pool: ConnectionPool) -> list[str]:
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT id FROM Customers WHERE id LIKE 'T%' ORDER BY id")
+        return [row[0] for row in cur.fetchall()]
+
+
+def test_clean_batch_is_one_insert(sqlite_pool):
+    assert db.bulk_insert("Customers", COLUMNS, [customer("T1"), customer("T2")]) == (2, [])
+    assert customer_ids(sqlite_pool) == ["T1", "T2"]
+
+
+def test_bad_row_rejects_only_itself(sqlite_pool):
+    inserted, rejects = db.bulk_insert("Customers", COLUMNS, [customer("T1"), customer("T1"), customer("T2")])
+    assert inserted == 2
+    assert [index for index, _ in rejects] == [1]
+    assert customer_ids(sqlite_pool) == ["T1", "T2"]
+
+
+def test_lost_connection_rejects_the_whole_batch(sqlite_pool, monkeypatch):
+    def lost():
+        raise ConnectionError("Azure SQL is not reachable")
+
+    monkeypatch.setattr(db, "_get_pool", lambda: ConnectionPool(lost, size=1, timeout=0.05))
+    inserted, rejects = db.bulk_insert("Customers", COLUMNS, [customer("T1"), customer("T2")])
+    assert inserted == 0 and [index for index, _ in rejects] == [0, 1]
+    assert "not reachable" in rejects[0][1]
+    assert customer_ids(sqlite_pool) == []
+
+
+# ── route ──
+
+@pytest.fixture
+def client(monkeypatch):
+    from app.api.import_routes import router
+
+    written = []
+
+    def bulk_insert(table, columns, rows):
+        if len(written) == 2:
+            raise RuntimeError("Azure SQL is not reachable")
+        written.append(rows)
+        return len(rows), []
+
+    monkeypatch.setattr(db, "bulk_insert", bulk_insert)
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as c:
+        c.written = written
+        yield c
+
+
+def ndjson(*names: str) -> bytes:
+    return b"".join(b'{"name": "%s"}\n' % n.encode() for n in names)
+
+
+def test_import_reports_every_batch(client):
+    response = client.post("/import/customers?batch_size=1", content=ndjson("a", "b"),
+                           headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 2 and "aborted" not in report
+    assert [b["status"] for b in report["batches"]] == ["committed", "committed"]
+
+
+def test_failure_after_committed_batches_returns_the_partial_report(client):
+    response = client.post("/import/customers?batch_size=1", content=ndjson("a", "b", "c", "d"),
+                           headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 207
+    report = response.json()
+    assert report["inserted"] == 2 and len(report["batches"]) == 2
+    assert report["aborted"] == {"status": 503, "error": "Azure SQL is not reachable", "after_batch": 2}
+
+
+def test_bad_encoding_after_committed_batches_returns_the_partial_report(client):
+    import asyncio
+    import httpx
+
+    async def body():
+        yield ndjson("a")
+        yield b'{"name": "\xff"}\n'
+
+    async def post():
+        # ASGITransport hands the body over chunk by chunk, like a real upload.
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await http.post("/import/customers?batch_size=1", content=body(),
+                                   headers={"content-type": "application/x-ndjson"})
+
+    response = asyncio.run(post())
+    assert response.status_code == 207
+    assert response.json()["aborted"]["status"] == 400
+    assert len(client.written) == 1
+
+
+def test_failure_before_any_batch_is_an_error(client):
+    response = client.post("/import/customers", content=b"\xff\xfe\n",
+                           headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 400
+    assert client.written == []
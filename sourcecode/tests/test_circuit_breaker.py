@@ -0,0 +1,93 @@
+"""CircuitBreaker: trips after consecutive failures, backs off exponentially, probes once half-open.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+
+from app.infrastructure.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def tripped(clock: Clock, **kwargs) -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=2, base_backoff=1.0, max_backoff=4.0, clock=clock, **kwargs)
+    breaker.record_failure("first")
+    breaker.record_failure("second")
+    return breaker
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, clock=clock)
+    breaker.record_failure("one")
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure("two")
+    assert breaker.state == OPEN and not breaker.allow()
+    assert breaker.snapshot()["last_error"] == "two"
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, clock=clock)
+    breaker.record_failure("one")
+    breaker.record_success()
+    breaker.record_failure("two")
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_exactly_one_probe_through(clock):
+    breaker = tripped(clock)
+    clock.now = 1.0
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow()
+
+
+def test_failed_probe_doubles_the_backoff_up_to_the_cap(clock):
+    breaker = tripped(clock)
+    waits = [breaker.snapshot()["retry_in_seconds"]]
+    for _ in range(3):
+        clock.now += waits[-1]
+        assert breaker.allow()
+        breaker.record_failure("still down")
+        waits.append(breaker.snapshot()["retry_in_seconds"])
+    assert waits == [1.0, 2.0, 4.0, 4.0]
+
+
+def test_call_fails_fast_while_open(clock):
+    breaker = tripped(clock)
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: calls.append(1))
+    assert not calls and breaker.snapshot()["rejected_calls"] == 1
+
+
+def test_call_records_the_outcome(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, clock=clock)
+    with pytest.raises(ValueError):
+        breaker.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert breaker.state == OPEN
+    clock.now = 1.0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+
+
+def test_would_allow_does_not_claim_the_probe(clock):
+    breaker = tripped(clock)
+    assert not breaker.would_allow()
+    clock.now = 1.0
+    assert breaker.would_allow() and breaker.would_allow()
+    assert breaker.state == OPEN and breaker.snapshot()["rejected_calls"] == 0
+    assert breaker.allow()
+    assert not breaker.would_allow()
@@ -0,0 +1,68 @@
+"""CompressionMiddleware and conditional GETs: encoded 200s carry weak ETags, identity 200s strong ones,
+and a 304 repeats whichever the client holds.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.api.conditional import conditional_json
+from app.api.responses import CompressionMiddleware, choose_encoding
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/small")
+    def small(request: Request):
+        return conditional_json(request, "test", "small", lambda: {"id": "small"})
+
+    @app.get("/large")
+    def large(request: Request):
+        return conditional_json(request, "test", "large", lambda: {"rows": ["x" * 40] * 100})
+
+    with TestClient(app) as c:
+        yield c
+
+
+GZIP = {"accept-encoding": "gzip"}
+
+
+def test_small_body_goes_out_as_identity_with_a_strong_etag(client):
+    response = client.get("/small", headers=GZIP)
+    assert "content-encoding" not in response.headers
+    assert not response.headers["etag"].startswith("W/")
+
+
+def test_large_body_is_encoded_with_a_weak_etag(client):
+    response = client.get("/large", headers=GZIP)
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].startswith("W/")
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == {"rows": ["x" * 40] * 100}
+
+
+@pytest.mark.parametrize("path", ["/small", "/large"])
+def test_304_repeats_the_validator_the_client_holds(client, path):
+    etag = client.get(path, headers=GZIP).headers["etag"]
+    response = client.get(path, headers={**GZIP, "if-none-match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("*", "br"),
+    ("deflate, gzip;q=0.5", "gzip"),
+])
+def test_choose_encoding(header, expected):
+    from app.api import responses
+
+    if expected == "br" and responses.brotli is None:
+        expected = "gzip"
+    assert choose_encoding(header) == expected
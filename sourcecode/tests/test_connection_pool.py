@@ -0,0 +1,109 @@
+"""ConnectionPool checkout/checkin, overflow, timeout and pre-ping; _db_available never checks out.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+
+from app.infrastructure.circuit_breaker import CircuitBreaker
+from app.infrastructure.connection_pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.closed = False
+        self.alive = True
+
+    def execute(self, sql: str) -> None:
+        if not self.alive:
+            raise ConnectionError("server closed the connection")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_pool(**kwargs) -> tuple[ConnectionPool, list[FakeConnection]]:
+    made: list[FakeConnection] = []
+
+    def creator() -> FakeConnection:
+        made.append(FakeConnection(len(made)))
+        return made[-1]
+
+    return ConnectionPool(creator, **kwargs), made
+
+
+def test_reuses_the_most_recent_connection():
+    pool, made = make_pool(size=2)
+    with pool.connection() as a:
+        pass
+    with pool.connection() as b:
+        pass
+    assert a is b and len(made) == 1
+    assert pool.stats()["checkouts"] == 2 and pool.stats()["connects"] == 1
+
+
+def test_overflow_connections_close_on_checkin():
+    pool, made = make_pool(size=1, max_overflow=1)
+    first, second = pool.checkout(), pool.checkout()
+    assert pool.stats()["overflow"] == 1
+    pool.checkin(first)
+    pool.checkin(second)
+    assert second.closed and not first.closed
+    assert pool.stats()["open"] == 1 and pool.stats()["idle"] == 1
+
+
+def test_checkout_times_out_when_exhausted():
+    pool, _ = make_pool(size=1, max_overflow=0, timeout=0.05)
+    held = pool.checkout()
+    with pytest.raises(PoolTimeout):
+        pool.checkout()
+    assert pool.stats()["timeouts"] == 1
+    pool.checkin(held)
+    pool.checkin(pool.checkout())
+
+
+def test_idle_connection_is_pinged_and_replaced_when_dead():
+    pool, made = make_pool(size=1, pre_ping_idle=0.0)
+    with pool.connection() as conn:
+        pass
+    conn.alive = False
+    with pool.connection() as replacement:
+        pass
+    assert replacement is not conn and conn.closed
+    assert pool.stats()["pings"] == 1 and pool.stats()["invalidated"] == 1
+
+
+def test_disconnect_invalidates_instead_of_returning_to_idle():
+    pool, _ = make_pool(size=2, is_disconnect=lambda exc: isinstance(exc, ConnectionError))
+    with pytest.raises(ConnectionError):
+        with pool.connection() as conn:
+            raise ConnectionError("link dropped")
+    assert conn.closed
+    assert pool.stats()["idle"] == 0 and pool.stats()["open"] == 0
+
+
+def test_failed_connect_releases_the_slot():
+    def creator():
+        raise ConnectionError("unreachable")
+
+    pool = ConnectionPool(creator, size=1, max_overflow=0, timeout=0.05)
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            pool.checkout()
+    assert pool.stats()["open"] == 0 and pool.stats()["checked_out"] == 0
+
+
+def test_db_available_does_not_check_out(monkeypatch):
+    from app.application import db_service as db
+
+    pool, made = make_pool(size=1)
+    breaker = CircuitBreaker("test", failure_threshold=1, base_backoff=60.0)
+    monkeypatch.setattr(db, "_get_pool", lambda: pool)
+    monkeypatch.setattr(db, "_breaker", breaker)
+
+    assert db._db_available()
+    assert pool.stats()["checkouts"] == 0 and not made
+
+    breaker.record_failure("connect failed")
+    assert not db._db_available()
+    assert breaker.snapshot()["rejected_calls"] == 0
@@ -0,0 +1,105 @@
+"""Dashboard KPI counters: deltas, invalidation, reconcile drift and the multi-worker fallback.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+
+from app.application.dashboard_counters import DashboardCounters, JobSummary, tally
+
+
+def job(status: str, advisor: str = "A1", risk: str = "low", today: bool = False) -> JobSummary:
+    return JobSummary(advisor, status, risk, today)
+
+
+class Table:
+    """Stands in for Job_Cards: the GROUP BY the counters reconcile against."""
+
+    def __init__(self, *jobs: JobSummary) -> None:
+        self.jobs = list(jobs)
+        self.recounts = 0
+
+    def groups(self):
+        self.recounts += 1
+        counts: dict[JobSummary, int] = {}
+        for j in self.jobs:
+            counts[j] = counts.get(j, 0) + 1
+        return list(counts.items())
+
+
+@pytest.fixture
+def table():
+    return Table(job("pending_approval"), job("in_progress", risk="high"), job("completed", "A2", today=True))
+
+
+def test_kpis_match_the_aggregate(table):
+    counters = DashboardCounters(table.groups)
+    assert counters.kpis() == tally(table.groups())
+    assert counters.kpis("A2") == {"open_jobs": 0, "pending_approval": 0, "in_progress": 0,
+                                   "completed_today": 1, "at_risk": 0}
+
+
+def test_apply_moves_one_job_between_buckets(table):
+    counters = DashboardCounters(table.groups)
+    counters.kpis()
+    old, new = table.jobs[0], job("approved")
+    table.jobs[0] = new
+    counters.apply(old, new)
+    kpis = counters.kpis()
+    assert kpis["pending_approval"] == 0 and kpis["open_jobs"] == 2
+    assert table.recounts == 1
+    assert counters.drift()["in_sync"]
+
+
+def test_apply_before_the_first_count_is_ignored(table):
+    counters = DashboardCounters(table.groups)
+    counters.apply(None, job("in_progress"))
+    assert counters.kpis() == tally(table.groups())
+
+
+def test_invalidate_recounts_on_the_next_read(table):
+    counters = DashboardCounters(table.groups)
+    counters.kpis()
+    table.jobs.append(job("pending_approval"))   # a write that bypassed apply()
+    assert counters.kpis()["pending_approval"] == 1
+    counters.invalidate()
+    assert counters.kpis()["pending_approval"] == 2
+
+
+def test_reconcile_reports_and_fixes_drift(table):
+    now = [0.0]
+    counters = DashboardCounters(table.groups, interval=300.0, clock=lambda: now[0])
+    counters.kpis()
+    table.jobs.pop(0)
+    assert not counters.drift()["in_sync"]
+    now[0] = 300.0
+    assert counters.kpis()["pending_approval"] == 0
+    assert counters.stats()["last_drifted_cells"] == 2
+
+
+def test_midnight_rolls_completed_today(table):
+    day = ["2026-01-01"]
+    counters = DashboardCounters(table.groups, day=lambda: day[0])
+    assert counters.kpis()["completed_today"] == 1
+    day[0] = "2026-01-02"
+    assert counters.kpis()["completed_today"] == 0
+
+
+def test_counters_are_off_with_several_workers(monkeypatch):
+    from app.application import db_service as db
+
+    monkeypatch.setenv("DASHBOARD_RECONCILE_SECONDS", "300")
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    assert db._counter_interval() == 0.0
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    assert db._counter_interval() == 300.0
+
+
+def test_repository_status_write_forces_a_recount(monkeypatch, table):
+    from app.application import db_service as db
+
+    counters = DashboardCounters(table.groups)
+    monkeypatch.setattr(db, "_counters", counters)
+    counters.kpis()
+    table.jobs[0] = job("approved")
+    db.repository_write("update_job_card_status", {"job_card_id": "J001", "status": "approved"})
+    assert counters.kpis()["pending_approval"] == 0
@@ -0,0 +1,75 @@
+"""Estimate upsert: MERGE on the job's latest estimate, line items replaced, all or nothing.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+
+from app.application import db_service as db
+from app.infrastructure import sqlite_engine
+from app.infrastructure.connection_pool import ConnectionPool
+
+JOB = "JTEST1"
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    path = str(tmp_path / "estimates.sqlite3")
+    pool = ConnectionPool(lambda: sqlite_engine.connect(path, seed="none"), size=1)
+    monkeypatch.setattr(db, "_get_pool", lambda: pool)
+    return pool
+
+
+def query(pool: ConnectionPool, sql: str, params: tuple = ()) -> list[tuple]:
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        return cur.fetchall()
+
+
+def estimate(id: str, grand_total: float, *items: float) -> dict:
+    return {
+        "id": id, "parts_total": grand_total, "labor_total": 0, "tax": 0, "grand_total": grand_total,
+        "lineItems": [{"type": "part", "reference_id": f"P{n}", "quantity": 1, "unit_price": price}
+                      for n, price in enumerate(items, 1)],
+    }
+
+
+def upsert(est: dict):
+    return db._sql_upsert_estimate(JOB, est, None)
+
+
+def test_first_estimate_is_inserted(pool):
+    written = upsert(estimate("E1", 30, 10, 20))
+    assert written["id"] == "E1" and written["grand_total"] == 30
+    assert [li["id"] for li in written["lineItems"]] == ["E1-L01", "E1-L02"]
+    assert query(pool, "SELECT id, status FROM Estimates WHERE job_card_id = ?", (JOB,)) == [("E1", "pending")]
+
+
+def test_next_estimate_updates_it_and_replaces_line_items(pool):
+    upsert(estimate("E1", 30, 10, 20))
+    written = upsert(estimate("E2", 5, 5))
+    assert written["id"] == "E1" and written["grand_total"] == 5
+    assert query(pool, "SELECT id, grand_total FROM Estimates WHERE job_card_id = ?", (JOB,)) == [("E1", 5)]
+    assert query(pool, "SELECT id FROM Estimate_Line_Items WHERE estimate_id = 'E1'") == [("E1-L01",)]
+
+
+def test_only_the_latest_estimate_is_updated(pool):
+    with pool.connection() as conn:
+        for est_id, created_at in (("OLD", "2026-01-01T09:00:00.000"), ("NEW", "2026-01-02T09:00:00.000")):
+            conn.cursor().execute(
+                "INSERT INTO Estimates (id, job_card_id, status, grand_total, created_at) VALUES (?, ?, 'pending', 1, ?)",
+                (est_id, JOB, created_at),
+            )
+    assert upsert(estimate("E3", 99))["id"] == "NEW"
+    assert dict(query(pool, "SELECT id, grand_total FROM Estimates WHERE job_card_id = ?", (JOB,))) == {
+        "OLD": 1, "NEW": 99,
+    }
+
+
+def test_failed_line_items_roll_back_the_header(pool, monkeypatch):
+    upsert(estimate("E1", 30, 10, 20))
+    duplicate = db._line_item_rows("E1", [{"unit_price": 1}])
+    monkeypatch.setattr(db, "_line_item_rows", lambda est_id, items: duplicate * 2)
+    assert upsert(estimate("E2", 7, 7)) is None
+    assert query(pool, "SELECT grand_total FROM Estimates WHERE id = 'E1'") == [(30,)]
+    assert len(query(pool, "SELECT id FROM Estimate_Line_Items WHERE estimate_id = 'E1'")) == 2
@@ -0,0 +1,53 @@
+"""Keyset pagination over the SQLite backend: walking every page returns each row once.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    os.environ["DB_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = str(tmp_path_factory.mktemp("db") / "pagination.sqlite3")
+    os.environ["SQLITE_SEED"] = "sql"
+    os.environ["USE_JSON_FALLBACK"] = "false"
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def walk(client, path: str, limit: int) -> list[str]:
+    ids, cursor = [], None
+    for _ in range(1000):
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(path, params=params)
+        assert response.status_code == 200, response.text
+        ids += [row["id"] for row in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids
+    pytest.fail(f"{path} never ran out of pages")
+
+
+@pytest.mark.parametrize("path", ["/api/job-cards", "/api/estimates", "/api/customers"])
+@pytest.mark.parametrize("limit", [1, 3, 7])
+def test_every_page_once(client, path, limit):
+    ids = walk(client, path, limit)
+    assert ids, f"{path} returned no rows"
+    assert len(ids) == len(set(ids))
+    assert set(ids) == set(walk(client, path, 500))
+
+
+def test_timestamp_shapes_agree():
+    from app.infrastructure.sqlite_engine import _bind, timestamp_text
+
+    stored = "2026-02-12T12:15:00.120"
+    assert timestamp_text(datetime.fromisoformat(stored)) == stored
+    assert _bind("2026-02-12T12:15:00") == "2026-02-12T12:15:00.000"
+    assert _bind(datetime(2026, 2, 12, 12, 15, 0, 120456, tzinfo=timezone.utc).isoformat()) == stored
+    assert _bind("not a timestamp") == "not a timestamp"
@@ -0,0 +1,100 @@
+"""ETag cache invalidation: local bumps, racing reads, versions shared across workers, repository writes.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+from app.application.resource_versions import ResourceVersions
+from app.infrastructure.version_store import SqliteVersionStore
+
+ETAG = '"abc"'
+
+
+def cache(versions: ResourceVersions, kind: str = "job_card", key: str = "J001") -> None:
+    versions.remember(kind, key, ETAG, versions.token(kind, key))
+
+
+def test_bump_drops_the_cached_etag():
+    versions = ResourceVersions()
+    cache(versions)
+    assert versions.get("job_card", "j001") == ETAG
+    versions.bump("job_card", "J001")
+    assert versions.get("job_card", "J001") is None
+
+
+def test_kind_wide_bump_drops_every_key():
+    versions = ResourceVersions()
+    cache(versions, key="J001")
+    cache(versions, key="J002")
+    cache(versions, kind="customer_jobs", key="C001")
+    versions.bump("job_card")
+    assert versions.get("job_card", "J001") is None and versions.get("job_card", "J002") is None
+    assert versions.get("customer_jobs", "C001") == ETAG
+
+
+def test_read_racing_a_write_is_not_cached():
+    versions = ResourceVersions()
+    token = versions.token("job_card", "J001")
+    versions.bump("job_card", "J001")
+    versions.remember("job_card", "J001", ETAG, token)
+    assert versions.get("job_card", "J001") is None
+
+
+def test_entries_expire_after_ttl():
+    now = [0.0]
+    versions = ResourceVersions(ttl=30.0, clock=lambda: now[0])
+    cache(versions)
+    now[0] = 29.0
+    assert versions.get("job_card", "J001") == ETAG
+    now[0] = 30.0
+    assert versions.get("job_card", "J001") is None
+
+
+def test_disabled_cache_never_hits():
+    versions = ResourceVersions(ttl=0)
+    cache(versions)
+    assert versions.token("job_card", "J001") is None
+    assert versions.get("job_card", "J001") is None
+
+
+def test_write_on_one_worker_invalidates_the_others(tmp_path):
+    path = str(tmp_path / "versions.sqlite3")
+    worker_a = ResourceVersions(store=SqliteVersionStore(path))
+    worker_b = ResourceVersions(store=SqliteVersionStore(path))
+    cache(worker_a)
+    cache(worker_a, kind="customer_jobs", key="C001")
+    assert worker_a.get("job_card", "J001") == ETAG
+
+    worker_b.bump("job_card", "j001")
+    worker_b.bump("customer_jobs")
+    assert worker_a.get("job_card", "J001") is None
+    assert worker_a.get("customer_jobs", "C001") is None
+
+    cache(worker_a)
+    assert worker_a.get("job_card", "J001") == ETAG
+
+
+def test_repository_status_write_bumps_the_job_card(monkeypatch):
+    from app.application import db_service as db
+
+    versions = ResourceVersions()
+    monkeypatch.setattr(db, "_versions", versions)
+    cache(versions, kind=db.JOB_CARD, key="J001")
+    cache(versions, kind=db.CUSTOMER_JOBS, key="C001")
+
+    db.repository_write("update_job_card_status", {"job_card_id": "J001", "status": "approved"})
+    assert versions.get(db.JOB_CARD, "J001") is None
+    assert versions.get(db.CUSTOMER_JOBS, "C001") is None
+
+
+def test_repository_execute_notifies_write_listeners(monkeypatch):
+    from sqlalchemy import create_engine
+
+    from app.infrastructure import sql_repository
+
+    writes = []
+    monkeypatch.setattr(sql_repository, "_write_listeners", [])
+    sql_repository.on_write(lambda entity, params: writes.append((entity, params)))
+    repo = sql_repository.SqlRepository(create_engine("sqlite://"))
+    monkeypatch.setattr(repo, "_with_fallbacks", lambda entity, run: None)
+
+    repo.update_job_card_status("J001", "approved")
+    assert writes == [("update_job_card_status", {"job_card_id": "J001", "status": "approved"})]
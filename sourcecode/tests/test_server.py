@@ -0,0 +1,47 @@
+"""app.server worker policy: shared backends with several workers, one worker for the JSON fallback.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+
+from app.server import prepare_workers
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch):
+    for name in ("SESSION_BACKEND", "ETAG_VERSION_BACKEND", "USE_JSON_FALLBACK", "WEB_CONCURRENCY"):
+        monkeypatch.setenv(name, "")   # registers the original value, so what prepare_workers sets is undone
+        monkeypatch.delenv(name)
+    return monkeypatch
+
+
+def test_several_workers_default_to_shared_backends():
+    import os
+
+    assert prepare_workers(4) == 4
+    assert os.environ["SESSION_BACKEND"] == "sqlite"
+    assert os.environ["ETAG_VERSION_BACKEND"] == "sqlite"
+    assert os.environ["WEB_CONCURRENCY"] == "4"
+
+
+@pytest.mark.parametrize("name", ["SESSION_BACKEND", "ETAG_VERSION_BACKEND"])
+def test_explicit_memory_backend_is_refused(env, name):
+    env.setenv(name, "memory")
+    with pytest.raises(SystemExit, match=name):
+        prepare_workers(2)
+
+
+def test_single_worker_keeps_memory_backends():
+    import os
+
+    assert prepare_workers(1) == 1
+    assert "SESSION_BACKEND" not in os.environ and "ETAG_VERSION_BACKEND" not in os.environ
+
+
+def test_json_fallback_runs_one_worker(env):
+    import os
+
+    env.setenv("USE_JSON_FALLBACK", "true")
+    env.setenv("SESSION_BACKEND", "memory")
+    assert prepare_workers(8) == 1
+    assert os.environ["WEB_CONCURRENCY"] == "1"
@@ -0,0 +1,108 @@
+"""Login session stores: sliding expiry, LRU bound, and a SQLite store shared between workers.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import pytest
+
+from app.infrastructure.session_store import MemorySessionStore, SqliteSessionStore
+
+SESSION = {"token": "t1", "role": "advisor", "user_id": "A1", "name": "Asha"}
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path, clock):
+    def make(**kwargs):
+        if request.param == "memory":
+            return MemorySessionStore(clock=clock, **kwargs)
+        return SqliteSessionStore(str(tmp_path / "sessions.sqlite3"), clock=clock, touch_every=0, **kwargs)
+    return make
+
+
+def test_put_get_delete(make_store):
+    store = make_store()
+    store.put("t1", SESSION)
+    assert store.get("t1") == SESSION
+    store.delete("t1")
+    assert store.get("t1") is None
+    assert store.get("missing") is None
+
+
+def test_session_expires_after_ttl_of_idleness(make_store, clock):
+    store = make_store(ttl=60)
+    store.put("t1", SESSION)
+    clock.now += 59
+    assert store.get("t1") == SESSION
+    clock.now += 60
+    assert store.get("t1") is None
+
+
+def test_use_slides_the_expiry(make_store, clock):
+    store = make_store(ttl=60)
+    store.put("t1", SESSION)
+    for _ in range(5):
+        clock.now += 45
+        assert store.get("t1") == SESSION
+
+
+def test_least_recently_used_is_dropped_beyond_max_entries(make_store, clock):
+    store = make_store(max_entries=2)
+    store.put("t1", SESSION)
+    clock.now += 1
+    store.put("t2", SESSION)
+    clock.now += 1
+    store.get("t1")
+    clock.now += 1
+    store.put("t3", SESSION)
+    if isinstance(store, SqliteSessionStore):
+        store.prune()
+    assert store.get("t2") is None
+    assert store.get("t1") == SESSION and store.get("t3") == SESSION
+
+
+def test_memory_stats_count_evictions_and_expiry(clock):
+    store = MemorySessionStore(ttl=10, max_entries=1, clock=clock)
+    store.put("t1", SESSION)
+    store.put("t2", SESSION)
+    clock.now += 10
+    assert store.get("t2") is None
+    assert store.stats()["evicted"] == 1 and store.stats()["expired"] == 1
+
+
+def test_sqlite_sessions_are_shared_between_workers(tmp_path, clock):
+    path = str(tmp_path / "sessions.sqlite3")
+    worker_a = SqliteSessionStore(path, clock=clock)
+    worker_b = SqliteSessionStore(path, clock=clock)
+    worker_a.put("t1", SESSION)
+    assert worker_b.get("t1") == SESSION
+    worker_b.delete("t1")
+    assert worker_a.get("t1") is None
+
+
+def test_sqlite_touch_is_throttled(tmp_path, clock):
+    store = SqliteSessionStore(str(tmp_path / "sessions.sqlite3"), ttl=100, touch_every=30, clock=clock)
+    store.put("t1", SESSION)
+    clock.now += 20
+    assert store.get("t1") == SESSION   # not written back: expiry stays put + 100
+    clock.now += 81
+    assert store.get("t1") is None
+
+
+def test_sqlite_prunes_every_n_writes(tmp_path, clock):
+    store = SqliteSessionStore(str(tmp_path / "sessions.sqlite3"), max_entries=3, prune_every=5, clock=clock)
+    for n in range(5):
+        clock.now += 1
+        store.put(f"t{n}", SESSION)
+    assert store.stats()["sessions"] == 3
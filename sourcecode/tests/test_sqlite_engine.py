@@ -0,0 +1,144 @@
+"""T-SQL → SQLite translation (TOP, OUTPUT, MERGE, literals) and the stored timestamp shape.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.infrastructure.sqlite_engine import (
+    SqliteConnection, _bind, _open, split_statements, timestamp_text, translate,
+)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    c = SqliteConnection(_open(str(tmp_path / "engine.sqlite3")))
+    c.execute("CREATE TABLE Items (id TEXT PRIMARY KEY, status TEXT, n INTEGER, created_at TEXT)")
+    c.execute("INSERT INTO Items (id, status, n) VALUES ('a', 'open', 1), ('b', 'open', 2), ('c', 'done', 3)")
+    yield c
+    c.close()
+
+
+def rows(cur) -> list[dict]:
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+
+# ── translate ──
+
+@pytest.mark.parametrize("tsql, sqlite", [
+    ("SELECT TOP 5 id FROM Items ORDER BY id", "SELECT id FROM Items ORDER BY id LIMIT 5"),
+    ("SELECT DISTINCT TOP (2) status FROM Items", "SELECT DISTINCT status FROM Items LIMIT 2"),
+    ("SELECT * FROM (SELECT TOP 3 id FROM Items ORDER BY n DESC) t ORDER BY id",
+     "SELECT * FROM (SELECT id FROM Items ORDER BY n DESC LIMIT 3) t ORDER BY id"),
+    ("SELECT ISNULL(status, N'none') FROM dbo.Items WITH (NOLOCK)", "SELECT IFNULL(status, 'none') FROM Items"),
+    ("SELECT 'SELECT TOP 1 x' AS literal", "SELECT 'SELECT TOP 1 x' AS literal"),
+])
+def test_translate(tsql, sqlite):
+    assert " ".join(translate(tsql).split()) == sqlite
+
+
+def test_getdate_writes_the_stored_shape(conn):
+    cur = conn.cursor().execute("SELECT GETDATE() AS now")
+    assert len(cur.fetchone()[0]) == len("2026-02-12T12:15:00.120")
+
+
+def test_top_limits_rows(conn):
+    cur = conn.cursor().execute("SELECT TOP 2 id FROM Items ORDER BY id")
+    assert [r["id"] for r in rows(cur)] == ["a", "b"]
+
+
+def test_batch_hands_each_statement_its_params():
+    parts = split_statements("SET NOCOUNT ON; SELECT ? AS a; SELECT ?, ? AS b", (1, 2, 3))
+    assert [params for _, params in parts] == [(1,), (2, 3)]
+
+
+def test_batch_results_come_through_nextset(conn):
+    cur = conn.cursor().execute("SELECT id FROM Items WHERE id = ?; SELECT COUNT(*) FROM Items", ("b",))
+    assert cur.fetchall() == [("b",)]
+    assert cur.nextset() and cur.fetchall() == [(3,)]
+    assert not cur.nextset()
+
+
+# ── OUTPUT ──
+
+def test_insert_output_inserted(conn):
+    cur = conn.cursor().execute("INSERT INTO Items (id, status, n) OUTPUT INSERTED.id, INSERTED.n VALUES (?, ?, ?)",
+                                ("d", "open", 4))
+    assert rows(cur) == [{"id": "d", "n": 4}]
+
+
+def test_update_output_deleted_and_inserted(conn):
+    cur = conn.cursor().execute(
+        "UPDATE Items SET status = ? OUTPUT DELETED.status AS old_status, INSERTED.id, INSERTED.status "
+        "WHERE n <= ?", ("closed", 2)
+    )
+    assert sorted(rows(cur), key=lambda r: r["id"]) == [
+        {"old_status": "open", "id": "a", "status": "closed"},
+        {"old_status": "open", "id": "b", "status": "closed"},
+    ]
+
+
+def test_delete_output_deleted(conn):
+    cur = conn.cursor().execute("DELETE FROM Items OUTPUT DELETED.id WHERE status = ?", ("done",))
+    assert rows(cur) == [{"id": "c"}]
+
+
+def test_unsupported_output_item_is_refused(conn):
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.cursor().execute("INSERT INTO Items (id) OUTPUT 1 + 1 VALUES (?)", ("e",))
+
+
+# ── MERGE ──
+
+UPSERT = (
+    "MERGE Items AS target USING (SELECT ? AS id, ? AS n) AS source ON target.id = source.id "
+    "WHEN MATCHED THEN UPDATE SET n = source.n, status = ? "
+    "WHEN NOT MATCHED THEN INSERT (id, n, status) VALUES (source.id, source.n, ?) "
+    "OUTPUT INSERTED.id, INSERTED.n, INSERTED.status"
+)
+
+
+def test_merge_updates_a_matching_row(conn):
+    cur = conn.cursor().execute(UPSERT, ("a", 10, "updated", "inserted"))
+    assert rows(cur) == [{"id": "a", "n": 10, "status": "updated"}]
+
+
+def test_merge_inserts_when_nothing_matches(conn):
+    cur = conn.cursor().execute(UPSERT, ("z", 26, "updated", "inserted"))
+    assert rows(cur) == [{"id": "z", "n": 26, "status": "inserted"}]
+    assert conn.execute("SELECT COUNT(*) FROM Items").fetchone()[0] == 4
+
+
+def test_merge_inside_a_transaction_rolls_back(conn):
+    conn.autocommit = False
+    conn.cursor().execute(UPSERT, ("z", 26, "updated", "inserted"))
+    conn.rollback()
+    conn.autocommit = True
+    assert conn.execute("SELECT COUNT(*) FROM Items WHERE id = 'z'").fetchone()[0] == 0
+
+
+# ── timestamps ──
+
+def test_aware_timestamps_are_stored_in_utc():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    assert _bind("2026-02-12T17:45:00.120+05:30") == "2026-02-12T12:15:00.120"
+    assert _bind("2026-02-12T12:15:00.120Z") == "2026-02-12T12:15:00.120"
+    assert timestamp_text(datetime(2026, 2, 12, 17, 45, tzinfo=ist)) == "2026-02-12T12:15:00.000"
+
+
+def test_naive_timestamps_are_left_as_they_are():
+    assert _bind("2026-02-12 17:45") == "2026-02-12T17:45:00.000"
+    assert timestamp_text(datetime(2026, 2, 12, 17, 45)) == "2026-02-12T17:45:00.000"
+
+
+def test_bound_datetimes_sort_as_time(conn):
+    ist = timezone(timedelta(hours=5, minutes=30))
+    early = datetime(2026, 2, 12, 17, 0, tzinfo=ist)          # 11:30 UTC
+    late = datetime(2026, 2, 12, 12, 0, tzinfo=timezone.utc)  # 12:00 UTC
+    conn.cursor().execute("UPDATE Items SET created_at = ? WHERE id = 'a'", (late,))
+    conn.cursor().execute("UPDATE Items SET created_at = ? WHERE id = 'b'", (early.isoformat(),))
+    cur = conn.cursor().execute("SELECT id FROM Items WHERE created_at IS NOT NULL ORDER BY created_at")
+    assert [r[0] for r in cur.fetchall()] == ["b", "a"]
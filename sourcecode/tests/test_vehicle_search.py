@@ -0,0 +1,101 @@
+"""Vehicle trigram index: ranking, incremental updates, reloads and the LIKE fallback on a miss.
+
+    cd sourcecode && python -m pytest -q tests
+"""
+from app.application.vehicle_search import VehicleSearchIndex, normalize, trigrams
+
+VEHICLES = [
+    {"id": "V1", "registration_number": "KA-01-AB-1234", "vin": "1HGCM82633A004352"},
+    {"id": "V2", "registration_number": "KA01AB12", "vin": "KA01AB1234XYZ0001"},
+    {"id": "V3", "registration_number": "MH-12-KA-0001", "vin": "JH4KA8260MC000000"},
+    {"id": "V4", "registration_number": "DL-3C-1234", "vin": "WVWZZZ1JZ3W386752"},
+]
+
+
+def ids(rows) -> list[str]:
+    return [row["id"] for row in rows]
+
+
+def index(rows=VEHICLES, **kwargs) -> VehicleSearchIndex:
+    return VehicleSearchIndex(lambda: rows, **kwargs)
+
+
+def test_normalise_and_trigrams():
+    assert normalize(" ka-01 ab ") == "KA01AB"
+    assert trigrams("KA01") == {"KA0", "A01"}
+    assert trigrams("KA") == set()
+
+
+def test_exact_beats_prefix_beats_substring():
+    assert ids(index().search("KA01AB12")) == ["V2", "V1"]
+    assert ids(index().search("ka 01 ab 1234")) == ["V1", "V2"]
+
+
+def test_registration_beats_vin_at_the_same_level():
+    # V1's registration starts with KA01AB1234; V2's VIN does too.
+    assert ids(index().search("KA01AB1234")) == ["V1", "V2"]
+
+
+def test_short_queries_scan_every_entry():
+    assert set(ids(index().search("KA"))) == {"V1", "V2", "V3"}
+    assert index().search("--") == []
+
+
+def test_limit_and_no_match():
+    assert len(index().search("A", limit=2)) == 2
+    assert index().search("ZZZ999") == []
+
+
+def test_upsert_and_remove_keep_the_index_current():
+    idx = index(list(VEHICLES))
+    idx.search("KA")
+    idx.upsert({"id": "V4", "registration_number": "KA-99-ZZ-0001", "vin": ""})
+    assert ids(idx.search("KA99")) == ["V4"]
+    assert idx.search("DL3C") == []
+    idx.remove("V4")
+    assert idx.search("KA99") == []
+
+
+def test_failed_reload_defers_to_the_caller_and_keeps_the_entries():
+    now, rows = [0.0], [list(VEHICLES)]
+
+    def loader():
+        if rows[0] is None:
+            raise ConnectionError("down")
+        return rows[0]
+
+    idx = VehicleSearchIndex(loader, ttl=60.0, clock=lambda: now[0])
+    assert ids(idx.search("DL3C")) == ["V4"]
+    rows[0], now[0] = None, 61.0
+    assert idx.search("DL3C") is None   # the caller scans the database instead
+    assert idx.stats()["vehicles"] == 4 and idx.stats()["load_errors"] == 1
+    rows[0] = list(VEHICLES)
+    assert ids(idx.search("DL3C")) == ["V4"]
+
+
+def test_disabled_index_returns_none():
+    assert index(ttl=0).search("KA01") is None
+
+
+def test_miss_falls_back_to_like_and_indexes_the_hit(monkeypatch):
+    from app.application import db_service as db
+
+    added = {"id": "V9", "registration_number": "TN-09-XY-4321", "vin": "NEWVIN0000000001",
+             "customer_id": "C1", "customer_name": "Ann"}
+    idx = index(list(VEHICLES))
+    queries = []
+
+    def sql_rows(query, params):
+        queries.append(params)
+        return [added] if "TN" in params[0] else []
+
+    monkeypatch.setattr(db, "_vehicle_index", idx)
+    monkeypatch.setattr(db, "_db_available", lambda: True)
+    monkeypatch.setattr(db, "_sql_rows", sql_rows)
+    monkeypatch.setattr(db, "_vehicle_hit", lambda row: dict(row))
+
+    assert ids(db.search_vehicles("KA01AB12")) == ["V2", "V1"] and not queries
+    assert ids(db.search_vehicles("TN-09")) == ["V9"]
+    assert queries == [("%TN-09%", "%TN-09%")]
+    assert ids(db.search_vehicles("TN09XY")) == ["V9"] and len(queries) == 1
+    assert db.search_vehicles("  ") == [] and len(queries) == 1